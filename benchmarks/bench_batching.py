@@ -0,0 +1,105 @@
+# Ame-Artificielle/benchmarks/bench_batching.py
+"""
+Async react() through a MicroBatcher: throughput and tail latency vs
+max_batch, against the stand-in generation server (HTTP, default) or the
+in-process LatencyBatchBackend (--transport inproc).
+
+Batch latency is --base-latency + --per-item-latency * batch size, so
+batching amortizes the base cost: throughput should grow with max_batch up
+to about max_concurrent_batches * max_batch / batch latency. --max-queue
+below --callers makes the batcher shed (counted, not retried).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_batching --requests 4000 --callers 512 --batch 1 4 16 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from src.batching import HttpBatchBackend, LatencyBatchBackend, MicroBatcher, serve_standin
+from src.engine import SoulState
+from src.engine_async import AsyncArtificialSoulEngine, EngineOverloaded
+from src.metrics import LatencyHistogram
+from src.ontology import digit_to_traits
+
+STIMULI = [
+    "Pourquoi penses-tu cela ?",
+    "Danger ! Cours maintenant !",
+    "Bonjour, comment vas-tu ?",
+    "Explique-moi la logique de ce raisonnement.",
+]
+
+
+async def run(args: argparse.Namespace, max_batch: int, url: str) -> None:
+    backend = (
+        HttpBatchBackend(url, max_connections=args.concurrent_batches)
+        if url
+        else LatencyBatchBackend(args.base_latency, args.per_item_latency)
+    )
+    batcher = MicroBatcher(
+        backend,
+        max_batch=max_batch,
+        max_wait=args.max_wait,
+        max_queue=args.max_queue,
+        max_concurrent_batches=args.concurrent_batches,
+    )
+    engine = AsyncArtificialSoulEngine(backend=batcher, max_in_flight=args.callers, max_queue=args.requests)
+    states = [SoulState(trait_vector=dict(digit_to_traits(i % 10)), digit_archetype=i % 10) for i in range(args.requests)]
+    hist = LatencyHistogram()
+    shed = 0
+
+    async def one(i: int) -> None:
+        nonlocal shed
+        t0 = time.perf_counter_ns()
+        try:
+            await engine.react(state=states[i], stimulus=STIMULI[i % len(STIMULI)])
+        except EngineOverloaded:
+            shed += 1
+            return
+        hist.record(time.perf_counter_ns() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - t0
+    await batcher.close()
+
+    stats = batcher.stats()
+    print(
+        f"max_batch={max_batch:>4}  {hist.count / elapsed:9,.0f} req/s"
+        f"  p50 {hist.percentile(0.5) / 1e6:7.1f} ms  p99 {hist.percentile(0.99) / 1e6:7.1f} ms"
+        f"  mean batch {stats.mean_batch_size:5.1f}  shed {shed}"
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--requests", type=int, default=4_000)
+    ap.add_argument("--callers", type=int, default=512, help="concurrent react() calls (engine max_in_flight)")
+    ap.add_argument("--batch", type=int, nargs="+", default=[1, 4, 16, 64])
+    ap.add_argument("--max-wait", type=float, default=0.005)
+    ap.add_argument("--max-queue", type=int, default=4_096)
+    ap.add_argument("--concurrent-batches", type=int, default=4)
+    ap.add_argument("--base-latency", type=float, default=0.02)
+    ap.add_argument("--per-item-latency", type=float, default=0.0005)
+    ap.add_argument("--transport", default="http", choices=["http", "inproc"])
+    args = ap.parse_args()
+
+    server = None
+    url = ""
+    if args.transport == "http":
+        server = serve_standin(port=0, base_latency=args.base_latency, per_item_latency=args.per_item_latency)
+        url = f"http://127.0.0.1:{server.server_address[1]}/generate"
+    try:
+        for n in args.batch:
+            asyncio.run(run(args, n, url))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
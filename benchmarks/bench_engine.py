@@ -0,0 +1,76 @@
+# Ame-Artificielle/benchmarks/bench_engine.py
+"""
+Reaction throughput: ArtificialSoulEngine.react() per request vs one
+react_many() call over the same batch.
+
+Each batch spreads its requests over --sessions states (so states repeat, as
+in a gateway batch) with a handful of distinct slider sets.
+
+--trace-level sets EngineConfig.trace_level ("off" | "summary" | "full").
+
+Usage (from the repo root):
+    python -m benchmarks.bench_engine --batch 100 1000 10000 --trace-level off
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import time
+
+from src.engine import ArtificialSoulEngine, EngineConfig, SoulState
+from src.ontology import digit_to_traits
+
+STIMULI = [
+    "Pourquoi penses-tu cela ?",
+    "Danger ! Cours maintenant !",
+    "Bonjour, comment vas-tu ?",
+    "Explique-moi la logique de ce raisonnement.",
+    "URGENT!!! attaque",
+]
+SLIDERS = [None, {"tone": 0.3}, {"humor": 0.8}, {"complexity": 0.9}]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--batch", type=int, nargs="+", default=[100, 1_000, 10_000])
+    ap.add_argument("--sessions", type=int, default=1_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--trace-level", default="full", choices=["off", "summary", "full"])
+    args = ap.parse_args()
+
+    engine = ArtificialSoulEngine(config=EngineConfig(trace_level=args.trace_level))
+    for n in args.batch:
+        rng = random.Random(n)
+        states = [
+            SoulState(trait_vector=dict(digit_to_traits(d)), digit_archetype=d)
+            for d in (rng.randrange(10) for _ in range(min(n, args.sessions)))
+        ]
+        picks = [
+            (rng.randrange(len(states)), rng.choice(STIMULI), rng.choice(SLIDERS), None)
+            for _ in range(n)
+        ]
+
+        scalar_s = batch_s = float("inf")
+        for _ in range(args.repeat):
+            run = copy.deepcopy(states)
+            t0 = time.perf_counter()
+            for i, stim, sl, ctx in picks:
+                engine.react(state=run[i], stimulus=stim, sliders=sl, context=ctx)
+            scalar_s = min(scalar_s, time.perf_counter() - t0)
+
+            run = copy.deepcopy(states)
+            requests = [(run[i], stim, sl, ctx) for i, stim, sl, ctx in picks]
+            t0 = time.perf_counter()
+            engine.react_many(requests)
+            batch_s = min(batch_s, time.perf_counter() - t0)
+
+        print(
+            f"batch={n:>7,}  react {n / scalar_s:10,.0f} req/s"
+            f"  react_many {n / batch_s:10,.0f} req/s  speedup {scalar_s / batch_s:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
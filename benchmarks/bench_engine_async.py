@@ -0,0 +1,50 @@
+# Ame-Artificielle/benchmarks/bench_engine_async.py
+"""
+Async react() throughput vs max_in_flight, with LatencyBackend standing in
+for a remote generation call.
+
+Every request targets its own session, so only the engine's concurrency
+limit bounds overlap: throughput should grow ~linearly with max_in_flight
+(up to --requests / latency), not stay at the serialized 1 / latency.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_engine_async --latency 0.02 --concurrency 1 4 16 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from src.engine import SoulState
+from src.engine_async import AsyncArtificialSoulEngine, LatencyBackend
+from src.ontology import digit_to_traits
+
+
+async def run(requests: int, concurrency: int, latency: float, jitter: float) -> float:
+    backend = LatencyBackend(latency, jitter=jitter, seed=concurrency)
+    engine = AsyncArtificialSoulEngine(backend=backend, max_in_flight=concurrency, max_queue=requests)
+    states = [SoulState(trait_vector=dict(digit_to_traits(i % 10)), digit_archetype=i % 10) for i in range(requests)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(engine.react(state=st, stimulus="Pourquoi ?") for st in states))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--requests", type=int, default=256)
+    ap.add_argument("--latency", type=float, default=0.02)
+    ap.add_argument("--jitter", type=float, default=0.0)
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = ap.parse_args()
+
+    serial = 1.0 / args.latency
+    for c in args.concurrency:
+        elapsed = asyncio.run(run(args.requests, c, args.latency, args.jitter))
+        rate = args.requests / elapsed
+        print(f"max_in_flight={c:>4}  {rate:9,.0f} req/s  ({rate / serial:5.1f}x serialized)")
+
+
+if __name__ == "__main__":
+    main()
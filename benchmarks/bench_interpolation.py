@@ -0,0 +1,94 @@
+# Ame-Artificielle/benchmarks/bench_interpolation.py
+"""
+Interpolation math: dict path vs schema-bound TraitVector path (with a
+reused output buffer), on the canonical trait schema; then precomputed
+AxisTable lookups vs recomputing interpolate_axis().
+
+Reports ns per call (timeit) and bytes allocated per call (tracemalloc
+peak over one call: key-set union, new dict, temporaries).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_interpolation --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+import tracemalloc
+
+from src.interpolation import (
+    add_scaled,
+    add_scaled_array,
+    blend_vectors,
+    compile_axis_table,
+    blend_vectors_array,
+    interpolate_axis,
+    interpolate_axis_array,
+    normalize_l1,
+    normalize_l1_array,
+)
+from src.traits import TraitVector, load_traits_schema
+
+
+def allocated_bytes(fn) -> int:
+    """Peak bytes allocated during one call."""
+    fn()  # warm up caches / free lists
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - before
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--number", type=int, default=20_000)
+    args = ap.parse_args()
+
+    schema, _ = load_traits_schema()
+    rng = random.Random(3)
+    a, b, c = ({k: rng.uniform(-2, 2) for k in schema.names} for _ in range(3))
+    va, vb, vc = (TraitVector.from_mapping(schema, x) for x in (a, b, c))
+    out = TraitVector(schema)
+
+    cases = [
+        ("blend_vectors", lambda: blend_vectors(a, b, 0.37), lambda: blend_vectors_array(va, vb, 0.37, out=out)),
+        ("add_scaled", lambda: add_scaled(a, c, 0.25), lambda: add_scaled_array(va, vc, 0.25, out=out)),
+        ("normalize_l1", lambda: normalize_l1(a), lambda: normalize_l1_array(va, out=out)),
+        (
+            "interpolate_axis",
+            lambda: interpolate_axis(axis_digit=4, intellect=a, instinct=b, mid_overlays={4: c}, normalize=True),
+            lambda: interpolate_axis_array(axis_digit=4, intellect=va, instinct=vb, mid_overlays={4: vc},
+                                           normalize=True, out=out),
+        ),
+    ]
+
+    print(f"traits={len(schema)}")
+    print(f"{'function':18s} {'dict ns':>9s} {'array ns':>9s} {'speedup':>8s}   {'dict B':>7s} {'array B':>7s}")
+    for name, dict_fn, array_fn in cases:
+        dict_ns = timeit.timeit(dict_fn, number=args.number) / args.number * 1e9
+        array_ns = timeit.timeit(array_fn, number=args.number) / args.number * 1e9
+        print(f"{name:18s} {dict_ns:9.0f} {array_ns:9.0f} {dict_ns / array_ns:7.1f}x   "
+              f"{allocated_bytes(dict_fn):7d} {allocated_bytes(array_fn):7d}")
+
+    templates = dict(intellect=a, instinct=b, mid_overlays={4: c}, normalize=True)
+    table = compile_axis_table(**templates)
+    array_table = compile_axis_table(intellect=va, instinct=vb, mid_overlays={4: vc}, normalize=True)
+    lookups = [
+        ("interpolate_axis (recompute)", lambda: interpolate_axis(axis_digit=4, **templates)),
+        ("compile_axis_table (cache hit)", lambda: compile_axis_table(**templates)),
+        ("AxisTable.row(4)", lambda: table.row(4)),
+        ("AxisTable.at(6.4)", lambda: table.at(6.4)),
+        ("AxisTable.at_array(6.4, out=)", lambda: array_table.at_array(6.4, out=out)),
+    ]
+    print()
+    for name, fn in lookups:
+        ns = timeit.timeit(fn, number=args.number) / args.number * 1e9
+        print(f"{name:32s} {ns:9.0f} ns  {allocated_bytes(fn):7d} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Ame-Artificielle/benchmarks/bench_metrics.py
+"""
+Stress run with EngineConfig.metrics_enabled: builds states from --identities
+distinct identities and reacts --requests times from --threads threads, then
+prints the per-stage latency breakdown (p50/p95/p99) of the last run and the
+throughput cost of the instrumentation versus an uninstrumented engine (best
+of --repeat interleaved runs each).
+
+--prom writes the Prometheus text export to a file.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_metrics --requests 100000 --threads 4 --prom /tmp/ame.prom
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+
+from src.engine import ArtificialSoulEngine, EngineConfig
+from src.metrics import write_prometheus
+
+STIMULI = [
+    "Pourquoi penses-tu cela ?",
+    "Danger ! Cours maintenant !",
+    "Bonjour, comment vas-tu ?",
+    "Explique-moi la logique de ce raisonnement.",
+    "URGENT!!! attaque",
+]
+SLIDERS = [None, {"tone": 0.3}, {"humor": 0.8}, {"complexity": 0.9}]
+STAGE_ORDER = [
+    "numerology", "ontology", "profile", "state", "build_state",
+    "interpolation", "composition", "ethics", "commit", "react",
+]
+
+
+def _name(i: int) -> str:
+    """Distinct letters-only name per i (numerology ignores digits)."""
+    letters = []
+    while True:
+        i, r = divmod(i, 26)
+        letters.append(chr(97 + r))
+        if not i:
+            return "user " + "".join(letters)
+
+
+def run(engine: ArtificialSoulEngine, args: argparse.Namespace) -> float:
+    """Requests per second over all threads."""
+    per_thread = args.requests // args.threads
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        states = [
+            engine.build_state_from_identity(
+                identity={"name": _name(rng.randrange(args.identities)), "dob": "1990-07-14"},
+                compact=True,
+            )
+            for _ in range(64)
+        ]
+        for _ in range(per_thread):
+            engine.react(state=rng.choice(states), stimulus=rng.choice(STIMULI), sliders=rng.choice(SLIDERS))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return per_thread * args.threads / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--requests", type=int, default=100_000)
+    ap.add_argument("--threads", type=int, default=4)
+    ap.add_argument("--identities", type=int, default=10_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--prom", default=None, help="write the Prometheus export here")
+    args = ap.parse_args()
+
+    plain_rps = rps = 0.0
+    for _ in range(args.repeat):  # interleaved, best of each
+        plain_rps = max(plain_rps, run(ArtificialSoulEngine(config=EngineConfig(trace_level="off")), args))
+        engine = ArtificialSoulEngine(config=EngineConfig(trace_level="off", metrics_enabled=True))
+        rps = max(rps, run(engine, args))
+
+    stats = engine.metrics()
+    print(f"{'stage':<14}{'count':>10}{'mean µs':>10}{'p50 µs':>10}{'p95 µs':>10}{'p99 µs':>10}{'max µs':>10}")
+    for stage in sorted(stats, key=lambda s: STAGE_ORDER.index(s) if s in STAGE_ORDER else len(STAGE_ORDER)):
+        s = stats[stage]
+        print(
+            f"{stage:<14}{s.count:>10,}{s.mean_ms * 1e3:>10.1f}{s.p50_ms * 1e3:>10.1f}"
+            f"{s.p95_ms * 1e3:>10.1f}{s.p99_ms * 1e3:>10.1f}{s.max_ms * 1e3:>10.1f}"
+        )
+    print(f"react: metrics off {plain_rps:,.0f} req/s  on {rps:,.0f} req/s  overhead {plain_rps / rps - 1:+.1%}")
+
+    if args.prom:
+        print(f"wrote {write_prometheus(engine.stage_metrics, args.prom)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Ame-Artificielle/benchmarks/bench_numerology.py
+"""
+Per-identity cost of build_signature() vs build_signature_batch(),
+and of life_path_number() with and without the precomputed CalendarTable.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_numerology --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from src.numerology import (
+    NumerologyConfig,
+    build_signature,
+    build_signature_batch,
+    get_calendar_table,
+    life_path_number,
+)
+
+_FIRST = ["Jean", "Marie", "Élise", "François", "Luc", "Anne-Sophie", "Zoë", "Noah", "Léa", "Yves"]
+_LAST = ["Tremblay", "Gagnon", "Roy", "Côté", "Bouchard", "Gauthier", "Morin", "O'Connor", "Lavoie"]
+
+
+def make_cohort(rows: int, seed: int = 7) -> Tuple[List[str], List[str]]:
+    rng = random.Random(seed)
+    names = [f"{rng.choice(_FIRST)} {rng.choice(_LAST)}" for _ in range(rows)]
+    dobs = [f"{rng.randint(1900, 2020):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for _ in range(rows)]
+    return names, dobs
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    cfg = NumerologyConfig()
+    names, dobs = make_cohort(args.rows)
+
+    t0 = time.perf_counter()
+    for name, dob in zip(names, dobs):
+        build_signature(name=name, dob=dob, cfg=cfg)
+    scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    build_signature_batch(names, dobs, cfg=cfg)
+    batch = time.perf_counter() - t0
+
+    print(f"rows={args.rows}")
+    print(f"scalar  build_signature       : {scalar:8.2f} s  {scalar / args.rows * 1e6:7.2f} us/identity")
+    print(f"batch   build_signature_batch : {batch:8.2f} s  {batch / args.rows * 1e6:7.2f} us/identity")
+    print(f"speedup                       : {scalar / batch:8.2f}x")
+
+    calendar = get_calendar_table(cfg)
+    t0 = time.perf_counter()
+    for dob in dobs:
+        life_path_number(dob, cfg=cfg)
+    plain = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for dob in dobs:
+        life_path_number(dob, cfg=cfg, calendar=calendar)
+    table = time.perf_counter() - t0
+
+    print(f"life_path_number              : {plain / args.rows * 1e6:7.2f} us/date")
+    print(f"life_path_number (calendar)   : {table / args.rows * 1e6:7.2f} us/date")
+
+
+if __name__ == "__main__":
+    main()
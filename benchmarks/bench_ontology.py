@@ -0,0 +1,89 @@
+# Ame-Artificielle/benchmarks/bench_ontology.py
+"""
+Cold-start cost of PiOntology: JSON parse path vs compiled snapshot vs
+lazy streaming loader (LazyPiOntology).
+
+Each measurement runs in a fresh interpreter (import + construction), on
+pi_ontology.json replicated --scale times into a temporary file; peak RSS
+(VmHWM, Linux) of that interpreter is reported alongside.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_ontology --scale 100 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+from src.ontology import PiOntology
+
+_CHILD = """
+import sys, time
+t0 = time.perf_counter()
+from src.ontology import PiOntology
+from src.ontology_lazy import LazyPiOntology
+if sys.argv[2] == "lazy":
+    LazyPiOntology(sys.argv[1])
+else:
+    PiOntology(sys.argv[1], snapshot=(sys.argv[2] == "snap"))
+seconds = time.perf_counter() - t0
+with open("/proc/self/status") as f:
+    hwm = next(line.split()[1] for line in f if line.startswith("VmHWM:"))
+print(seconds, hwm)
+"""
+
+
+def make_scaled_source(src: Path, dst: Path, scale: int, *, distinct: bool = False) -> int:
+    """Replicate the ontology `scale` times; distinct=True tags each copy's texts so none repeat."""
+    base = PiOntology(src)._entries
+    rows = []
+    for k in range(scale):
+        for e in base:
+            analysis = {t: f"{v} (copie {k})" for t, v in e.analysis.items()} if distinct else e.analysis
+            rows.append({"index": k * len(base) + e.index, "digit": e.digit, "analysis": analysis})
+    dst.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    return len(rows)
+
+
+def cold_start(path: Path, mode: str) -> Tuple[float, int]:
+    """(seconds, peak RSS in kB) for one fresh interpreter."""
+    out = subprocess.run([sys.executable, "-c", _CHILD, str(path), mode], check=True, capture_output=True, text=True)
+    seconds, rss = out.stdout.split()
+    return float(seconds), int(rss)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--source", default="pi_ontology.json")
+    ap.add_argument("--scale", type=int, default=100)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pi_ontology.json"
+        n = make_scaled_source(Path(args.source), path, args.scale)
+        size_mb = path.stat().st_size / 1e6
+
+        t0 = time.perf_counter()
+        PiOntology(path, snapshot=True)  # compile once
+        compile_s = time.perf_counter() - t0
+
+        runs = {mode: [cold_start(path, mode) for _ in range(args.runs)] for mode in ("json", "snap", "lazy")}
+
+    print(f"entries={n} json={size_mb:.1f} MB  snapshot compile={compile_s * 1e3:.1f} ms")
+    for mode, label in (("json", "json path"), ("snap", "snapshot path"), ("lazy", "lazy path")):
+        seconds = statistics.median(r[0] for r in runs[mode])
+        rss = statistics.median(r[1] for r in runs[mode])
+        print(f"{label:13s} : median {seconds * 1e3:8.1f} ms  peak rss {rss / 1024:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
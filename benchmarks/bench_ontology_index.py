@@ -0,0 +1,76 @@
+# Ame-Artificielle/benchmarks/bench_ontology_index.py
+"""
+Query latency of OntologyIndex on pi_ontology.json replicated --scale times.
+
+Target: p99 below 1 ms per query for terms, phrases, prefixes and
+filtered queries at --scale 100. Replicated texts collapse into shared
+documents; --distinct tags every copy so the index really holds
+scale x as many documents.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_ontology_index --scale 100 [--distinct]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_ontology import make_scaled_source
+from src.ontology import PiOntology
+from src.ontology_index import OntologyIndex
+
+QUERIES = [
+    ("term", "jupiter", {}),
+    ("term", "équilibre", {}),
+    ("or", "équilibre Jupiter", {}),
+    ("phrase", '"séphira binah"', {}),
+    ("prefix", "harmon*", {}),
+    ("tradition", "jupiter", {"traditions": ["Numérologie hindoue"]}),
+    ("inverted", "sagesse", {"digits": [3], "inverted": True}),
+]
+TARGET_MS = 1.0
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--source", default="pi_ontology.json")
+    ap.add_argument("--scale", type=int, default=100)
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--distinct", action="store_true")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pi_ontology.json"
+        make_scaled_source(Path(args.source), path, args.scale, distinct=args.distinct)
+        onto = PiOntology(path)
+
+    t0 = time.perf_counter()
+    index = OntologyIndex(onto)
+    build = time.perf_counter() - t0
+    print(f"docs={len(index)} build={build:.2f} s")
+
+    for label, query, kwargs in QUERIES:
+        t0 = time.perf_counter_ns()
+        index.search(query, **kwargs)  # first call fills the per-term weight cache
+        cold = (time.perf_counter_ns() - t0) / 1e6
+        samples = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter_ns()
+            hits = index.search(query, **kwargs)
+            samples.append((time.perf_counter_ns() - t0) / 1e6)
+        p50, p99 = percentile(samples, 0.50), percentile(samples, 0.99)
+        verdict = "ok" if p99 < TARGET_MS else "over target"
+        print(f"{label:10s} {query!r:28s} hits={len(hits):3d}  cold={cold:.3f} ms"
+              f"  p50={p50:.3f} ms  p99={p99:.3f} ms  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Ame-Artificielle/benchmarks/bench_ontology_shared.py
+"""
+Per-worker resident memory: every worker loading the JSON ontology vs
+workers attached to one SharedOntologySegment.
+
+Each worker is a fresh interpreter that imports the ontology modules, builds
+its ontology (JSON path or shared attach), touches the read API for every
+digit, then reports Private (Private_Clean + Private_Dirty) and Pss from
+/proc/self/smaps_rollup. The "baseline" worker only imports, so the deltas
+are what the ontology itself costs per worker. Linux only.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_ontology_shared --scale 100 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_ontology import make_scaled_source
+from src.ontology import PiOntology
+from src.ontology_shared import SharedOntologySegment
+
+_CHILD = """
+import json, sys
+from src.ontology import PiOntology
+from src.ontology_shared import SharedPiOntology
+mode, arg = sys.argv[1], sys.argv[2]
+onto = None
+if mode == "json":
+    onto = PiOntology(arg)
+elif mode == "shared":
+    onto = SharedPiOntology(arg)
+if onto is not None:
+    for d in range(10):
+        onto.get_analysis(d)
+        onto.get_tradition_text(d, "Tradition pythagoricienne")
+        onto.summarize_digit(d)
+kb = {}
+with open("/proc/self/smaps_rollup") as f:
+    for line in f:
+        parts = line.split()
+        if len(parts) == 3 and parts[2] == "kB":
+            kb[parts[0].rstrip(":")] = int(parts[1])
+print(json.dumps({"private": kb["Private_Clean"] + kb["Private_Dirty"], "pss": kb["Pss"], "rss": kb["Rss"]}))
+"""
+
+
+def worker_memory(mode: str, arg: str) -> dict:
+    out = subprocess.run([sys.executable, "-c", _CHILD, mode, arg], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--source", default="pi_ontology.json")
+    ap.add_argument("--scale", type=int, default=100)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--distinct", action="store_true", help="make every replicated text unique")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pi_ontology.json"
+        n = make_scaled_source(Path(args.source), path, args.scale, distinct=args.distinct)
+
+        with SharedOntologySegment(PiOntology(path)) as segment:
+            runs = {
+                "baseline": [worker_memory("none", "") for _ in range(args.workers)],
+                "json": [worker_memory("json", str(path)) for _ in range(args.workers)],
+                "shared": [worker_memory("shared", segment.name) for _ in range(args.workers)],
+            }
+            seg_kb = segment.size / 1024
+
+    base = statistics.median(r["private"] for r in runs["baseline"])
+    print(f"entries={n} segment={seg_kb:,.0f} kB workers={args.workers}")
+    for mode in ("json", "shared"):
+        private = statistics.median(r["private"] for r in runs[mode])
+        pss = statistics.median(r["pss"] for r in runs[mode])
+        print(f"{mode:7s}: private {private:8,.0f} kB (+{private - base:7,.0f} over baseline)  pss {pss:8,.0f} kB")
+    saved = statistics.median(r["private"] for r in runs["json"]) - statistics.median(r["private"] for r in runs["shared"])
+    print(f"private memory saved per worker: {saved:,.0f} kB")
+
+
+if __name__ == "__main__":
+    main()
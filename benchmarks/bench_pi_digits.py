@@ -0,0 +1,91 @@
+# Ame-Artificielle/benchmarks/bench_pi_digits.py
+"""
+PiDigitStore: packing, k-gram index build, random access and find()
+latency (k-gram index vs chunked scan).
+
+Digits come from --source (a digit text dump such as a 10^8-digit pi
+file), from compute_pi_digits() with --pi N, or otherwise from N uniform
+random digits (search cost does not depend on the digits being pi's).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_pi_digits --digits 10000000 [--k 6]
+    python -m benchmarks.bench_pi_digits --source pi-100m.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_ontology_index import percentile
+from src.pi_digits import PiDigitStore, compute_pi_digits, import_digit_text, write_digit_store
+
+
+def random_digits(n: int, chunk: int = 1 << 20):
+    rng = random.Random(314)
+    for start in range(0, n, chunk):
+        yield "".join(rng.choices("0123456789", k=min(chunk, n - start)))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--digits", type=int, default=10_000_000)
+    ap.add_argument("--pi", action="store_true", help="compute the digits of pi (slow beyond ~10^5)")
+    ap.add_argument("--source", default=None)
+    ap.add_argument("--k", type=int, default=6)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pi.bin"
+        t0 = time.perf_counter()
+        if args.source:
+            n = import_digit_text(args.source, path)
+        elif args.pi:
+            n = write_digit_store(path, [compute_pi_digits(args.digits)])
+        else:
+            n = write_digit_store(path, random_digits(args.digits))
+        pack_s = time.perf_counter() - t0
+
+        with PiDigitStore(path) as store:
+            rng = random.Random(1)
+            t0 = time.perf_counter()
+            for _ in range(100_000):
+                store.digit_at(rng.randrange(n))
+            access_ns = (time.perf_counter() - t0) / 100_000 * 1e9
+
+            lengths = (3, args.k, args.k + 2, 10)
+            queries = {m: [store.digits(p, p + m) for p in (rng.randrange(n - m) for _ in range(args.queries))]
+                       for m in lengths}
+
+            t0 = time.perf_counter()
+            scan_ms = statistics.median(_time(store.find, q) for q in queries[10][:5])
+            scan_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            store.build_index(args.k)
+            index_s = time.perf_counter() - t0
+
+            print(f"digits={n:,} store={path.stat().st_size / 1e6:.1f} MB (packed in {pack_s:.1f} s) "
+                  f"kgram={store.kgram_path.stat().st_size / 1e6:.1f} MB (built in {index_s:.1f} s)")
+            print(f"digit_at        : {access_ns:8.0f} ns")
+            print(f"find scan   m=10: {scan_ms:8.2f} ms median ({scan_s:.1f} s for 5 queries)")
+            for m in lengths:
+                runs = [_time(store.find, q) for q in queries[m]]
+                hits = statistics.mean(len(store.find(q)) for q in queries[m][:20])
+                print(f"find k-gram m={m:<2d}: p50 {percentile(runs, 0.5):8.3f} ms  p99 {percentile(runs, 0.99):8.3f} ms"
+                      f"  (~{hits:,.0f} hits)")
+
+
+def _time(fn, arg) -> float:
+    t0 = time.perf_counter()
+    fn(arg)
+    return (time.perf_counter() - t0) * 1e3
+
+
+if __name__ == "__main__":
+    main()
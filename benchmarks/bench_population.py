@@ -0,0 +1,58 @@
+# Ame-Artificielle/benchmarks/bench_population.py
+"""
+Tick throughput: scalar update_dynamics() per SoulState vs
+update_dynamics_batch() over a SoulPopulation.
+
+Stimulus features are drawn once per tick (the batch path takes arrays of
+features; the scalar path gets the same values through `context`).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_population --agents 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from array import array
+
+from src.interpolation import update_dynamics
+from src.population import SoulPopulation, update_dynamics_batch
+
+SCALAR_LIMIT = 100_000  # the scalar path is only timed up to this size
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--agents", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--ticks", type=int, default=3)
+    args = ap.parse_args()
+
+    for m in args.agents:
+        rng = random.Random(m)
+        pop = SoulPopulation.from_digits(array("b", (rng.randrange(10) for _ in range(m))))
+        pull = array("d", (rng.uniform(-1, 1) for _ in range(m)))
+        intensity = array("d", (rng.random() for _ in range(m)))
+
+        t0 = time.perf_counter()
+        for _ in range(args.ticks):
+            update_dynamics_batch(pop, pull, intensity)
+        batch_s = (time.perf_counter() - t0) / args.ticks
+
+        line = f"agents={m:>9,}  batch {batch_s * 1e3:9.1f} ms/tick ({m / batch_s:12,.0f} agents/s)"
+        if m <= SCALAR_LIMIT:
+            states = pop.to_states()
+            t0 = time.perf_counter()
+            for st, p, s in zip(states, pull, intensity):
+                st.axis_position, st.mood, _ = update_dynamics(
+                    axis_position=st.axis_position, trait_vector=st.trait_vector,
+                    stimulus="", context={"pull": p, "intensity": s},
+                )
+            scalar_s = time.perf_counter() - t0
+            line += f"  scalar {scalar_s * 1e3:9.1f} ms/tick  speedup {scalar_s / batch_s:5.1f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
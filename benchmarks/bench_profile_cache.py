@@ -0,0 +1,62 @@
+# Ame-Artificielle/benchmarks/bench_profile_cache.py
+"""
+Session creation rate: build_state_from_identity() with and without the
+identity -> profile cache.
+
+--sessions states are built from --identities distinct identities (drawn
+uniformly, spelled in varying case so only the canonical key matches).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_profile_cache --sessions 200000 --identities 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from src.engine import ArtificialSoulEngine, EngineConfig
+
+FIRST = ["Jean", "Élise", "Marie", "Noé", "Zoé", "Ana", "Hugo", "Léa", "Omar", "Inès"]
+LAST = ["Tremblay", "Gagnon", "Roy", "Côté", "Bouchard", "Gauthier", "Morin", "Lavoie"]
+
+
+def identities(n: int, rng: random.Random):
+    return [
+        {
+            "name": f"{rng.choice(FIRST)}-{rng.choice(FIRST)} {rng.choice(LAST)}",
+            "dob": f"{rng.randint(1940, 2010)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        }
+        for _ in range(n)
+    ]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sessions", type=int, default=200_000)
+    ap.add_argument("--identities", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    ap.add_argument("--cache-size", type=int, default=4096)
+    args = ap.parse_args()
+
+    for u in args.identities:
+        rng = random.Random(u)
+        pool = identities(u, rng)
+        picks = [dict(p, name=p["name"].upper() if rng.random() < 0.5 else p["name"]) for p in
+                 (rng.choice(pool) for _ in range(args.sessions))]
+
+        line = f"identities={u:>8,}"
+        for label, size in (("uncached", 0), ("cached", args.cache_size)):
+            engine = ArtificialSoulEngine(config=EngineConfig(profile_cache_size=size))
+            t0 = time.perf_counter()
+            for identity in picks:
+                engine.build_state_from_identity(identity=identity)
+            rate = len(picks) / (time.perf_counter() - t0)
+            line += f"  {label} {rate:9,.0f} sessions/s"
+            if engine.profiles is not None:
+                line += f" (hit rate {engine.profiles.stats().hit_rate:.2f})"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
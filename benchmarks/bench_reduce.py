@@ -0,0 +1,59 @@
+# Ame-Artificielle/benchmarks/bench_reduce.py
+"""
+Micro-benchmark: reduce_number() vs the original string-based loop.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_reduce --n 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from src.numerology import reduce_number, reduce_numbers
+
+
+def reference_reduce(n: int, keep_master_numbers=(11, 22, 33)) -> int:
+    # The pre-closed-form implementation: rebuilds the set, str() per step.
+    masters = set(keep_master_numbers)
+    x = abs(n)
+    while True:
+        if x in masters:
+            return x
+        if x < 10:
+            return x
+        x = sum(int(ch) for ch in str(x))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    rng = random.Random(3)
+    small = [rng.randint(1, 80) for _ in range(args.n)]  # typical name/date totals
+    large = [rng.randint(1, 10**12) for _ in range(args.n)]
+
+    for label, values in (("totals 1..80", small), ("ints up to 1e12", large)):
+        t0 = time.perf_counter()
+        for v in values:
+            reference_reduce(v)
+        ref = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for v in values:
+            reduce_number(v)
+        new = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        reduce_numbers(values)
+        vec = time.perf_counter() - t0
+
+        print(f"{label:16s} reference {ref / args.n * 1e9:7.0f} ns | reduce_number {new / args.n * 1e9:7.0f} ns"
+              f" | reduce_numbers {vec / args.n * 1e9:7.0f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
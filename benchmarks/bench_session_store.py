@@ -0,0 +1,96 @@
+# Ame-Artificielle/benchmarks/bench_session_store.py
+"""
+SessionStore load test: far more sessions than the hot set can hold.
+
+Phase 1 creates --sessions compact sessions (a few memory turns each) into a
+store capped at --hot live states; everything beyond spills to SQLite.
+Phase 2 runs --ops get + turn operations: with probability --locality the
+session is drawn from the most recently created --hot ids (warm traffic),
+otherwise uniformly from all sessions (cold, mostly reloads).
+
+Reports put/op throughput, hit rate, spill rate, reload p50/p99, the SQLite
+file size and the peak RSS of the process (VmHWM, Linux).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_session_store                      # 10M sessions, 1M hot
+    python -m benchmarks.bench_session_store --sessions 200000 --hot 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.engine import CompactSoulState
+from src.ontology import digit_to_traits
+from src.session_store import SessionStore
+
+
+def peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            return int(next(line.split()[1] for line in f if line.startswith("VmHWM:"))) / 1024
+    except (OSError, StopIteration):
+        return float("nan")
+
+
+def new_session(i: int, turns: int) -> CompactSoulState:
+    d = i % 10
+    state = CompactSoulState(digit_to_traits(d), d, 1 + i % 9, keep_trace=False)
+    for t in range(turns):
+        state.memory.push(f"question {t} de {i}", f"réponse {t} pour la session {i}")
+    return state
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sessions", type=int, default=10_000_000)
+    ap.add_argument("--hot", type=int, default=1_000_000)
+    ap.add_argument("--ops", type=int, default=1_000_000)
+    ap.add_argument("--locality", type=float, default=0.9)
+    ap.add_argument("--turns", type=int, default=4)
+    ap.add_argument("--db", type=Path, default=None, help="SQLite file (default: a temporary one)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = args.db or Path(tmp) / "sessions.sqlite"
+        store = SessionStore(db, max_sessions=args.hot, flush_every=4096)
+
+        t0 = time.perf_counter()
+        for i in range(args.sessions):
+            store.put(f"s{i}", new_session(i, args.turns))
+        store.flush()
+        put_s = time.perf_counter() - t0
+        print(f"created {args.sessions:,} sessions in {put_s:.1f} s ({args.sessions / put_s:,.0f} puts/s)")
+
+        rng = random.Random(0)
+        warm_lo = max(0, args.sessions - args.hot)
+        t0 = time.perf_counter()
+        for n in range(args.ops):
+            if rng.random() < args.locality:
+                i = rng.randrange(warm_lo, args.sessions)
+            else:
+                i = rng.randrange(args.sessions)
+            state = store.get(f"s{i}")
+            state.memory.push("encore ?", f"tour {n}")
+        ops_s = time.perf_counter() - t0
+        store.flush()
+
+        stats = store.stats()
+        print(f"{args.ops:,} ops in {ops_s:.1f} s ({args.ops / ops_s:,.0f} ops/s)")
+        print(
+            f"hit rate {stats.hit_rate:.3f}  spill rate {stats.spill_rate:.3f}  "
+            f"reload p50 {stats.reload_p50_ms:.3f} ms  p99 {stats.reload_p99_ms:.3f} ms"
+        )
+        print(
+            f"hot {stats.hot:,} states  sqlite {db.stat().st_size / 2**20:,.0f} MiB  "
+            f"peak RSS {peak_rss_mb():,.0f} MiB"
+        )
+        store.close(persist=False)
+
+
+if __name__ == "__main__":
+    main()
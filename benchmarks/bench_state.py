@@ -0,0 +1,75 @@
+# Ame-Artificielle/benchmarks/bench_state.py
+"""
+Per-session memory: SoulState vs CompactSoulState, measured with tracemalloc.
+
+Each session is built from an identity, then reacts --turns times (so its
+memory is full at memory_max_turns). Bytes per session are the traced
+allocations still alive after building --sessions sessions, divided by
+--sessions; reaction results are dropped.
+
+Variants:
+  dict       SoulState with a private dict trait vector (one per session)
+  soulstate  SoulState as built by build_state_from_identity()
+  compact    CompactSoulState (slots, memory ring, interned traits)
+  compact-nt CompactSoulState with keep_trace=False
+
+Usage (from the repo root):
+    python -m benchmarks.bench_state --sessions 5000 --turns 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from src.engine import ArtificialSoulEngine, EngineConfig
+
+STIMULI = ["Bonjour.", "Pourquoi ?", "Cours !", "Raconte-moi une histoire.", "Que faire maintenant ?"]
+
+
+def build(engine: ArtificialSoulEngine, variant: str, i: int):
+    identity = {"name": f"Session {i}", "dob": f"19{50 + i % 50}-0{1 + i % 9}-1{i % 10}"}
+    if variant == "dict":
+        state = engine.build_state_from_identity(identity=identity)
+        state.trait_vector = dict(state.trait_vector)
+        return state
+    if variant == "soulstate":
+        return engine.build_state_from_identity(identity=identity)
+    return engine.build_state_from_identity(identity=identity, compact=True, keep_trace=variant == "compact")
+
+
+def measure(variant: str, sessions: int, turns: int) -> float:
+    engine = ArtificialSoulEngine(config=EngineConfig(memory_max_turns=12))
+    build(engine, variant, 0)  # warm caches (projection, interned vectors) outside the measure
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    live = []
+    for i in range(sessions):
+        state = build(engine, variant, i)
+        for t in range(turns):
+            engine.react(state=state, stimulus=STIMULI[(i + t) % len(STIMULI)])
+        live.append(state)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return used / sessions
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sessions", type=int, default=5_000)
+    ap.add_argument("--turns", type=int, default=12)
+    ap.add_argument("--variants", nargs="+", default=["dict", "soulstate", "compact", "compact-nt"])
+    args = ap.parse_args()
+
+    ref = None
+    for variant in args.variants:
+        per = measure(variant, args.sessions, args.turns)
+        ref = ref or per
+        print(f"{variant:>10}  {per:9,.0f} bytes/session  ({per / ref:5.2f}x of {args.variants[0]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Ame-Artificielle/benchmarks/bench_templates.py
+"""
+Composition throughput: the per-call composer (sort + format the trait vector,
+axis_descriptor, shape_text, concatenation) vs templates.compose()
+(precompiled format per slider bucket / axis position + cached dominant
+traits), over --n reactions with mixed sliders and axis positions. The target
+is >= 100k compositions/s.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_templates --n 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from src.interpolation import axis_descriptor, shape_text
+from src.ontology import digit_to_traits
+from src.templates import compose
+
+STIMULI = [
+    "Pourquoi penses-tu cela ?",
+    "Danger ! Cours maintenant !",
+    "Bonjour, comment vas-tu ?",
+    "Explique-moi la logique de ce raisonnement.",
+]
+TARGET = 100_000
+
+
+def compose_uncompiled(*, trait_vector, axis_position, mood, stimulus, tone, humor, complexity) -> str:
+    top = sorted(trait_vector.items(), key=lambda kv: abs(kv[1]), reverse=True)[:5]
+    traits_str = ", ".join([f"{k}:{v:+.2f}" for k, v in top]) if top else "none"
+    axis_style = axis_descriptor(axis_position)
+    prefix = "Réponse" if tone >= 0.5 else "Note"
+    if humor >= 0.66:
+        prefix += " (léger)"
+    if complexity >= 0.66:
+        detail = f"\n\nContexte interne: axis={axis_position} ({axis_style}), mood={mood}, traits=[{traits_str}]"
+    else:
+        detail = ""
+    return f"{prefix}: {shape_text(stimulus=stimulus, axis_position=axis_position)}{detail}"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=200_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    calls = [
+        dict(
+            trait_vector=digit_to_traits(rng.randrange(10)),
+            axis_position=rng.randint(1, 9),
+            mood=rng.choice([-1, 0, 1]),
+            stimulus=rng.choice(STIMULI),
+            tone=rng.random(),
+            humor=rng.random(),
+            complexity=rng.random(),
+        )
+        for _ in range(args.n)
+    ]
+    assert all(compose(**kw) == compose_uncompiled(**kw) for kw in calls[:1000])
+
+    for name, fn in (("uncompiled", compose_uncompiled), ("compiled", compose)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            for kw in calls:
+                fn(**kw)
+            best = min(best, time.perf_counter() - t0)
+        rate = args.n / best
+        verdict = "ok" if rate >= TARGET else f"below {TARGET:,}/s"
+        print(f"{name:<11} {rate:12,.0f} compositions/s  {best / args.n * 1e6:6.2f} µs each  ({verdict})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Ame-Artificielle/benchmarks/bench_traits.py
+"""
+Cohort trait construction: one dict per profile vs the compiled projection
+(shared per-digit views, and one batch call for an M x N matrix).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_traits --cohort 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from array import array
+
+from src.ontology import default_projection, digit_to_traits, digits_to_traits
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--cohort", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    digits = array("b", (rng.randrange(10) for _ in range(args.cohort)))
+    proj = default_projection()
+    names = proj.schema.names
+
+    t0 = time.perf_counter()
+    dicts = [dict(zip(names, proj.row(d))) for d in digits]
+    dict_s = time.perf_counter() - t0
+    del dicts
+
+    t0 = time.perf_counter()
+    views = [digit_to_traits(d) for d in digits]
+    view_s = time.perf_counter() - t0
+    del views
+
+    t0 = time.perf_counter()
+    matrix = digits_to_traits(digits)
+    batch_s = time.perf_counter() - t0
+
+    m = args.cohort
+    print(f"cohort={m:,} traits={len(names)} matrix={len(matrix) * 8 / 1e6:.1f} MB")
+    print(f"dict per profile : {dict_s:7.3f} s  ({dict_s / m * 1e9:6.0f} ns/profile)")
+    print(f"shared views     : {view_s:7.3f} s  ({view_s / m * 1e9:6.0f} ns/profile)")
+    print(f"batch matrix     : {batch_s:7.3f} s  ({batch_s / m * 1e9:6.0f} ns/profile)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+# Ame-Artificielle/src/batching.py
+"""
+Micro-batching generation for AsyncArtificialSoulEngine.
+
+Model servers answer a batch of prompts in about the time of one, so sending
+one request per reaction wastes their capacity. MicroBatcher is a
+GenerationBackend that collects the generations of concurrent react() calls
+and hands them to a BatchGenerationBackend in batches:
+
+    batcher = MicroBatcher(HttpBatchBackend("http://127.0.0.1:8088/generate"),
+                           max_batch=32, max_wait=0.005)
+    engine = AsyncArtificialSoulEngine(backend=batcher, max_in_flight=256)
+
+  - a batch is dispatched when it holds `max_batch` requests, or `max_wait`
+    seconds after its first request arrived
+  - at most `max_concurrent_batches` batches run at once; later ones wait
+  - requests accepted but not yet sent to the backend count towards
+    `max_queue`; past it, generate() sheds immediately with BatchQueueFull
+    (an EngineOverloaded)
+  - each caller gets its own text back; a failed batch raises its error in
+    every caller of that batch; callers cancelled before dispatch are dropped
+    from their batch
+
+Give the engine a max_in_flight of at least max_batch, or batches never fill.
+
+Stand-ins for offline benchmarks (latency = base + per_item * batch size):
+  LatencyBatchBackend   in-process, asyncio.sleep
+  serve_standin()       stdlib HTTP server (POST /generate), for
+                        HttpBatchBackend; also `python -m src.batching`
+"""
+
+from __future__ import annotations
+
+import abc
+import argparse
+import asyncio
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Sequence, Set, Tuple
+
+from .engine_async import EngineOverloaded, GenerationBackend, GenerationRequest
+from .templates import compose
+
+
+class BatchQueueFull(EngineOverloaded):
+    """MicroBatcher shed a request: max_queue requests already waiting."""
+
+
+class BatchGenerationBackend(abc.ABC):
+    """Async batch text generator: one text per request, in order. Subclasses implement generate_batch()."""
+
+    @abc.abstractmethod
+    async def generate_batch(self, requests: Sequence[GenerationRequest]) -> List[str]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+@dataclass
+class BatchStats:
+    submitted: int = 0
+    shed: int = 0
+    batches: int = 0
+    items: int = 0
+    failed: int = 0
+    largest_batch: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    @property
+    def shed_rate(self) -> float:
+        return self.shed / self.submitted if self.submitted else 0.0
+
+
+class MicroBatcher(GenerationBackend):
+    """GenerationBackend collecting concurrent generate() calls into batches. Belongs to one event loop."""
+
+    def __init__(
+        self,
+        backend: BatchGenerationBackend,
+        *,
+        max_batch: int = 32,
+        max_wait: float = 0.005,
+        max_queue: int = 1024,
+        max_concurrent_batches: int = 4,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must be >= 0")
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be >= 1")
+        self.backend = backend
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self._buffer: List[Tuple[GenerationRequest, "asyncio.Future[str]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batch_slots = asyncio.Semaphore(max_concurrent_batches)
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stats = BatchStats()
+        self.waiting = 0  # accepted, not handed to the backend yet
+
+    async def generate(self, request: GenerationRequest) -> str:
+        self._stats.submitted += 1
+        if self.waiting >= self.max_queue:
+            self._stats.shed += 1
+            raise BatchQueueFull(f"generation queue full ({self.waiting} requests waiting)")
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[str]" = loop.create_future()
+        self._buffer.append((request, future))
+        self.waiting += 1
+        if len(self._buffer) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+        return await future
+
+    def stats(self) -> BatchStats:
+        s = self._stats
+        return BatchStats(s.submitted, s.shed, s.batches, s.items, s.failed, s.largest_batch)
+
+    async def flush(self) -> None:
+        """Dispatch the pending partial batch and wait for every running batch."""
+        self._dispatch()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
+        await self.backend.close()
+
+    # ---------- internals ----------
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[GenerationRequest, "asyncio.Future[str]"]]) -> None:
+        waiting = len(batch)
+        try:
+            async with self._batch_slots:
+                self.waiting -= waiting
+                waiting = 0
+                batch = [(request, future) for request, future in batch if not future.done()]
+                if not batch:
+                    return
+                s = self._stats
+                s.batches += 1
+                s.items += len(batch)
+                s.largest_batch = max(s.largest_batch, len(batch))
+                try:
+                    texts = await self.backend.generate_batch([request for request, _ in batch])
+                    if len(texts) != len(batch):
+                        raise ValueError(f"backend returned {len(texts)} texts for a batch of {len(batch)}")
+                except Exception as e:
+                    s.failed += len(batch)
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    return
+                for (_, future), text in zip(batch, texts):
+                    if not future.done():
+                        future.set_result(text)
+        except asyncio.CancelledError:
+            self.waiting -= waiting
+            for _, future in batch:
+                future.cancel()
+            raise
+
+
+# -------------------------
+# Stand-in backends
+# -------------------------
+
+def batch_latency(size: int, base_latency: float, per_item_latency: float) -> float:
+    """Simulated model latency of one batch (seconds)."""
+    return base_latency + per_item_latency * size
+
+
+def compose_request(request: GenerationRequest) -> str:
+    """The engine's template text for a generation request."""
+    return compose(
+        trait_vector=request.trait_vector,
+        axis_position=request.axis_position,
+        mood=request.mood,
+        stimulus=request.stimulus,
+        tone=request.tone,
+        humor=request.humor,
+        complexity=request.complexity,
+    )
+
+
+class LatencyBatchBackend(BatchGenerationBackend):
+    """In-process stand-in: template texts after batch_latency(); records batch sizes."""
+
+    def __init__(self, base_latency: float = 0.02, per_item_latency: float = 0.0005) -> None:
+        self.base_latency = base_latency
+        self.per_item_latency = per_item_latency
+        self.batch_sizes: List[int] = []
+
+    async def generate_batch(self, requests: Sequence[GenerationRequest]) -> List[str]:
+        self.batch_sizes.append(len(requests))
+        await asyncio.sleep(batch_latency(len(requests), self.base_latency, self.per_item_latency))
+        return [compose_request(r) for r in requests]
+
+
+def encode_batch(requests: Sequence[GenerationRequest]) -> bytes:
+    """JSON body of POST /generate."""
+    items = [
+        {
+            "trait_vector": dict(r.trait_vector),
+            "axis_position": r.axis_position,
+            "mood": r.mood,
+            "stimulus": r.stimulus,
+            "tone": r.tone,
+            "humor": r.humor,
+            "complexity": r.complexity,
+        }
+        for r in requests
+    ]
+    return json.dumps({"requests": items}, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_batch(body: bytes) -> List[GenerationRequest]:
+    return [GenerationRequest(**item) for item in json.loads(body)["requests"]]
+
+
+class HttpBatchBackend(BatchGenerationBackend):
+    """POSTs batches to a generation server (e.g. serve_standin()) from a thread pool."""
+
+    def __init__(self, url: str, *, timeout: float = 30.0, max_connections: int = 8) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="batch-http")
+
+    async def generate_batch(self, requests: Sequence[GenerationRequest]) -> List[str]:
+        body = encode_batch(requests)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, self._post, body)
+
+    def _post(self, body: bytes) -> List[str]:
+        req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read())["texts"]
+
+    async def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+def serve_standin(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8088,
+    base_latency: float = 0.02,
+    per_item_latency: float = 0.0005,
+    max_batch: Optional[int] = None,
+) -> ThreadingHTTPServer:
+    """
+    Stand-in model server: POST /generate {"requests": [...]} answers
+    {"texts": [...]} after batch_latency(len(requests)); batches over
+    max_batch get 413. Serves from a daemon thread; server.batch_sizes lists
+    the sizes received. Call .shutdown() to stop.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if self.path != "/generate":
+                self.send_error(404)
+                return
+            try:
+                requests = decode_batch(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            except (ValueError, KeyError, TypeError) as e:
+                self.send_error(400, f"{type(e).__name__}: {e}")
+                return
+            if max_batch is not None and len(requests) > max_batch:
+                self.send_error(413, f"batch of {len(requests)} > {max_batch}")
+                return
+            server.batch_sizes.append(len(requests))
+            time.sleep(batch_latency(len(requests), base_latency, per_item_latency))
+            body = json.dumps({"texts": [compose_request(r) for r in requests]}, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.batch_sizes = []  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, name="generation-standin", daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Stand-in batch generation server.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8088)
+    ap.add_argument("--base-latency", type=float, default=0.02)
+    ap.add_argument("--per-item-latency", type=float, default=0.0005)
+    args = ap.parse_args()
+    srv = serve_standin(
+        host=args.host, port=args.port, base_latency=args.base_latency, per_item_latency=args.per_item_latency
+    )
+    print(f"stand-in generation server on http://{args.host}:{srv.server_address[1]}/generate")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        srv.shutdown()
@@ -2,11 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
 
 TraitVector = Dict[str, float]
 
+# react_many() request: (state, stimulus[, sliders[, context]])
+ReactRequest = Tuple[Any, ...]
+
+_SLIDER_KEYS = ("tone", "humor", "complexity")
+_UNSET = object()
+
 
 @dataclass(frozen=True)
 class EngineConfig:
@@ -31,6 +38,21 @@ class EngineConfig:
     ethics_enabled: bool = True
     ethics_threshold: float = 0.65
 
+    # Identity -> profile LRU used by build_state_from_identity (0 disables).
+    # Off by default: it pays off when identities repeat (session restarts,
+    # retries) and slows builds down when they are mostly distinct (see
+    # benchmarks/bench_profile_cache.py). profile_cache.PROFILE_CACHE_SIZE is
+    # a reasonable size when enabling it.
+    profile_cache_size: int = 0
+
+    # Reaction traces: "off" | "summary" | "full" (see tracing.py). With a
+    # trace sink, one reaction in trace_sample_every sends its full trace there.
+    trace_level: str = "full"
+    trace_sample_every: int = 1000
+
+    # Per-stage latency histograms (see metrics.py); off = no timers at all
+    metrics_enabled: bool = False
+
 
 @dataclass
 class SoulState:
@@ -52,6 +74,197 @@ class SoulState:
     last_trace: Dict[str, Any] = field(default_factory=dict)
 
 
+class MemoryRing:
+    """
+    Fixed-capacity short memory: once full, each new turn overwrites the
+    oldest one (O(1), no reslicing). Turns are kept as two parallel lists and
+    read back as {"stimulus", "response"} dicts, like SoulState.memory.
+    """
+
+    __slots__ = ("_stimuli", "_responses", "_head", "_size")
+
+    def __init__(self, capacity: int, turns: Iterable[Mapping[str, Any]] = ()) -> None:
+        if capacity < 1:
+            raise ValueError("memory capacity must be >= 1")
+        self._stimuli: List[Any] = [None] * capacity
+        self._responses: List[Any] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        for turn in turns:
+            self.append(turn)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._stimuli)
+
+    def push(self, stimulus: str, response: str) -> None:
+        cap = len(self._stimuli)
+        i = (self._head + self._size) % cap
+        self._stimuli[i] = stimulus
+        self._responses[i] = response
+        if self._size < cap:
+            self._size += 1
+        else:
+            self._head = (self._head + 1) % cap
+
+    def append(self, turn: Mapping[str, Any]) -> None:
+        """list-style append of a {"stimulus", "response"} turn."""
+        self.push(turn["stimulus"], turn["response"])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, k: int) -> Dict[str, Any]:
+        if k < 0:
+            k += self._size
+        if not 0 <= k < self._size:
+            raise IndexError("memory index out of range")
+        i = (self._head + k) % len(self._stimuli)
+        return {"stimulus": self._stimuli[i], "response": self._responses[i]}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for k in range(self._size):
+            yield self[k]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def text_length(self) -> int:
+        """Total characters of the stored stimuli and responses."""
+        return sum(len(s) for s in self._stimuli if s is not None) + sum(
+            len(r) for r in self._responses if r is not None
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MemoryRing, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"MemoryRing({self.capacity}, {self.to_list()!r})"
+
+
+_INTERNED_TRAITS: Dict[Tuple[Tuple[str, float], ...], Mapping[str, float]] = {}
+_NO_TRACE: Mapping[str, Any] = MappingProxyType({})
+
+
+def intern_trait_vector(traits: Mapping[str, float]) -> Mapping[str, float]:
+    """
+    One shared read-only trait mapping per distinct profile. Rows of the
+    compiled ontology projection (ontology.digit_to_traits) are already
+    shared and are returned as is.
+    """
+    from .traits import TraitView
+
+    if isinstance(traits, TraitView):
+        return traits
+    key = tuple(sorted((k, float(v)) for k, v in traits.items()))
+    shared = _INTERNED_TRAITS.get(key)
+    if shared is None:
+        shared = _INTERNED_TRAITS[key] = MappingProxyType(dict(key))
+    return shared
+
+
+class CompactSoulState:
+    """
+    SoulState for large numbers of live sessions, usable wherever the engine
+    takes a SoulState:
+    - __slots__, no per-instance dict
+    - trait_vector interned (intern_trait_vector), shared by every state
+      with the same profile; treat it as read-only
+    - memory is a MemoryRing of `memory_capacity` turns
+    - keep_trace=False stores no trace: last_trace reads as an empty mapping
+      and assignments to it are dropped
+    """
+
+    __slots__ = ("trait_vector", "digit_archetype", "axis_position", "mood", "memory", "_trace")
+
+    def __init__(
+        self,
+        trait_vector: Optional[Mapping[str, float]] = None,
+        digit_archetype: Optional[int] = None,
+        axis_position: int = 5,
+        mood: Optional[int] = None,
+        memory: Iterable[Mapping[str, Any]] = (),
+        last_trace: Optional[Dict[str, Any]] = None,
+        *,
+        memory_capacity: int = 12,
+        keep_trace: bool = True,
+    ) -> None:
+        self.trait_vector = intern_trait_vector(trait_vector or {})
+        self.digit_archetype = digit_archetype
+        self.axis_position = axis_position
+        self.mood = mood
+        self.memory = MemoryRing(memory_capacity, memory)
+        self._trace: Optional[Dict[str, Any]] = (last_trace or {}) if keep_trace else None
+
+    @property
+    def keep_trace(self) -> bool:
+        return self._trace is not None
+
+    @property
+    def last_trace(self) -> Mapping[str, Any]:
+        return _NO_TRACE if self._trace is None else self._trace
+
+    @last_trace.setter
+    def last_trace(self, value: Dict[str, Any]) -> None:
+        if self._trace is not None:
+            self._trace = value
+
+    @classmethod
+    def from_state(cls, state: SoulState, *, memory_capacity: int = 12, keep_trace: bool = True) -> "CompactSoulState":
+        return cls(
+            state.trait_vector,
+            state.digit_archetype,
+            state.axis_position,
+            state.mood,
+            state.memory,
+            dict(state.last_trace),
+            memory_capacity=memory_capacity,
+            keep_trace=keep_trace,
+        )
+
+    def to_state(self) -> SoulState:
+        return SoulState(
+            trait_vector=dict(self.trait_vector),
+            digit_archetype=self.digit_archetype,
+            axis_position=self.axis_position,
+            mood=self.mood,
+            memory=self.memory.to_list(),
+            last_trace=dict(self.last_trace),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactSoulState):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactSoulState(digit_archetype={self.digit_archetype!r}, axis_position={self.axis_position!r}, "
+            f"mood={self.mood!r}, memory={len(self.memory)}/{self.memory.capacity}, keep_trace={self.keep_trace})"
+        )
+
+
+AnySoulState = Union[SoulState, CompactSoulState]
+
+
+class _Pending(NamedTuple):
+    """A parsed react_many() request waiting for its wave."""
+    index: int
+    state: AnySoulState
+    stimulus: str
+    context: Dict[str, Any]
+    sliders: Tuple[float, float, float]
+    pull: float
+    intensity: float
+    inertia: float
+
+
 class ArtificialSoulEngine:
     """
     Minimal orchestration layer:
@@ -64,7 +277,18 @@ class ArtificialSoulEngine:
     - ethics.py owns gating/mediation
     """
 
-    def __init__(self, *, config: Optional[EngineConfig] = None) -> None:
+    def __init__(
+        self,
+        *,
+        config: Optional[EngineConfig] = None,
+        profile_cache: Any = None,
+        trace_sink: Any = None,
+    ) -> None:
+        """
+        profile_cache: a profile_cache.ProfileCache to use (e.g. shared between
+        engines or persisted); by default one of config.profile_cache_size.
+        trace_sink: a tracing.TraceSink receiving sampled full traces.
+        """
         self.config = config or EngineConfig()
 
         # Lazy imports to keep module boundaries simple
@@ -72,11 +296,34 @@ class ArtificialSoulEngine:
         from . import ontology as _ontology
         from . import interpolation as _interpolation
         from . import ethics as _ethics
+        from . import population as _population
+        from . import templates as _templates
 
         self._numerology = _numerology
         self._ontology = _ontology
         self._interpolation = _interpolation
         self._ethics = _ethics
+        self._population = _population
+        self._templates = _templates
+
+        from . import profile_cache as _profile_cache
+
+        self._profile_cache = _profile_cache
+        if profile_cache is None and self.config.profile_cache_size > 0:
+            profile_cache = _profile_cache.ProfileCache(self.config.profile_cache_size)
+        self.profiles = profile_cache
+
+        from . import tracing as _tracing
+
+        self._tracing = _tracing
+        self._trace_level = _tracing.trace_level(self.config.trace_level)
+        self.trace_sink = trace_sink
+        self._trace_countdown = self.config.trace_sample_every
+
+        from . import metrics as _metrics
+
+        self._metrics = _metrics
+        self.stage_metrics = _metrics.StageMetrics() if self.config.metrics_enabled else None
 
     # ----------------------------
     # Profile construction
@@ -86,7 +333,9 @@ class ArtificialSoulEngine:
         *,
         identity: Dict[str, Any],
         axis_position: Optional[int] = None,
-    ) -> SoulState:
+        compact: bool = False,
+        keep_trace: bool = True,
+    ) -> AnySoulState:
         """
         identity: flexible payload (name/date/etc.). numerology.py decides what it supports.
 
@@ -94,7 +343,63 @@ class ArtificialSoulEngine:
         - digit_archetype set
         - trait_vector computed
         - axis_position set
+
+        compact=True returns a CompactSoulState (memory ring of
+        config.memory_max_turns turns; keep_trace=False drops the trace).
         """
+        watch = self._stopwatch()
+
+        # 1)-3) Profile: signature, reduction, archetype, traits (shared when cached)
+        profile = self._profile_for(identity, watch)
+        watch.lap("profile")
+        digit_archetype = profile.digit_archetype
+        trait_vector = profile.trait_vector
+
+        # 4) Initialize state
+        axis = axis_position if axis_position is not None else self._clamp_axis(self.config.axis_default)
+        trace = {
+            "signature": profile.signature,
+            "reduced": profile.reduced,
+            "digit_archetype": digit_archetype,
+            "inversion_enabled": self.config.inversion_enabled,
+        }
+        state: AnySoulState
+        if compact:
+            state = CompactSoulState(
+                trait_vector,
+                digit_archetype,
+                axis,
+                last_trace=trace,
+                memory_capacity=self.config.memory_max_turns,
+                keep_trace=keep_trace,
+            )
+        else:
+            state = SoulState(
+                trait_vector=trait_vector,
+                digit_archetype=digit_archetype,
+                axis_position=axis,
+                mood=None,
+                memory=[],
+                last_trace=trace,
+            )
+        watch.lap("state")
+        watch.total("build_state")
+        return state
+
+    def profile_for(self, identity: Dict[str, Any]) -> Any:
+        """The identity's profile_cache.SoulProfile, from the cache when enabled."""
+        return self._profile_for(identity, self._metrics.NULL_STOPWATCH)
+
+    def _profile_for(self, identity: Dict[str, Any], watch: Any) -> Any:
+        if self.profiles is None:
+            return self._build_profile(identity, "", watch)
+        return self.profiles.get_or_build(
+            identity,
+            inversion_enabled=self.config.inversion_enabled,
+            build=lambda key: self._build_profile(identity, key, watch),
+        )
+
+    def _build_profile(self, identity: Dict[str, Any], key: str, watch: Any) -> Any:
         # 1) Build signature + reduce
         signature = self._numerology.compute_signature(identity)
         reduced = self._numerology.reduce_signature(signature)
@@ -106,25 +411,12 @@ class ArtificialSoulEngine:
 
         if self.config.inversion_enabled:
             digit_archetype = self._numerology.invert_digit(digit_archetype)
+        watch.lap("numerology")
 
-        # 3) Traits from ontology
-        trait_vector = self._ontology.digit_to_traits(digit_archetype)
-
-        # 4) Initialize state
-        state = SoulState(
-            trait_vector=trait_vector,
-            digit_archetype=digit_archetype,
-            axis_position=axis_position if axis_position is not None else self._clamp_axis(self.config.axis_default),
-            mood=None,
-            memory=[],
-            last_trace={
-                "signature": signature,
-                "reduced": reduced,
-                "digit_archetype": digit_archetype,
-                "inversion_enabled": self.config.inversion_enabled,
-            },
-        )
-        return state
+        # 3) Traits from ontology (profile.trait_vector = digit_to_traits(digit_archetype))
+        profile = self._profile_cache.SoulProfile.create(key, digit_archetype, signature, reduced)
+        watch.lap("ontology")
+        return profile
 
     # ----------------------------
     # Reaction / simulation
@@ -132,7 +424,7 @@ class ArtificialSoulEngine:
     def react(
         self,
         *,
-        state: SoulState,
+        state: AnySoulState,
         stimulus: str,
         sliders: Optional[Dict[str, float]] = None,
         context: Optional[Dict[str, Any]] = None,
@@ -149,19 +441,17 @@ class ArtificialSoulEngine:
         """
         if context is None:
             context = {}
+        watch = self._stopwatch()
 
         # Merge sliders (per-call overrides)
-        tone = self._pick_slider(sliders, "tone", self.config.tone)
-        humor = self._pick_slider(sliders, "humor", self.config.humor)
-        complexity = self._pick_slider(sliders, "complexity", self.config.complexity)
+        tone, humor, complexity = self._merge_sliders(sliders)
 
         # 1) Update dynamics (axis/mood) from stimulus
-        axis_next, mood_next, dyn_trace = self._interpolation.update_dynamics(
-            axis_position=state.axis_position,
-            trait_vector=state.trait_vector,
-            stimulus=stimulus,
-            context=context,
-        )
+        # (interpolation.update_dynamics() unrolled: its trace dict is only built if traced)
+        pull, intensity = self._interpolation.stimulus_features(stimulus, context)
+        inertia = self._interpolation.trait_inertia(state.trait_vector)
+        axis_next, mood_next, delta = self._interpolation.step_dynamics(state.axis_position, inertia, pull, intensity)
+        watch.lap("interpolation")
 
         # 2) Generate a draft response (simple, deterministic placeholder)
         draft = self._compose_response_text(
@@ -173,6 +463,7 @@ class ArtificialSoulEngine:
             humor=humor,
             complexity=complexity,
         )
+        watch.lap("composition")
 
         # 3) Ethics mediation (optional)
         ethics_info = {"enabled": self.config.ethics_enabled, "action": "none", "score": None}
@@ -185,30 +476,209 @@ class ArtificialSoulEngine:
                 threshold=self.config.ethics_threshold,
                 context=context,
             )
+        watch.lap("ethics")
 
-        # 4) Commit state updates + memory
-        state.axis_position = axis_next
-        state.mood = mood_next
-        self._push_memory(state, stimulus=stimulus, response=final_text)
+        # 4) + 5) Commit state updates + memory, trace
+        result = self._commit(
+            state,
+            stimulus=stimulus,
+            text=final_text,
+            axis_next=axis_next,
+            mood_next=mood_next,
+            sliders=(tone, humor, complexity),
+            dynamics=(pull, intensity, inertia, delta),
+            ethics_info=ethics_info,
+        )
+        watch.lap("commit")
+        watch.total("react")
+        return result
 
-        # 5) Trace
-        trace = {
-            "digit_archetype": state.digit_archetype,
-            "axis_position_before": state.last_trace.get("axis_position", None),
-            "axis_position_after": axis_next,
-            "mood": mood_next,
-            "sliders": {"tone": tone, "humor": humor, "complexity": complexity},
-            "dynamics": dyn_trace,
-        }
-        state.last_trace = {**state.last_trace, "axis_position": axis_next, "mood": mood_next, "react_trace": trace}
+    # ----------------------------
+    # Stage metrics
+    # ----------------------------
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Per-stage latency (metrics.StageStats: count, mean/p50/p95/p99/max ms)
+        of build_state_from_identity() and react(); {} unless
+        config.metrics_enabled.
+        """
+        if self.stage_metrics is None:
+            return {}
+        return self.stage_metrics.snapshot()
 
-        return {
-            "text": final_text,
-            "axis_position": axis_next,
-            "mood": mood_next,
-            "trace": trace,
-            "ethics": ethics_info,
-        }
+    def _stopwatch(self) -> Any:
+        if self.stage_metrics is None:
+            return self._metrics.NULL_STOPWATCH
+        return self.stage_metrics.stopwatch()
+
+    def react_many(self, requests: Sequence[ReactRequest]) -> List[Dict[str, Any]]:
+        """
+        Batch form of react(): requests are (state, stimulus[, sliders[, context]])
+        tuples. Returns one react()-shaped result per request, in input order.
+
+        Each stage runs once over the whole batch: sliders are merged once per
+        distinct slider set, dynamics run as one column update, ethics scores
+        every text in a single pass. Results and state updates are exactly
+        those of calling react() on each request in order; a state that appears
+        several times sees its earlier requests committed first.
+
+        Requests run in waves (the k-th request on a state goes to wave k), so
+        states are updated wave by wave rather than strictly in input order.
+        Sampled traces for the trace sink are still picked and emitted in input
+        order, once the whole batch is committed.
+
+        A request that fails yields {"error": "<Type>: <message>"} and leaves its
+        state untouched; the rest of the batch is unaffected.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        slider_cache: Dict[Any, Tuple[float, float, float]] = {}
+
+        # Parse requests; the k-th request on a given state goes to wave k, so
+        # every wave touches each state at most once.
+        waves: List[List[_Pending]] = []
+        seen: Dict[int, int] = {}
+        for i, request in enumerate(requests):
+            try:
+                state, stimulus, sliders, context = self._unpack_request(request)
+                picked = self._merge_sliders_cached(sliders, slider_cache)
+                pull, intensity = self._interpolation.stimulus_features(stimulus, context)
+                inertia = self._interpolation.trait_inertia(state.trait_vector)
+            except Exception as e:
+                results[i] = self._error_result(e)
+                continue
+            k = seen.get(id(state), 0)
+            seen[id(state)] = k + 1
+            if k == len(waves):
+                waves.append([])
+            waves[k].append(_Pending(i, state, stimulus, context, picked, pull, intensity, inertia))
+
+        # Committed requests, by index, for trace sampling (None: no sink)
+        samples: Optional[List[Any]] = None
+        if self.trace_sink is not None and self.config.trace_sample_every > 0:
+            samples = [None] * len(requests)
+
+        for wave in waves:
+            self._react_wave(wave, results, samples)
+
+        # Waves commit A1, B1, C1 before A2 for [A1, B1, A2, C1]; sampling runs
+        # over the committed requests in input order, as sequential react() would.
+        for sample in samples or ():
+            if sample is not None and self._sample_trace():
+                p, axis_before, axis_next, mood_next, dynamics, ethics_info = sample
+                trace = self._full_trace(p.state, axis_before, axis_next, mood_next, p.sliders, dynamics)
+                self.trace_sink.emit({**trace, "stimulus": p.stimulus, "ethics": ethics_info})
+        return results  # type: ignore[return-value]
+
+    def _react_wave(
+        self,
+        wave: List["_Pending"],
+        results: List[Optional[Dict[str, Any]]],
+        samples: Optional[List[Any]],
+    ) -> None:
+        # 1) Dynamics, column-wise over the wave
+        axis = [p.state.axis_position for p in wave]
+        mood = [0] * len(wave)
+        pull = [p.pull for p in wave]
+        intensity = [p.intensity for p in wave]
+        inertia = [p.inertia for p in wave]
+        try:
+            self._population.step_dynamics_batch(axis, mood, inertia, pull, intensity)
+        except Exception:
+            # a bad axis value somewhere: fall back to isolating it
+            axis, mood = self._step_each(wave, results)
+
+        # 2) Drafts
+        drafted: List[Tuple[_Pending, int, Optional[int], str]] = []
+        for p, axis_next, m in zip(wave, axis, mood):
+            if results[p.index] is not None:
+                continue
+            mood_next = None if m == self._population.NO_MOOD else m
+            tone, humor, complexity = p.sliders
+            try:
+                draft = self._compose_response_text(
+                    trait_vector=p.state.trait_vector,
+                    axis_position=axis_next,
+                    mood=mood_next,
+                    stimulus=p.stimulus,
+                    tone=tone,
+                    humor=humor,
+                    complexity=complexity,
+                )
+            except Exception as e:
+                results[p.index] = self._error_result(e)
+                continue
+            drafted.append((p, axis_next, mood_next, draft))
+
+        # 3) Ethics, one pass over all drafts
+        if self.config.ethics_enabled:
+            mediated = self._mediate_batch(drafted, results)
+        else:
+            info = {"enabled": False, "action": "none", "score": None}
+            mediated = [(draft, dict(info)) for _, _, _, draft in drafted]
+
+        # 4) + 5) Commit (each state at most once per wave, so the order within
+        # a wave does not matter); trace samples are picked later, in input order
+        for (p, axis_next, mood_next, _), outcome in zip(drafted, mediated):
+            if outcome is None:
+                continue
+            final_text, ethics_info = outcome
+            dynamics = (p.pull, p.intensity, p.inertia, 4.0 * p.pull * p.intensity * (1.0 - p.inertia))
+            if samples is not None:
+                axis_before = p.state.last_trace.get("axis_position", None)
+                samples[p.index] = (p, axis_before, axis_next, mood_next, dynamics, ethics_info)
+            results[p.index] = self._commit(
+                p.state,
+                stimulus=p.stimulus,
+                text=final_text,
+                axis_next=axis_next,
+                mood_next=mood_next,
+                sliders=p.sliders,
+                dynamics=dynamics,
+                ethics_info=ethics_info,
+                sample=False,
+            )
+
+    def _step_each(self, wave: List["_Pending"], results: List[Optional[Dict[str, Any]]]) -> Tuple[List[int], List[int]]:
+        axis: List[int] = []
+        mood: List[int] = []
+        for p in wave:
+            try:
+                a, m, _ = self._interpolation.step_dynamics(p.state.axis_position, p.inertia, p.pull, p.intensity)
+            except Exception as e:
+                results[p.index] = self._error_result(e)
+                a, m = p.state.axis_position, None
+            axis.append(a)
+            mood.append(self._population.NO_MOOD if m is None else m)
+        return axis, mood
+
+    def _mediate_batch(
+        self,
+        drafted: List[Tuple["_Pending", int, Optional[int], str]],
+        results: List[Optional[Dict[str, Any]]],
+    ) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+        threshold = self.config.ethics_threshold
+        try:
+            return self._ethics.mediate_many(
+                [(draft, p.stimulus, p.state.trait_vector) for p, _, _, draft in drafted],
+                threshold=threshold,
+            )
+        except Exception:
+            pass
+        # Some item breaks the batch: mediate one by one to isolate it.
+        out: List[Optional[Tuple[str, Dict[str, Any]]]] = []
+        for p, _, _, draft in drafted:
+            try:
+                out.append(self._ethics.mediate(
+                    text=draft,
+                    stimulus=p.stimulus,
+                    trait_vector=p.state.trait_vector,
+                    threshold=threshold,
+                    context=p.context,
+                ))
+            except Exception as e:
+                results[p.index] = self._error_result(e)
+                out.append(None)
+        return out
 
     # ----------------------------
     # Internals
@@ -227,30 +697,148 @@ class ArtificialSoulEngine:
         """
         Placeholder generator.
         Replace with your actual generation stack (LLM or templates) in a higher layer.
+
+        Prefix, axis framing and detail layout come precompiled per slider
+        bucket and axis position; the dominant-trait summary is cached per
+        trait vector (see templates.py).
         """
-        # Extract a few dominant traits (by absolute weight)
-        top_traits = sorted(trait_vector.items(), key=lambda kv: abs(kv[1]), reverse=True)[:5]
-        traits_str = ", ".join([f"{k}:{v:+.2f}" for k, v in top_traits]) if top_traits else "none"
-
-        # Simple axis shading
-        axis_style = self._interpolation.axis_descriptor(axis_position)
-
-        # Light formatting choices based on sliders (still deterministic)
-        prefix = "Réponse" if tone >= 0.5 else "Note"
-        if humor >= 0.66:
-            prefix += " (léger)"
-        if complexity >= 0.66:
-            detail = f"\n\nContexte interne: axis={axis_position} ({axis_style}), mood={mood}, traits=[{traits_str}]"
-        else:
-            detail = ""
+        return self._templates.compose(
+            trait_vector=trait_vector,
+            axis_position=axis_position,
+            mood=mood,
+            stimulus=stimulus,
+            tone=tone,
+            humor=humor,
+            complexity=complexity,
+        )
+
+    def _push_memory(self, state: AnySoulState, *, stimulus: str, response: str) -> None:
+        memory = state.memory
+        if isinstance(memory, MemoryRing):
+            memory.push(stimulus, response)  # fixed capacity: evicts the oldest turn itself
+            return
+        memory.append({"stimulus": stimulus, "response": response})
+        if len(memory) > self.config.memory_max_turns:
+            # drop oldest, in place
+            del memory[: len(memory) - self.config.memory_max_turns]
+
+    def _commit(
+        self,
+        state: AnySoulState,
+        *,
+        stimulus: str,
+        text: str,
+        axis_next: int,
+        mood_next: Optional[int],
+        sliders: Tuple[float, float, float],
+        dynamics: Tuple[float, float, float, float],
+        ethics_info: Dict[str, Any],
+        sample: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Write axis/mood/memory, then build the trace the trace level asks for
+        (plus a sampled full trace for the sink). dynamics is
+        (pull, intensity, inertia, axis_delta). sample=False leaves trace
+        sampling to the caller (react_many picks samples in input order).
+        """
+        axis_before = state.last_trace.get("axis_position", None) if self._trace_level else None
+        state.axis_position = axis_next
+        state.mood = mood_next
+        self._push_memory(state, stimulus=stimulus, response=text)
+
+        sampled = sample and self._sample_trace()
+        if sampled and not self._trace_level:
+            axis_before = state.last_trace.get("axis_position", None)
+
+        trace: Optional[Dict[str, Any]] = None
+        if self._trace_level == self._tracing.TRACE_FULL or sampled:
+            trace = self._full_trace(state, axis_before, axis_next, mood_next, sliders, dynamics)
+            if sampled:
+                self.trace_sink.emit({**trace, "stimulus": stimulus, "ethics": ethics_info})
+            if self._trace_level == self._tracing.TRACE_SUMMARY:
+                trace = None
+        if self._trace_level == self._tracing.TRACE_SUMMARY:
+            trace = {"axis_position_before": axis_before, "axis_position_after": axis_next, "mood": mood_next}
+
+        if self._trace_level:
+            last = state.last_trace
+            if isinstance(last, dict):
+                # in place: no copy of the previous trace per turn
+                last["axis_position"] = axis_next
+                last["mood"] = mood_next
+                last["react_trace"] = trace
+            else:
+                state.last_trace = {**last, "axis_position": axis_next, "mood": mood_next, "react_trace": trace}
+
+        return {
+            "text": text,
+            "axis_position": axis_next,
+            "mood": mood_next,
+            "trace": trace if self._trace_level else None,
+            "ethics": ethics_info,
+        }
+
+    def _sample_trace(self) -> bool:
+        """Advance the trace-sampling countdown; True if this reaction goes to the sink."""
+        if self.trace_sink is None or self.config.trace_sample_every <= 0:
+            return False
+        self._trace_countdown -= 1
+        if self._trace_countdown > 0:
+            return False
+        self._trace_countdown = self.config.trace_sample_every
+        return True
+
+    @staticmethod
+    def _full_trace(
+        state: AnySoulState,
+        axis_before: Optional[int],
+        axis_next: int,
+        mood_next: Optional[int],
+        sliders: Tuple[float, float, float],
+        dynamics: Tuple[float, float, float, float],
+    ) -> Dict[str, Any]:
+        tone, humor, complexity = sliders
+        pull, intensity, inertia, delta = dynamics
+        return {
+            "digit_archetype": state.digit_archetype,
+            "axis_position_before": axis_before,
+            "axis_position_after": axis_next,
+            "mood": mood_next,
+            "sliders": {"tone": tone, "humor": humor, "complexity": complexity},
+            "dynamics": {"pull": pull, "intensity": intensity, "inertia": inertia, "axis_delta": delta},
+        }
 
-        return f"{prefix}: {self._interpolation.shape_text(stimulus=stimulus, axis_position=axis_position)}{detail}"
+    def _merge_sliders(self, sliders: Optional[Dict[str, float]]) -> Tuple[float, float, float]:
+        return (
+            self._pick_slider(sliders, "tone", self.config.tone),
+            self._pick_slider(sliders, "humor", self.config.humor),
+            self._pick_slider(sliders, "complexity", self.config.complexity),
+        )
 
-    def _push_memory(self, state: SoulState, *, stimulus: str, response: str) -> None:
-        state.memory.append({"stimulus": stimulus, "response": response})
-        if len(state.memory) > self.config.memory_max_turns:
-            # drop oldest
-            state.memory = state.memory[-self.config.memory_max_turns :]
+    def _merge_sliders_cached(
+        self,
+        sliders: Optional[Dict[str, float]],
+        cache: Dict[Any, Tuple[float, float, float]],
+    ) -> Tuple[float, float, float]:
+        key = tuple(sliders.get(k, _UNSET) for k in _SLIDER_KEYS) if sliders else None
+        try:
+            picked = cache.get(key)
+        except TypeError:  # unhashable slider value
+            return self._merge_sliders(sliders)
+        if picked is None:
+            picked = cache[key] = self._merge_sliders(sliders)
+        return picked
+
+    @staticmethod
+    def _unpack_request(request: Any) -> Tuple[AnySoulState, str, Optional[Dict[str, float]], Dict[str, Any]]:
+        state, stimulus, sliders, context = (tuple(request) + (None, None))[:4]
+        if not isinstance(state, (SoulState, CompactSoulState)):
+            raise TypeError(f"expected a SoulState, got {type(state).__name__}")
+        return state, stimulus, sliders, context if context is not None else {}
+
+    @staticmethod
+    def _error_result(e: Exception) -> Dict[str, Any]:
+        return {"error": f"{type(e).__name__}: {e}"}
 
     @staticmethod
     def _pick_slider(sliders: Optional[Dict[str, float]], key: str, default: float) -> float:
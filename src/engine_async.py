@@ -0,0 +1,274 @@
+# Ame-Artificielle/src/engine_async.py
+"""
+Asyncio front-end for ArtificialSoulEngine.
+
+Generation (the "LLM or templates" step of react()) is I/O-bound in
+production; AsyncArtificialSoulEngine awaits it through a pluggable
+GenerationBackend while the cheap stages (sliders, dynamics, ethics, commit)
+stay synchronous:
+
+    engine = AsyncArtificialSoulEngine(backend=MyLLMBackend(), max_in_flight=32)
+    out = await engine.react(state=state, stimulus="Bonjour")
+
+Flow control per engine:
+  - at most `max_in_flight` generations run at once (semaphore)
+  - at most `max_queue` more calls may wait for a slot; past that, callers
+    wait up to `queue_timeout` for room, then get EngineOverloaded
+  - `generation_timeout` bounds each backend call (asyncio.TimeoutError)
+
+Calls on the same SoulState run one at a time, in call order. State is only
+written after the last await, in one synchronous step: a call that is
+cancelled or times out leaves its SoulState exactly as it was.
+
+LatencyBackend is a local stand-in (template text after a configurable
+delay) for tests and benchmarks.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .engine import AnySoulState, ArtificialSoulEngine, EngineConfig, TraitVector
+
+
+class EngineOverloaded(RuntimeError):
+    """No room in the engine's queue within queue_timeout."""
+
+
+@dataclass(frozen=True)
+class GenerationRequest:
+    """Inputs of one generation: the arguments of ArtificialSoulEngine._compose_response_text."""
+    trait_vector: TraitVector
+    axis_position: int
+    mood: Optional[int]
+    stimulus: str
+    tone: float
+    humor: float
+    complexity: float
+
+
+class GenerationBackend(abc.ABC):
+    """Async text generator. Subclasses implement generate()."""
+
+    @abc.abstractmethod
+    async def generate(self, request: GenerationRequest) -> str:
+        raise NotImplementedError
+
+
+class TemplateBackend(GenerationBackend):
+    """The synchronous engine's placeholder generator, without any wait."""
+
+    def __init__(self, engine: Optional[ArtificialSoulEngine] = None) -> None:
+        self._engine = engine or ArtificialSoulEngine()
+
+    async def generate(self, request: GenerationRequest) -> str:
+        return self._compose(request)
+
+    def _compose(self, request: GenerationRequest) -> str:
+        return self._engine._compose_response_text(
+            trait_vector=request.trait_vector,
+            axis_position=request.axis_position,
+            mood=request.mood,
+            stimulus=request.stimulus,
+            tone=request.tone,
+            humor=request.humor,
+            complexity=request.complexity,
+        )
+
+
+class LatencyBackend(TemplateBackend):
+    """
+    Stand-in for a remote model: template text after `latency` seconds
+    (+ uniform jitter in [0, jitter)). Counts calls and peak concurrency.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        *,
+        jitter: float = 0.0,
+        seed: Optional[int] = None,
+        engine: Optional[ArtificialSoulEngine] = None,
+    ) -> None:
+        super().__init__(engine)
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+
+    async def generate(self, request: GenerationRequest) -> str:
+        self.calls += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(self.latency + (self._rng.random() * self.jitter if self.jitter else 0.0))
+            return self._compose(request)
+        finally:
+            self.active -= 1
+
+
+class AsyncArtificialSoulEngine:
+    """
+    Async react() over ArtificialSoulEngine with a pluggable generation backend.
+    Instances belong to one event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: Optional[EngineConfig] = None,
+        backend: Optional[GenerationBackend] = None,
+        max_in_flight: int = 8,
+        max_queue: int = 64,
+        queue_timeout: Optional[float] = None,
+        generation_timeout: Optional[float] = None,
+        trace_sink: Any = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        self.engine = ArtificialSoulEngine(config=config, trace_sink=trace_sink)
+        self.config = self.engine.config
+        self.backend = backend or TemplateBackend(self.engine)
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.generation_timeout = generation_timeout
+
+        self._admission = asyncio.Semaphore(max_in_flight + max_queue)
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._state_locks: Dict[int, List[Any]] = {}  # id(state) -> [lock, users]
+        self.admitted = 0
+        self.in_flight = 0
+
+    @property
+    def queued(self) -> int:
+        """Admitted calls not generating yet."""
+        return self.admitted - self.in_flight
+
+    async def react(
+        self,
+        *,
+        state: AnySoulState,
+        stimulus: str,
+        sliders: Optional[Dict[str, float]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Same result as ArtificialSoulEngine.react(), with the draft text from
+        the backend. Raises EngineOverloaded when the queue stays full for
+        queue_timeout, asyncio.TimeoutError when generation exceeds
+        generation_timeout.
+        """
+        if context is None:
+            context = {}
+        await self._admit()
+        try:
+            async with self._state_lock(state):
+                return await self._react_locked(state, stimulus, sliders, context)
+        finally:
+            self.admitted -= 1
+            self._admission.release()
+
+    async def _react_locked(
+        self,
+        state: AnySoulState,
+        stimulus: str,
+        sliders: Optional[Dict[str, float]],
+        context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        engine = self.engine
+        tone, humor, complexity = engine._merge_sliders(sliders)
+        pull, intensity = engine._interpolation.stimulus_features(stimulus, context)
+        inertia = engine._interpolation.trait_inertia(state.trait_vector)
+        axis_next, mood_next, delta = engine._interpolation.step_dynamics(state.axis_position, inertia, pull, intensity)
+        request = GenerationRequest(
+            trait_vector=state.trait_vector,
+            axis_position=axis_next,
+            mood=mood_next,
+            stimulus=stimulus,
+            tone=tone,
+            humor=humor,
+            complexity=complexity,
+        )
+
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                draft = await asyncio.wait_for(self.backend.generate(request), self.generation_timeout)
+            finally:
+                self.in_flight -= 1
+
+        # No await past this point: ethics + commit happen as one step.
+        ethics_info = {"enabled": self.config.ethics_enabled, "action": "none", "score": None}
+        final_text = draft
+        if self.config.ethics_enabled:
+            final_text, ethics_info = engine._ethics.mediate(
+                text=draft,
+                stimulus=stimulus,
+                trait_vector=state.trait_vector,
+                threshold=self.config.ethics_threshold,
+                context=context,
+            )
+        return engine._commit(
+            state,
+            stimulus=stimulus,
+            text=final_text,
+            axis_next=axis_next,
+            mood_next=mood_next,
+            sliders=(tone, humor, complexity),
+            dynamics=(pull, intensity, inertia, delta),
+            ethics_info=ethics_info,
+        )
+
+    # ---------- flow control ----------
+
+    async def _admit(self) -> None:
+        try:
+            await asyncio.wait_for(self._admission.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise EngineOverloaded(
+                f"engine queue full ({self.max_in_flight} in flight + {self.max_queue} queued)"
+            ) from None
+        self.admitted += 1
+
+    def _state_lock(self, state: AnySoulState) -> "_StateLock":
+        entry = self._state_locks.get(id(state))
+        if entry is None:
+            entry = self._state_locks[id(state)] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        return _StateLock(self._state_locks, id(state), entry)
+
+
+class _StateLock:
+    """Per-state lock; drops its table entry when the last user leaves."""
+
+    __slots__ = ("_table", "_key", "_entry")
+
+    def __init__(self, table: Dict[int, List[Any]], key: int, entry: List[Any]) -> None:
+        self._table = table
+        self._key = key
+        self._entry = entry
+
+    async def __aenter__(self) -> None:
+        try:
+            await self._entry[0].acquire()
+        except BaseException:
+            self._leave()
+            raise
+
+    async def __aexit__(self, *exc: object) -> None:
+        self._entry[0].release()
+        self._leave()
+
+    def _leave(self) -> None:
+        self._entry[1] -= 1
+        if self._entry[1] == 0:
+            del self._table[self._key]
@@ -1,8 +1,11 @@
 # Ame-Artificielle/src/ethics.py
 from __future__ import annotations
 
+import re
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from itertools import accumulate
+from typing import Any, Dict, List, Sequence, Tuple
 
 TraitVector = Dict[str, float]
 
@@ -39,7 +42,40 @@ def mediate(
     # --- Heuristic scoring (MVP) ---
     # The score here is not "moral truth"; it's a conservative risk estimate.
     risk = _risk_score(stimulus=stimulus, text=text)
+    return _decide(text=text, risk=risk, trait_vector=trait_vector, threshold=threshold)
 
+
+def mediate_many(
+    items: Sequence[Tuple[str, str, TraitVector]],
+    *,
+    threshold: float = 0.65,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    mediate() over a batch of (text, stimulus, trait_vector) items.
+
+    All stimuli and texts are lowercased and scanned for risk keywords in one
+    regex pass per risk bucket over a single joined buffer; results are identical to calling
+    mediate() item by item, in input order.
+    """
+    parts = [(part or "").lower() for text, stimulus, _ in items for part in (stimulus, text)]
+    buf = _SEP.join(parts)
+    # start offset of each part in buf, for mapping matches back to items
+    starts = list(accumulate((len(part) + len(_SEP) for part in parts), initial=0))
+
+    levels = [0] * len(items)
+    for level, pattern in ((2, _HIGH_RE), (1, _MED_RE)):
+        for m in pattern.finditer(buf):
+            i = (bisect_right(starts, m.start()) - 1) // 2
+            if level > levels[i]:
+                levels[i] = level
+
+    return [
+        _decide(text=text, risk=_LEVEL_SCORES[level], trait_vector=trait_vector, threshold=threshold)
+        for (text, _, trait_vector), level in zip(items, levels)
+    ]
+
+
+def _decide(*, text: str, risk: float, trait_vector: TraitVector, threshold: float) -> Tuple[str, Dict[str, Any]]:
     # Optional: allow "compassion" to slightly reduce harshness but not disable gating.
     compassion = float(trait_vector.get("compassion", 0.0))
     risk_adj = max(0.0, min(1.0, risk - 0.05 * max(0.0, compassion)))
@@ -59,36 +95,33 @@ def mediate(
     return _soften_text(text), _info(result)
 
 
+# Very rough buckets (MVP)
+HIGH_RISK_TERMS: Tuple[str, ...] = (
+    "suicide", "kill myself", "self-harm", "bomb", "explosive", "weapon",
+    "child sexual", "rape", "genocide", "terrorist",
+)
+MED_RISK_TERMS: Tuple[str, ...] = (
+    "how to hack", "steal", "credit card", "dox", "harm someone",
+    "make poison", "meth", "heroin",
+)
+
+# Non-overlapping scans are enough: a match only hides other matches of the
+# same bucket, and never crosses _SEP, so each part's bucket is exact.
+_HIGH_RE = re.compile("|".join(map(re.escape, HIGH_RISK_TERMS)))
+_MED_RE = re.compile("|".join(map(re.escape, MED_RISK_TERMS)))
+_SEP = "\x00"  # no keyword contains it: matches never span two parts
+_LEVEL_SCORES = (0.10, 0.75, 0.95)  # default low risk, medium, high
+
+
 def _risk_score(*, stimulus: str, text: str) -> float:
     """
     Simple keyword-based heuristic.
     Extend with classifiers/rules later.
     """
-    s = (stimulus or "").lower()
-    t = (text or "").lower()
-
-    # Very rough buckets (MVP)
-    high_risk = [
-        "suicide", "kill myself", "self-harm", "bomb", "explosive", "weapon",
-        "child sexual", "rape", "genocide", "terrorist",
-    ]
-    med_risk = [
-        "how to hack", "steal", "credit card", "dox", "harm someone",
-        "make poison", "meth", "heroin",
-    ]
-
-    score = 0.0
-
-    if any(k in s for k in high_risk) or any(k in t for k in high_risk):
-        score = max(score, 0.95)
-    if any(k in s for k in med_risk) or any(k in t for k in med_risk):
-        score = max(score, 0.75)
-
-    # Default low risk
-    if score == 0.0:
-        score = 0.10
-
-    return score
+    joined = f"{(stimulus or '').lower()}{_SEP}{(text or '').lower()}"
+    if _HIGH_RE.search(joined):
+        return _LEVEL_SCORES[2]
+    return _LEVEL_SCORES[1 if _MED_RE.search(joined) else 0]
 
 
 def _soften_text(text: str) -> str:
@@ -1,9 +1,17 @@
 # Ame-Artificielle/src/interpolation.py
 from __future__ import annotations
 
-from typing import Dict, Mapping, Optional
+import math
+import re
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
-TraitVector = Dict[str, float]
+from .numerology import _strip_accents
+from .traits import TraitSchema, TraitVector, TraitView
+
+TraitDict = Dict[str, float]
 
 
 def clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
@@ -16,28 +24,28 @@ def lerp(a: float, b: float, t: float) -> float:
     return (1.0 - t) * a + t * b
 
 
-def blend_vectors(a: Mapping[str, float], b: Mapping[str, float], t: float) -> TraitVector:
+def blend_vectors(a: Mapping[str, float], b: Mapping[str, float], t: float) -> TraitDict:
     """
     Blend two trait vectors key-wise. Missing keys are treated as 0.0.
     t=0 -> a, t=1 -> b.
     """
     t = clamp(t)
     keys = set(a.keys()) | set(b.keys())
-    out: TraitVector = {}
+    out: TraitDict = {}
     for k in keys:
         out[k] = lerp(float(a.get(k, 0.0)), float(b.get(k, 0.0)), t)
     return out
 
 
-def add_scaled(base: Mapping[str, float], overlay: Mapping[str, float], scale: float) -> TraitVector:
+def add_scaled(base: Mapping[str, float], overlay: Mapping[str, float], scale: float) -> TraitDict:
     """Return base + scale*overlay (key-wise)."""
-    out: TraitVector = dict(base)
+    out: TraitDict = dict(base)
     for k, v in overlay.items():
         out[k] = float(out.get(k, 0.0)) + float(v) * float(scale)
     return out
 
 
-def normalize_l1(v: Mapping[str, float], target_sum: float = 1.0) -> TraitVector:
+def normalize_l1(v: Mapping[str, float], target_sum: float = 1.0) -> TraitDict:
     """
     L1 normalize by absolute sum. Useful when you want vectors comparable
     across profiles. If the vector is all zeros, returns a copy unchanged.
@@ -71,7 +79,7 @@ def interpolate_axis(
     mid_overlays: Optional[Mapping[int, Mapping[str, float]]] = None,
     mid_strength: float = 0.25,
     normalize: bool = False,
-) -> TraitVector:
+) -> TraitDict:
     """
     Interpolate between intellect (axis=1) and instinct (axis=9) templates.
 
@@ -94,7 +102,7 @@ def interpolate_axis(
 
     Returns
     -------
-    TraitVector
+    TraitDict
         The blended (and optionally modulated) trait vector.
     """
     t_instinct = axis_position(axis_digit)
@@ -107,3 +115,366 @@ def interpolate_axis(
         base = normalize_l1(base, target_sum=1.0)
 
     return base
+
+
+# -------------------------
+# Dynamics (axis / mood update per stimulus)
+# -------------------------
+#
+# A stimulus is reduced to two features:
+#   pull       in [-1, 1]: < 0 draws toward the intellect pole (1), > 0 toward instinct (9)
+#   intensity  in [0, 1]:  how strongly it moves the agent
+# Traits set the inertia (emotional_stability + discipline resist the pull).
+# population.update_dynamics_batch() applies the exact same arithmetic to
+# whole populations; keep both in sync.
+
+_COGNITIVE_CUES = frozenset({
+    "pourquoi", "comment", "analyse", "analyser", "penser", "pense", "comprendre", "idee", "raison",
+    "logique", "expliquer", "why", "how", "think", "understand", "idea", "reason", "logic", "explain",
+})
+_INSTINCT_CUES = frozenset({
+    "peur", "danger", "urgent", "vite", "colere", "faim", "mal", "douleur", "attaque", "maintenant",
+    "fear", "danger", "urgent", "now", "angry", "anger", "hungry", "pain", "attack", "run",
+})
+_WORD_RE = re.compile(r"[a-z]+")
+INTENSITY_SATURATION = 4.0  # cues at which intensity reaches 1.0
+
+
+def stimulus_features(stimulus: str, context: Optional[Mapping[str, Any]] = None) -> Tuple[float, float]:
+    """
+    (pull, intensity) from lexical cues: cognitive words and "?" pull toward 1,
+    instinct words and "!" toward 9. Numeric context["pull"] /
+    context["intensity"] override the heuristic; other values (e.g. "high",
+    None) are ignored, as non-numeric sliders fall back to their default.
+    """
+    words = _WORD_RE.findall(_strip_accents(stimulus.lower()))
+    cognitive = sum(1 for w in words if w in _COGNITIVE_CUES) + stimulus.count("?")
+    instinct = sum(1 for w in words if w in _INSTINCT_CUES) + stimulus.count("!")
+    total = cognitive + instinct
+    pull = (instinct - cognitive) / total if total else 0.0
+    intensity = clamp(total / INTENSITY_SATURATION)
+    if context:
+        v = context.get("pull")
+        if _is_number(v):
+            pull = clamp(float(v), -1.0, 1.0)
+        v = context.get("intensity")
+        if _is_number(v):
+            intensity = clamp(float(v))
+    return pull, intensity
+
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def dynamics_inertia(emotional_stability: float, discipline: float) -> float:
+    """Resistance to axis moves in [0, 1] (0.5 for a neutral profile)."""
+    return clamp(0.5 + 0.125 * (emotional_stability + discipline))
+
+
+def trait_inertia(trait_vector: Mapping[str, float]) -> float:
+    """dynamics_inertia() of a {trait -> weight} mapping (missing traits are 0.0)."""
+    return dynamics_inertia(
+        float(trait_vector.get("emotional_stability", 0.0)),
+        float(trait_vector.get("discipline", 0.0)),
+    )
+
+
+def step_dynamics(axis_position: int, inertia: float, pull: float, intensity: float) -> Tuple[int, Optional[int], float]:
+    """
+    One update: (axis_next in 1..9, mood in 2..8 or None if intensity is 0, axis delta).
+    Rounding is half-up (floor(x + 0.5)).
+    """
+    delta = 4.0 * pull * intensity * (1.0 - inertia)
+    axis_next = max(1, min(9, math.floor(axis_position + delta + 0.5)))
+    mood = None if intensity <= 0.0 else max(2, min(8, math.floor(5.0 + 3.0 * pull * intensity + 0.5)))
+    return axis_next, mood, delta
+
+
+def update_dynamics(
+    *,
+    axis_position: int,
+    trait_vector: Mapping[str, float],
+    stimulus: str,
+    context: Optional[Mapping[str, Any]] = None,
+) -> Tuple[int, Optional[int], Dict[str, Any]]:
+    """
+    Move one agent on the 1..9 axis in reaction to a stimulus.
+    Returns (axis_next, mood_next, trace).
+    """
+    pull, intensity = stimulus_features(stimulus, context)
+    inertia = trait_inertia(trait_vector)
+    axis_next, mood, delta = step_dynamics(axis_position, inertia, pull, intensity)
+    trace = {"pull": pull, "intensity": intensity, "inertia": inertia, "axis_delta": delta}
+    return axis_next, mood, trace
+
+
+# -------------------------
+# Axis bands (text shading)
+# -------------------------
+#
+# docs/interpolation_axis.md, section "band": TOP (1-2) cognition/abstraction,
+# SPECTRUM (2-8) narration/emotion/myth, BASE (8-9) instinct/pragmatism.
+
+AXIS_BAND_STYLES: Mapping[str, str] = MappingProxyType({
+    "TOP": "cognition / abstraction",
+    "SPECTRUM": "narration / émotion / mythe",
+    "BASE": "instinct / pragmatisme",
+})
+
+_BAND_SHAPES: Mapping[str, str] = MappingProxyType({
+    "TOP": "Prenons du recul sur « {} » : quelles idées et quels principes sont en jeu ?",
+    "SPECTRUM": "« {} » : il y a là une histoire, des émotions, peut-être un mythe à écouter.",
+    "BASE": "« {} » : allons à l'essentiel, concrètement.",
+})
+
+
+def axis_band(axis_position: float) -> str:
+    """"TOP" | "SPECTRUM" | "BASE" for a (possibly continuous) axis position."""
+    if axis_position <= 2:
+        return "TOP"
+    if axis_position >= 8:
+        return "BASE"
+    return "SPECTRUM"
+
+
+def axis_descriptor(axis_position: float) -> str:
+    """Short label of the band, e.g. "TOP: cognition / abstraction"."""
+    band = axis_band(axis_position)
+    return f"{band}: {AXIS_BAND_STYLES[band]}"
+
+
+def shape_text(*, stimulus: str, axis_position: float) -> str:
+    """Deterministic one-line framing of the stimulus for the axis band (placeholder generator)."""
+    return _BAND_SHAPES[axis_band(axis_position)].format(stimulus.strip())
+
+
+# -------------------------
+# Array path (schema-bound TraitVector)
+# -------------------------
+#
+# Same math as the dict functions above, over TraitVector buffers: no key
+# union, no float() per key, and results can go into a caller-provided `out`
+# (which may alias an input). Use TraitVector.from_mapping() / to_dict() at
+# the edges.
+
+def _out_for(schema: TraitSchema, out: Optional[TraitVector]) -> TraitVector:
+    if out is None:
+        return TraitVector(schema)
+    if out.schema is not schema and out.schema != schema:
+        raise ValueError("output vector has a different trait schema")
+    return out
+
+
+def _same_schema(a: TraitVector, b: TraitVector) -> TraitSchema:
+    if a.schema is not b.schema and a.schema != b.schema:
+        raise ValueError("trait vectors have different schemas")
+    return a.schema
+
+
+def lerp_array(a: TraitVector, b: TraitVector, t: float, *, out: Optional[TraitVector] = None) -> TraitVector:
+    """Element-wise (1-t)*a + t*b, t clamped to [0, 1]."""
+    out = _out_for(_same_schema(a, b), out)
+    t = clamp(t)
+    s = 1.0 - t
+    ad, bd, od = a.data, b.data, out.data
+    for i in range(len(od)):
+        od[i] = s * ad[i] + t * bd[i]
+    return out
+
+
+def blend_vectors_array(a: TraitVector, b: TraitVector, t: float, *, out: Optional[TraitVector] = None) -> TraitVector:
+    """Array counterpart of blend_vectors() (traits absent from a mapping are already 0.0)."""
+    return lerp_array(a, b, t, out=out)
+
+
+def add_scaled_array(
+    base: TraitVector,
+    overlay: TraitVector,
+    scale: float,
+    *,
+    out: Optional[TraitVector] = None,
+) -> TraitVector:
+    """base + scale*overlay."""
+    out = _out_for(_same_schema(base, overlay), out)
+    scale = float(scale)
+    bd, vd, od = base.data, overlay.data, out.data
+    for i in range(len(od)):
+        od[i] = bd[i] + vd[i] * scale
+    return out
+
+
+def normalize_l1_array(v: TraitVector, target_sum: float = 1.0, *, out: Optional[TraitVector] = None) -> TraitVector:
+    """L1 normalize by absolute sum; an all-zero vector is copied unchanged."""
+    out = _out_for(v.schema, out)
+    vd, od = v.data, out.data
+    s = sum(map(abs, vd))
+    if s <= 1e-12:
+        if od is not vd:
+            od[:] = vd
+        return out
+    scale = float(target_sum) / s
+    for i in range(len(od)):
+        od[i] = vd[i] * scale
+    return out
+
+
+def interpolate_axis_array(
+    *,
+    axis_digit: int,
+    intellect: TraitVector,
+    instinct: TraitVector,
+    mid_overlays: Optional[Mapping[int, TraitVector]] = None,
+    mid_strength: float = 0.25,
+    normalize: bool = False,
+    out: Optional[TraitVector] = None,
+) -> TraitVector:
+    """Array counterpart of interpolate_axis(); every step writes into `out`."""
+    out = lerp_array(intellect, instinct, axis_position(axis_digit), out=out)
+    if mid_overlays and axis_digit in mid_overlays:
+        add_scaled_array(out, mid_overlays[axis_digit], mid_strength, out=out)
+    if normalize:
+        normalize_l1_array(out, 1.0, out=out)
+    return out
+
+
+# -------------------------
+# Precomputed axis table
+# -------------------------
+#
+# For one template set (intellect, instinct, mid_overlays, mid_strength,
+# normalize) interpolate_axis() has only nine outputs. compile_axis_table()
+# computes them once; tables are memoized by template *content*, so editing a
+# template and compiling again rebuilds, while unchanged templates (even new
+# dict objects) reuse the cached table.
+
+AXIS_TABLE_CACHE_SIZE = 256
+
+Template = Union[Mapping[str, float], TraitVector]
+
+
+class AxisTable:
+    """
+    Nine interpolate_axis() results, rows[d - 1] for axis digit d.
+    Rows are shared read-only mappings (TraitView for TraitVector templates).
+    """
+
+    __slots__ = ("rows", "schema", "_keys", "_values")
+
+    def __init__(self, rows: Tuple[Mapping[str, float], ...], schema: Optional[TraitSchema] = None) -> None:
+        self.rows = rows
+        self.schema = schema
+        # Dense copy over the union of row keys (missing = 0.0, as in blend_vectors) for at().
+        self._keys = tuple(dict.fromkeys(k for row in rows for k in row))
+        self._values = tuple(tuple(row.get(k, 0.0) for k in self._keys) for row in rows)
+
+    def row(self, axis_digit: int) -> Mapping[str, float]:
+        """O(1): same values as interpolate_axis(axis_digit=axis_digit, ...)."""
+        axis_position(axis_digit)  # validates
+        return self.rows[axis_digit - 1]
+
+    def at(self, axis_pos: float) -> TraitDict:
+        """
+        Continuous axis_pos in [1.0, 9.0] (docs/interpolation_axis.md): linear
+        blend of the two neighbouring rows. Always keyed by the union of the
+        rows' keys (missing = 0.0), on a row or between two.
+        """
+        lo, frac = self._locate(axis_pos)
+        if frac == 0.0:
+            return dict(zip(self._keys, self._values[lo]))
+        s = 1.0 - frac
+        return {k: s * a + frac * b for k, a, b in zip(self._keys, self._values[lo], self._values[lo + 1])}
+
+    def at_array(self, axis_pos: float, *, out: Optional[TraitVector] = None) -> TraitVector:
+        """at() for tables compiled from TraitVector templates, into `out`."""
+        if self.schema is None:
+            raise TypeError("at_array() needs a table compiled from TraitVector templates")
+        lo, frac = self._locate(axis_pos)
+        if frac == 0.0:
+            out = _out_for(self.schema, out)
+            out.data[:] = array("d", self.rows[lo].data)
+            return out
+        return lerp_array(self.rows[lo], self.rows[lo + 1], frac, out=out)
+
+    @staticmethod
+    def _locate(axis_pos: float) -> Tuple[int, float]:
+        x = float(axis_pos)
+        if not 1.0 <= x <= 9.0:
+            raise ValueError("axis_pos must be in [1.0, 9.0]")
+        lo = min(int(math.floor(x)), 8)
+        return lo - 1, x - lo
+
+
+def compile_axis_table(
+    *,
+    intellect: Template,
+    instinct: Template,
+    mid_overlays: Optional[Mapping[int, Template]] = None,
+    mid_strength: float = 0.25,
+    normalize: bool = False,
+) -> AxisTable:
+    """Precompute (or fetch the memoized) AxisTable for these templates."""
+    overlays = tuple(sorted((mid_overlays or {}).items()))
+    if isinstance(intellect, TraitVector):
+        schema = intellect.schema
+        key = (
+            schema.names,
+            intellect.data.tobytes(),
+            instinct.data.tobytes(),
+            tuple((d, v.data.tobytes()) for d, v in overlays),
+            float(mid_strength),
+            bool(normalize),
+        )
+        return _build_array_table(key)
+    key = (
+        tuple(intellect.items()),
+        tuple(instinct.items()),
+        tuple((d, tuple(v.items())) for d, v in overlays),
+        float(mid_strength),
+        bool(normalize),
+    )
+    return _build_dict_table(key)
+
+
+def axis_table_cache_clear() -> None:
+    _build_dict_table.cache_clear()
+    _build_array_table.cache_clear()
+
+
+@lru_cache(maxsize=AXIS_TABLE_CACHE_SIZE)
+def _build_dict_table(key: tuple) -> AxisTable:
+    intellect, instinct, overlays, mid_strength, normalize = key
+    intellect, instinct = dict(intellect), dict(instinct)
+    mid_overlays = {d: dict(v) for d, v in overlays}
+    rows = tuple(
+        MappingProxyType(interpolate_axis(
+            axis_digit=d, intellect=intellect, instinct=instinct,
+            mid_overlays=mid_overlays, mid_strength=mid_strength, normalize=normalize,
+        ))
+        for d in range(1, 10)
+    )
+    return AxisTable(rows)
+
+
+@lru_cache(maxsize=AXIS_TABLE_CACHE_SIZE)
+def _build_array_table(key: tuple) -> AxisTable:
+    names, intellect, instinct, overlays, mid_strength, normalize = key
+    schema = TraitSchema(names)
+
+    def vector(raw: bytes) -> TraitVector:
+        vec = TraitVector(schema)
+        vec.data = array("d")
+        vec.data.frombytes(raw)
+        return vec
+
+    intellect, instinct = vector(intellect), vector(instinct)
+    mid_overlays = {d: vector(v) for d, v in overlays}
+    out = TraitVector(schema)
+    rows = []
+    for d in range(1, 10):
+        interpolate_axis_array(
+            axis_digit=d, intellect=intellect, instinct=instinct,
+            mid_overlays=mid_overlays, mid_strength=mid_strength, normalize=normalize, out=out,
+        )
+        rows.append(TraitView(schema, memoryview(out.data.tobytes()).cast("d")))
+    return AxisTable(tuple(rows), schema)
@@ -0,0 +1,275 @@
+# Ame-Artificielle/src/metrics.py
+"""
+Per-stage latency instrumentation for ArtificialSoulEngine.
+
+Stages (EngineConfig.metrics_enabled=True):
+  build_state_from_identity: numerology, ontology (profile build, on cache
+      misses), profile (cache lookup), state; total "build_state"
+  react: interpolation (sliders + dynamics), composition, ethics, commit;
+      total "react"
+
+Timings are time.perf_counter_ns() laps (monotonic, ns) recorded into
+log-linear histograms (HDR-style: 2**PRECISION_BITS sub-buckets per power of
+two, <= ~6% relative error). Each thread records into its own histograms, so
+the hot path takes no lock; StageMetrics.snapshot() merges them.
+
+When metrics are disabled the engine uses NULL_STOPWATCH, whose laps are
+no-ops.
+
+Export: to_prometheus() renders a summary per stage in the Prometheus text
+format; write_prometheus() writes it to a file (atomically) and
+serve_prometheus() serves it over HTTP at /metrics.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, Union
+
+PRECISION_BITS = 4
+_SUB = 1 << PRECISION_BITS
+MAX_SHIFT = 40  # values up to ~2**45 ns (~10 h) keep their own bucket
+N_BUCKETS = (MAX_SHIFT + 1) * _SUB + _SUB
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+_now = time.perf_counter_ns
+
+
+def bucket_index(ns: int) -> int:
+    """Histogram bucket of a duration in ns."""
+    if ns < _SUB:
+        return ns if ns > 0 else 0
+    shift = ns.bit_length() - PRECISION_BITS - 1
+    if shift > MAX_SHIFT:
+        return N_BUCKETS - 1
+    return (shift + 1) * _SUB + (ns >> shift) - _SUB
+
+
+def bucket_bounds(i: int) -> Tuple[int, int]:
+    """[low, high] ns covered by bucket i."""
+    if i < _SUB:
+        return i, i
+    shift, sub = divmod(i, _SUB)
+    shift -= 1
+    low = (_SUB + sub) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in ns (single writer)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = array("Q", bytes(8 * N_BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        if ns < _SUB:
+            i = ns if ns > 0 else 0
+        else:
+            shift = ns.bit_length() - PRECISION_BITS - 1
+            i = (shift + 1) * _SUB + (ns >> shift) - _SUB if shift <= MAX_SHIFT else N_BUCKETS - 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self.counts
+        for i, c in enumerate(other.counts):
+            if c:
+                counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """Value (ns) at quantile q in [0, 1]: midpoint of its bucket, capped at max."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c:
+                seen += c
+                if seen >= rank:
+                    low, high = bucket_bounds(i)
+                    return min((low + high) / 2, float(self.max))
+        return float(self.max)
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """One stage of a StageMetrics snapshot (milliseconds)."""
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    total_ms: float
+
+
+class Stopwatch:
+    """Lap timer over one call: lap(stage) records the time since the previous lap."""
+
+    __slots__ = ("_hists", "_start", "_last")
+
+    def __init__(self, hists: Dict[str, LatencyHistogram]) -> None:
+        self._hists = hists
+        self._start = self._last = _now()
+
+    def lap(self, stage: str) -> None:
+        now = _now()
+        hist = self._hists.get(stage)
+        if hist is None:
+            hist = self._hists[stage] = LatencyHistogram()
+        hist.record(now - self._last)
+        self._last = now
+
+    def total(self, stage: str) -> None:
+        """Record the time since the stopwatch started."""
+        ns = _now() - self._start
+        hist = self._hists.get(stage)
+        if hist is None:
+            hist = self._hists[stage] = LatencyHistogram()
+        hist.record(ns)
+
+
+class _NullStopwatch:
+    __slots__ = ()
+
+    def lap(self, stage: str) -> None:
+        pass
+
+    def total(self, stage: str) -> None:
+        pass
+
+
+NULL_STOPWATCH = _NullStopwatch()
+
+
+class StageMetrics:
+    """
+    Per-thread stage histograms (by threading.get_ident(): a thread only
+    writes its own); snapshot() merges every thread's.
+    """
+
+    def __init__(self) -> None:
+        self._threads: Dict[int, Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()  # only taken when a thread records for the first time
+
+    def stopwatch(self) -> Stopwatch:
+        return Stopwatch(self._thread_hists())
+
+    def record(self, stage: str, ns: int) -> None:
+        hists = self._thread_hists()
+        hist = hists.get(stage)
+        if hist is None:
+            hist = hists[stage] = LatencyHistogram()
+        hist.record(ns)
+
+    def _thread_hists(self) -> Dict[str, LatencyHistogram]:
+        hists = self._threads.get(threading.get_ident())
+        if hists is None:
+            with self._lock:
+                hists = self._threads.setdefault(threading.get_ident(), {})
+        return hists
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """Merged copy of every thread's histograms."""
+        merged: Dict[str, LatencyHistogram] = {}
+        with self._lock:
+            registry = list(self._threads.values())
+        for hists in registry:
+            for stage, hist in list(hists.items()):
+                merged.setdefault(stage, LatencyHistogram()).merge(hist)
+        return merged
+
+    def snapshot(self) -> Dict[str, StageStats]:
+        out = {}
+        for stage, h in sorted(self.histograms().items()):
+            out[stage] = StageStats(
+                count=h.count,
+                mean_ms=h.total / h.count / 1e6 if h.count else 0.0,
+                p50_ms=h.percentile(0.50) / 1e6,
+                p95_ms=h.percentile(0.95) / 1e6,
+                p99_ms=h.percentile(0.99) / 1e6,
+                max_ms=h.max / 1e6,
+                total_ms=h.total / 1e6,
+            )
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            for hists in self._threads.values():
+                hists.clear()
+
+
+# -------------------------
+# Prometheus export
+# -------------------------
+
+def to_prometheus(metrics: StageMetrics, *, prefix: str = "ame") -> str:
+    """Prometheus text exposition: one summary (seconds) labelled by stage."""
+    name = f"{prefix}_stage_latency_seconds"
+    lines = [
+        f"# HELP {name} Latency of ArtificialSoulEngine pipeline stages.",
+        f"# TYPE {name} summary",
+    ]
+    for stage, h in sorted(metrics.histograms().items()):
+        for q in QUANTILES:
+            lines.append(f'{name}{{stage="{stage}",quantile="{q}"}} {h.percentile(q) / 1e9:.9g}')
+        lines.append(f'{name}_sum{{stage="{stage}"}} {h.total / 1e9:.9g}')
+        lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(metrics: StageMetrics, path: Union[str, Path], *, prefix: str = "ame") -> Path:
+    """Write to_prometheus() atomically (e.g. for node_exporter's textfile collector)."""
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(to_prometheus(metrics, prefix=prefix), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def serve_prometheus(
+    metrics: StageMetrics,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 9464,
+    prefix: str = "ame",
+) -> ThreadingHTTPServer:
+    """Serve GET /metrics from a daemon thread; call .shutdown() to stop."""
+    render: Callable[[], str] = lambda: to_prometheus(metrics, prefix=prefix)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="prometheus-exporter", daemon=True).start()
+    return server
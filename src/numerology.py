@@ -14,11 +14,17 @@ Conventions:
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from datetime import date, datetime
-import re
+from functools import lru_cache
+from itertools import product
+import mmap
+import os
+from pathlib import Path
+import struct
 import unicodedata
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 
 @dataclass(frozen=True)
@@ -42,15 +48,49 @@ def _strip_accents(s: str) -> str:
     return "".join(ch for ch in nfkd if not unicodedata.combining(ch))
 
 
+# ASCII letters -> uppercase; every other byte is deleted by translate().
+_UPPER_BYTES = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_NON_LETTER_BYTES = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
+# Bound on distinct names memoized by normalize_name().
+NAME_CACHE_SIZE = 65536
+
+
+def _normalize_name_uncached(name: str) -> str:
+    if name.isascii():
+        # Plain ASCII: nothing for NFKD to decompose.
+        raw = name.encode("ascii")
+    else:
+        # upper() runs before dropping non-ASCII so e.g. "ß" still becomes "SS".
+        raw = _strip_accents(name).upper().encode("ascii", "ignore")
+    return raw.translate(_UPPER_BYTES, _NON_LETTER_BYTES).decode("ascii")
+
+
+_normalize_name_cached = lru_cache(maxsize=NAME_CACHE_SIZE)(_normalize_name_uncached)
+
+
 def normalize_name(name: str) -> str:
     """
     Normalize a human name for letter-to-number mapping:
     - strip accents
     - uppercase
     - keep letters A-Z only (remove spaces, hyphens, punctuation, digits)
+
+    Results are memoized in a bounded LRU (see normalize_name_cache_info()).
+    Raises TypeError if name is not a str.
     """
-    s = _strip_accents(name).upper()
-    return re.sub(r"[^A-Z]", "", s)
+    if not isinstance(name, str):
+        raise TypeError(f"name must be a str, got {type(name).__name__}")
+    return _normalize_name_cached(name)
+
+
+def normalize_name_cache_info():
+    """hits / misses / maxsize / currsize of the normalize_name() LRU."""
+    return _normalize_name_cached.cache_info()
+
+
+def normalize_name_cache_clear() -> None:
+    _normalize_name_cached.cache_clear()
 
 
 # -------------------------
@@ -70,7 +110,63 @@ def invert_digit(d: int) -> int:
 
 
 def sum_digits(n: int) -> int:
-    return sum(int(ch) for ch in str(abs(n)))
+    n = abs(n)
+    total = 0
+    while n:
+        n, r = divmod(n, 10)
+        total += r
+    return total
+
+
+def _reduce_number_loop(x: int, masters: FrozenSet[int]) -> int:
+    # Reference reduction by repeated digit-summing (x > 0).
+    while True:
+        if x in masters:
+            return x
+        if x < 10:
+            return x
+        x = sum_digits(x)
+
+
+# Values below this are answered from a per-master-set table.
+_REDUCE_TABLE_SIZE = 1024
+
+
+class _MasterSpec:
+    """Per master-number set: membership, reachable residues mod 9, small-n table."""
+
+    __slots__ = ("masters", "residues", "table")
+
+    def __init__(self, masters: Iterable[int]) -> None:
+        self.masters: FrozenSet[int] = frozenset(masters)
+        # Digit-summing preserves n mod 9, so a master m >= 10 can only show
+        # up on the chain of n when m and n share a residue.
+        self.residues: FrozenSet[int] = frozenset(m % 9 for m in self.masters if m >= 10)
+        self.table: List[int] = [0] + [_reduce_number_loop(x, self.masters) for x in range(1, _REDUCE_TABLE_SIZE)]
+
+
+@lru_cache(maxsize=64)
+def _master_spec(masters: Tuple[int, ...]) -> _MasterSpec:
+    return _MasterSpec(masters)
+
+
+def _spec_for(keep_master_numbers: Iterable[int]) -> _MasterSpec:
+    if not isinstance(keep_master_numbers, tuple):
+        keep_master_numbers = tuple(keep_master_numbers)
+    return _master_spec(keep_master_numbers)
+
+
+def _reduce_with(spec: _MasterSpec, x: int) -> int:
+    if x < _REDUCE_TABLE_SIZE:
+        return spec.table[x]
+    if x % 9 not in spec.residues:
+        # closed-form digital root: no master can appear on the chain
+        return 1 + (x - 1) % 9
+    while x >= _REDUCE_TABLE_SIZE:
+        if x in spec.masters:
+            return x
+        x = sum_digits(x)
+    return spec.table[x]
 
 
 def reduce_number(
@@ -83,21 +179,40 @@ def reduce_number(
     Optionally keep master numbers (11, 22, 33) unreduced.
 
     If allow_zero=True, 0 reduces to 0; otherwise 0 is invalid.
+
+    Implemented as a table lookup for small n and the closed-form digital
+    root 1 + (n - 1) % 9 otherwise; the digit-sum chain is only walked when
+    a master number shares n's residue mod 9.
     """
     if n == 0:
         if allow_zero:
             return 0
         raise ValueError("reduce_number got 0 but allow_zero=False")
+    return _reduce_with(_spec_for(keep_master_numbers), abs(n))
 
-    masters = set(keep_master_numbers)
 
-    x = abs(n)
-    while True:
-        if x in masters:
-            return x
-        if x < 10:
-            return x
-        x = sum_digits(x)
+def reduce_numbers(
+    values: Iterable[int],
+    keep_master_numbers: Iterable[int] = (11, 22, 33),
+    allow_zero: bool = False,
+) -> "array[int]":
+    """
+    reduce_number() over a sequence/array of integers, returned as array('q').
+    Raises ValueError on a 0 unless allow_zero=True.
+    """
+    spec = _spec_for(keep_master_numbers)
+    table = spec.table
+    size = _REDUCE_TABLE_SIZE
+
+    def one(n: int) -> int:
+        x = n if n >= 0 else -n
+        if x < size:
+            if x == 0 and not allow_zero:
+                raise ValueError("reduce_numbers got 0 but allow_zero=False")
+            return table[x]
+        return _reduce_with(spec, x)
+
+    return array("q", map(one, values))
 
 
 # -------------------------
@@ -114,6 +229,18 @@ _PYTHAGOREAN_MAP: Dict[str, int] = {
 _VOWELS = set("AEIOUY")
 
 
+def _letter_table(letters: Iterable[str]) -> bytes:
+    # 256-byte translate table: ord(letter) -> Pythagorean value, everything else -> 0
+    table = bytearray(256)
+    for ch in letters:
+        table[ord(ch)] = _PYTHAGOREAN_MAP[ch]
+    return bytes(table)
+
+
+_LETTER_TABLE = _letter_table(_PYTHAGOREAN_MAP)
+_VOWEL_TABLE = _letter_table(_VOWELS)
+
+
 def pythagorean_letter_value(ch: str) -> int:
     ch = ch.upper()
     if ch not in _PYTHAGOREAN_MAP:
@@ -125,18 +252,16 @@ def name_total(name: str) -> int:
     """
     Total (unreduced) Pythagorean value for a name (letters A-Z only after normalization).
     """
-    n = normalize_name(name)
-    return sum(pythagorean_letter_value(ch) for ch in n)
+    return sum(normalize_name(name).encode("ascii").translate(_LETTER_TABLE))
 
 
 def name_total_vowels(name: str) -> int:
-    n = normalize_name(name)
-    return sum(pythagorean_letter_value(ch) for ch in n if ch in _VOWELS)
+    return sum(normalize_name(name).encode("ascii").translate(_VOWEL_TABLE))
 
 
 def name_total_consonants(name: str) -> int:
-    n = normalize_name(name)
-    return sum(pythagorean_letter_value(ch) for ch in n if ch not in _VOWELS)
+    letters = normalize_name(name).encode("ascii")
+    return sum(letters.translate(_LETTER_TABLE)) - sum(letters.translate(_VOWEL_TABLE))
 
 
 # -------------------------
@@ -161,7 +286,12 @@ def _parse_date(d: DateInput) -> date:
     raise TypeError(f"Unsupported date input: {type(d)}")
 
 
-def life_path_number(dob: DateInput, cfg: NumerologyConfig = NumerologyConfig()) -> Dict[str, int]:
+def life_path_number(
+    dob: DateInput,
+    cfg: NumerologyConfig = NumerologyConfig(),
+    *,
+    calendar: Optional["CalendarTable"] = None,
+) -> Dict[str, int]:
     """
     Life Path:
     Sum digits of full date of birth (YYYYMMDD) then reduce.
@@ -169,8 +299,13 @@ def life_path_number(dob: DateInput, cfg: NumerologyConfig = NumerologyConfig())
     Returns both:
     - pythagorean (reduced/master)
     - inverted (if cfg.apply_inversion and reduced is 1..9)
+
+    If a CalendarTable built for cfg's master numbers is given, dates inside
+    its range are answered from the table.
     """
     dt = _parse_date(dob)
+    if calendar is not None and calendar.covers(dt):
+        return calendar.life_path(dt, cfg)
     digits = f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
     total = sum(int(ch) for ch in digits)
     reduced = reduce_number(total, keep_master_numbers=cfg.keep_master_numbers, allow_zero=False)
@@ -181,11 +316,18 @@ def life_path_number(dob: DateInput, cfg: NumerologyConfig = NumerologyConfig())
     return out
 
 
-def birth_day_number(dob: DateInput, cfg: NumerologyConfig = NumerologyConfig()) -> Dict[str, int]:
+def birth_day_number(
+    dob: DateInput,
+    cfg: NumerologyConfig = NumerologyConfig(),
+    *,
+    calendar: Optional["CalendarTable"] = None,
+) -> Dict[str, int]:
     """
     Day number: reduce the day-of-month.
     """
     dt = _parse_date(dob)
+    if calendar is not None and calendar.covers(dt):
+        return calendar.birth_day(dt, cfg)
     reduced = reduce_number(dt.day, keep_master_numbers=cfg.keep_master_numbers, allow_zero=False)
 
     out = {"pythagorean": reduced}
@@ -194,6 +336,180 @@ def birth_day_number(dob: DateInput, cfg: NumerologyConfig = NumerologyConfig())
     return out
 
 
+# -------------------------
+# Precomputed calendar table
+# -------------------------
+
+class CalendarTable:
+    """
+    Day-indexed table of the date-based numbers for FIRST_YEAR..LAST_YEAR.
+
+    One fixed-size record per day (index = date.toordinal() - first ordinal):
+      life_path total, life_path reduced, life_path inverted,
+      birth_day reduced, birth_day inverted
+    where an inverted byte of 0 means "no inversion" (master number).
+
+    A table only answers for the master-number set it was built with.
+    save()/load() use a small binary file that load() maps read-only, so
+    worker processes share the same pages instead of rebuilding the table.
+    """
+
+    FIRST_YEAR = 1800
+    LAST_YEAR = 2200
+
+    _MAGIC = b"ASECAL\x00\x00"
+    _VERSION = 1
+    _HEADER = struct.Struct("<8sIiiI")  # magic, version, first ordinal, days, n_masters
+    _RECORD = 5
+
+    def __init__(self, keep_master_numbers: Iterable[int], first_ordinal: int, days: int, records) -> None:
+        self.keep_master_numbers: Tuple[int, ...] = tuple(sorted(set(keep_master_numbers)))
+        self._first = first_ordinal
+        self._days = days
+        self._records = records  # bytes, or a memoryview over a read-only mmap
+        self._accepted: set = {self.keep_master_numbers}
+
+    # ---------- construction ----------
+
+    @classmethod
+    def build(
+        cls,
+        cfg: NumerologyConfig = NumerologyConfig(),
+        *,
+        first_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+    ) -> "CalendarTable":
+        first = date(first_year or cls.FIRST_YEAR, 1, 1).toordinal()
+        last = date(last_year or cls.LAST_YEAR, 12, 31).toordinal()
+        days = last - first + 1
+        masters = tuple(cfg.keep_master_numbers)
+
+        reduced_cache: Dict[int, int] = {}
+
+        def reduce_cached(n: int) -> int:
+            r = reduced_cache.get(n)
+            if r is None:
+                r = reduced_cache[n] = reduce_number(n, keep_master_numbers=masters)
+            return r
+
+        def inv(r: int) -> int:
+            return 10 - r if 1 <= r <= 9 else 0
+
+        records = bytearray(days * cls._RECORD)
+        o = 0
+        for ordinal in range(first, last + 1):
+            dt = date.fromordinal(ordinal)
+            total = sum_digits(dt.year) + sum_digits(dt.month) + sum_digits(dt.day)
+            lp = reduce_cached(total)
+            bd = reduce_cached(dt.day)
+            records[o:o + cls._RECORD] = bytes((total, lp, inv(lp), bd, inv(bd)))
+            o += cls._RECORD
+        return cls(masters, first, days, bytes(records))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the table atomically (tmp file + rename)."""
+        path = Path(path)
+        header = self._HEADER.pack(self._MAGIC, self._VERSION, self._first, self._days, len(self.keep_master_numbers))
+        masters = struct.pack(f"<{len(self.keep_master_numbers)}i", *self.keep_master_numbers)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            f.write(header)
+            f.write(masters)
+            f.write(self._records)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CalendarTable":
+        """Map a table written by save(). Raises ValueError on a bad/foreign file."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < cls._HEADER.size:
+            raise ValueError(f"calendar table too short: {path}")
+        magic, version, first, days, n_masters = cls._HEADER.unpack_from(mm, 0)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError(f"not a calendar table (or wrong version): {path}")
+        masters = struct.unpack_from(f"<{n_masters}i", mm, cls._HEADER.size)
+        offset = cls._HEADER.size + 4 * n_masters
+        if len(mm) != offset + days * cls._RECORD:
+            raise ValueError(f"calendar table size mismatch: {path}")
+        return cls(masters, first, days, memoryview(mm)[offset:])
+
+    # ---------- lookups ----------
+
+    def covers(self, dt: date) -> bool:
+        return 0 <= dt.toordinal() - self._first < self._days
+
+    def _offset(self, dt: date, cfg: NumerologyConfig) -> int:
+        masters = cfg.keep_master_numbers
+        if masters not in self._accepted:
+            if tuple(sorted(set(masters))) != self.keep_master_numbers:
+                raise ValueError(
+                    f"calendar table built for masters {self.keep_master_numbers}, got {tuple(masters)}"
+                )
+            self._accepted.add(masters)
+        i = dt.toordinal() - self._first
+        if not 0 <= i < self._days:
+            raise ValueError(f"date outside calendar table range: {dt.isoformat()}")
+        return i * self._RECORD
+
+    def life_path(self, dob: DateInput, cfg: NumerologyConfig = NumerologyConfig()) -> Dict[str, int]:
+        r = self._records
+        o = self._offset(_parse_date(dob), cfg)
+        out = {"total": r[o], "pythagorean": r[o + 1]}
+        if cfg.apply_inversion and r[o + 2]:
+            out["inverted"] = r[o + 2]
+        return out
+
+    def birth_day(self, dob: DateInput, cfg: NumerologyConfig = NumerologyConfig()) -> Dict[str, int]:
+        r = self._records
+        o = self._offset(_parse_date(dob), cfg)
+        out = {"pythagorean": r[o + 3]}
+        if cfg.apply_inversion and r[o + 4]:
+            out["inverted"] = r[o + 4]
+        return out
+
+
+_CALENDAR_TABLES: Dict[Tuple[Tuple[int, ...], Optional[str]], CalendarTable] = {}
+
+
+def calendar_cache_path(cfg: NumerologyConfig, cache_dir: Union[str, Path]) -> Path:
+    masters = "-".join(str(m) for m in sorted(set(cfg.keep_master_numbers))) or "none"
+    return Path(cache_dir) / f"numerology_calendar_v{CalendarTable._VERSION}_m{masters}.bin"
+
+
+def get_calendar_table(
+    cfg: NumerologyConfig = NumerologyConfig(),
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> CalendarTable:
+    """
+    Process-wide CalendarTable for cfg's master-number set.
+
+    With cache_dir, the table is mapped from (or first written to) a cache
+    file there, so every worker pointing at the same directory shares it.
+    """
+    key = tuple(sorted(set(cfg.keep_master_numbers)))
+    memo_key = (key, None if cache_dir is None else str(cache_dir))
+    table = _CALENDAR_TABLES.get(memo_key)
+    if table is not None:
+        return table
+
+    if cache_dir is None:
+        table = CalendarTable.build(cfg)
+    else:
+        path = calendar_cache_path(cfg, cache_dir)
+        try:
+            table = CalendarTable.load(path)
+            if table.keep_master_numbers != key:
+                raise ValueError(f"calendar cache {path} was built for other master numbers")
+        except (OSError, ValueError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            CalendarTable.build(cfg).save(path)
+            table = CalendarTable.load(path)
+
+    _CALENDAR_TABLES[memo_key] = table
+    return table
+
+
 # -------------------------
 # Name-based core numbers
 # -------------------------
@@ -244,6 +560,108 @@ def personality_number(name: str, cfg: NumerologyConfig = NumerologyConfig()) ->
     return out
 
 
+# -------------------------
+# Name-variant search
+# -------------------------
+
+def _token_sums(token: str) -> Tuple[int, int]:
+    letters = normalize_name(token).encode("ascii")
+    total = sum(letters.translate(_LETTER_TABLE))
+    vowels = sum(letters.translate(_VOWEL_TABLE))
+    return vowels, total - vowels
+
+
+def find_name_variants(
+    slots: Sequence[Sequence[str]],
+    *,
+    expression: Optional[int] = None,
+    soul_urge: Optional[int] = None,
+    personality: Optional[int] = None,
+    cfg: NumerologyConfig = NumerologyConfig(),
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Lazily yield every combination of tokens (one per slot) whose name hits
+    the requested expression / soul_urge / personality numbers (None = any).
+
+    slots: alternatives per name position, e.g.
+      [["Jean", "Jehan"], ["", "François", "Francois"], ["Tremblay"]]
+    ("" makes a slot optional). Yields tuples of the chosen tokens.
+
+    Tokens are reduced to their (vowel, consonant) sums up front and grouped,
+    so the search runs over sum states rather than spellings:
+      - forward pass: reachable states per slot
+      - backward pass: states from which a target state is reachable
+      - depth-first walk over live states only, expanding token groups last
+    Without master numbers a state is the pair of digital roots (<= 100
+    states); with masters it is the exact pair of totals, since masters
+    depend on the whole reduction chain. Either way the work is polynomial
+    in the number of tokens and every branch taken leads to a result.
+    """
+    masters = tuple(cfg.keep_master_numbers)
+
+    if masters:
+        def fold(x: int, t: int) -> int:
+            return x + t
+    else:
+        # dr(dr(x) + t) == dr(x + t), and 0 stays distinct from 9.
+        def fold(x: int, t: int) -> int:
+            y = x + t
+            return 0 if y == 0 else 1 + (y - 1) % 9
+
+    # Per slot: (vowel sum, consonant sum) -> tokens sharing those sums.
+    groups: List[Dict[Tuple[int, int], List[str]]] = []
+    for slot in slots:
+        g: Dict[Tuple[int, int], List[str]] = {}
+        for token in slot:
+            g.setdefault(_token_sums(token), []).append(token)
+        groups.append(g)
+
+    def accepts(state: Tuple[int, int]) -> bool:
+        v, c = state
+        if v + c == 0:
+            return False  # empty name: expression_number() would raise
+        if expression is not None and reduce_number(v + c, keep_master_numbers=masters) != expression:
+            return False
+        if soul_urge is not None and (reduce_number(v, keep_master_numbers=masters) if v else 0) != soul_urge:
+            return False
+        if personality is not None and (reduce_number(c, keep_master_numbers=masters) if c else 0) != personality:
+            return False
+        return True
+
+    # Forward: reachable states after each slot.
+    layers: List[Set[Tuple[int, int]]] = [{(0, 0)}]
+    for g in groups:
+        layers.append({(fold(v, tv), fold(c, tc)) for v, c in layers[-1] for tv, tc in g})
+
+    # Backward: keep only states that can still reach an accepted final state.
+    alive: List[Set[Tuple[int, int]]] = [set() for _ in layers]
+    alive[-1] = {s for s in layers[-1] if accepts(s)}
+    for i in range(len(groups) - 1, -1, -1):
+        nxt = alive[i + 1]
+        alive[i] = {
+            (v, c) for v, c in layers[i]
+            if any((fold(v, tv), fold(c, tc)) in nxt for tv, tc in groups[i])
+        }
+
+    if (0, 0) not in alive[0]:
+        return
+
+    def walk(i: int, state: Tuple[int, int], chosen: List[List[str]]) -> Iterator[Tuple[str, ...]]:
+        if i == len(groups):
+            yield from product(*chosen)
+            return
+        v, c = state
+        nxt = alive[i + 1]
+        for (tv, tc), tokens in groups[i].items():
+            s = (fold(v, tv), fold(c, tc))
+            if s in nxt:
+                chosen.append(tokens)
+                yield from walk(i + 1, s, chosen)
+                chosen.pop()
+
+    yield from walk(0, (0, 0), [])
+
+
 # -------------------------
 # Combined signature
 # -------------------------
@@ -252,6 +670,8 @@ def build_signature(
     name: Optional[str] = None,
     dob: Optional[DateInput] = None,
     cfg: NumerologyConfig = NumerologyConfig(),
+    *,
+    calendar: Optional[CalendarTable] = None,
 ) -> Dict[str, Dict[str, int]]:
     """
     Build a minimal signature dict from name and/or date of birth.
@@ -263,8 +683,8 @@ def build_signature(
     sig: Dict[str, Dict[str, int]] = {}
 
     if dob is not None:
-        sig["life_path"] = life_path_number(dob, cfg=cfg)
-        sig["birth_day"] = birth_day_number(dob, cfg=cfg)
+        sig["life_path"] = life_path_number(dob, cfg=cfg, calendar=calendar)
+        sig["birth_day"] = birth_day_number(dob, cfg=cfg, calendar=calendar)
 
     if name is not None:
         sig["expression"] = expression_number(name, cfg=cfg)
@@ -274,6 +694,129 @@ def build_signature(
     return sig
 
 
+# -------------------------
+# Engine adapters
+# -------------------------
+
+def compute_signature(
+    identity: Mapping[str, Any],
+    cfg: NumerologyConfig = NumerologyConfig(),
+    *,
+    calendar: Optional[CalendarTable] = None,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Signature from a flexible identity payload.
+    Reads "name" (or "name_full") and "dob" (or "birthdate").
+    """
+    name = identity.get("name", identity.get("name_full"))
+    dob = identity.get("dob", identity.get("birthdate"))
+    if name is None and dob is None:
+        raise ValueError("identity needs at least a name or a dob")
+    return build_signature(name=name, dob=dob, cfg=cfg, calendar=calendar)
+
+
+def reduce_signature(signature: Mapping[str, Mapping[str, int]]) -> Dict[str, int]:
+    """
+    Collapse a signature to its core digit (1..9, master numbers reduced).
+
+    The core number is the life path when a date is known, otherwise the
+    expression number. Inversion is left to the caller.
+    """
+    for key in ("life_path", "expression"):
+        if key in signature:
+            value = signature[key]["pythagorean"]
+            return {"core_key": key, "core_value": value, "core_digit": reduce_number(value, keep_master_numbers=())}
+    raise ValueError("signature has neither life_path nor expression")
+
+
+# -------------------------
+# Batch (columnar) signature
+# -------------------------
+
+# Sentinel stored in "inverted" columns where the scalar API omits the key
+# (master numbers, or a 0 vowel/consonant total).
+NO_INVERSION = -1
+
+
+SignatureColumns = Dict[str, Dict[str, "array[int]"]]
+
+
+def _new_columns() -> Dict[str, "array[int]"]:
+    return {"total": array("q"), "pythagorean": array("q"), "inverted": array("q")}
+
+
+def build_signature_batch(
+    names: Optional[Sequence[str]] = None,
+    dobs: Optional[Sequence[DateInput]] = None,
+    cfg: NumerologyConfig = NumerologyConfig(),
+    *,
+    calendar: Optional[CalendarTable] = None,
+) -> SignatureColumns:
+    """
+    Columnar counterpart of build_signature() for whole cohorts.
+
+    Returns {number_key -> {"total", "pythagorean", "inverted"} -> array('q')},
+    one row per identity, with the same keys build_signature() would produce.
+    Values are identical to the scalar path; "inverted" holds NO_INVERSION
+    where the scalar dict has no "inverted" key. birth_day "total" is the day.
+
+    Each name is normalized once; letter and vowel sums come from 256-byte
+    translate tables reduced with sum() over the resulting bytes, and
+    reductions are memoized per distinct total. Dates inside an optional
+    CalendarTable's range are read from the table.
+    """
+    if names is not None and dobs is not None and len(names) != len(dobs):
+        raise ValueError(f"names and dobs length mismatch: {len(names)} != {len(dobs)}")
+
+    masters = tuple(cfg.keep_master_numbers)
+    reduced_cache: Dict[int, int] = {}
+
+    def append(cols: Dict[str, "array[int]"], total: int, reduced: int) -> None:
+        cols["total"].append(total)
+        cols["pythagorean"].append(reduced)
+        cols["inverted"].append(10 - reduced if cfg.apply_inversion and 1 <= reduced <= 9 else NO_INVERSION)
+
+    def push(cols: Dict[str, "array[int]"], total: int, *, zero_ok: bool = False) -> None:
+        if total == 0 and zero_ok:
+            # Same "no vowels / no consonants" convention as the scalar helpers.
+            reduced = 0
+        else:
+            reduced = reduced_cache.get(total)
+            if reduced is None:
+                reduced = reduce_number(total, keep_master_numbers=masters, allow_zero=False)
+                reduced_cache[total] = reduced
+        append(cols, total, reduced)
+
+    out: SignatureColumns = {}
+
+    if dobs is not None:
+        life_path = out["life_path"] = _new_columns()
+        birth_day = out["birth_day"] = _new_columns()
+        for dob in dobs:
+            dt = _parse_date(dob)
+            if calendar is not None and calendar.covers(dt):
+                lp = calendar.life_path(dt, cfg)
+                append(life_path, lp["total"], lp["pythagorean"])
+                append(birth_day, dt.day, calendar.birth_day(dt, cfg)["pythagorean"])
+                continue
+            push(life_path, sum_digits(dt.year) + sum_digits(dt.month) + sum_digits(dt.day))
+            push(birth_day, dt.day)
+
+    if names is not None:
+        expression = out["expression"] = _new_columns()
+        soul_urge = out["soul_urge"] = _new_columns()
+        personality = out["personality"] = _new_columns()
+        for name in names:
+            letters = normalize_name(name).encode("ascii")
+            total = sum(letters.translate(_LETTER_TABLE))
+            vowels = sum(letters.translate(_VOWEL_TABLE))
+            push(expression, total)
+            push(soul_urge, vowels, zero_ok=True)
+            push(personality, total - vowels, zero_ok=True)
+
+    return out
+
+
 if __name__ == "__main__":
     # Quick sanity run
     cfg = NumerologyConfig(keep_master_numbers=(11, 22, 33), apply_inversion=True)
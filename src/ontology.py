@@ -3,9 +3,15 @@ from __future__ import annotations
 
 import json
 import re
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .pi_digits import PiContext, PiDigitStore
+from .traits import TraitProjection, TraitView
 
 
 @dataclass(frozen=True)
@@ -16,10 +22,37 @@ class DigitEntry:
     analysis: Dict[str, str]
 
 
+_CODE_FENCE_RE = re.compile(r"\A\s*```[\w+-]*[ \t]*\r?\n(?P<body>.*)\n[ \t]*```\s*\Z", re.DOTALL)
+
+
+def strip_code_fence(raw: str) -> str:
+    """
+    The JSON inside a markdown code fence (```json ... ```) wrapping the
+    whole file, else raw unchanged. Shared by every ontology loader: a fence
+    is the only text tolerated around the JSON arrays.
+    """
+    m = _CODE_FENCE_RE.match(raw)
+    return m.group("body") if m else raw
+
+
 class OntologyError(RuntimeError):
     pass
 
 
+@dataclass
+class ViewCacheStats:
+    """Counters for PiOntology's merged-view cache."""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 def invert_digit(d: int) -> int:
     """
     Inversion rule used in the project:
@@ -40,13 +73,35 @@ class PiOntology:
       - merged view (tradition -> text)
       - missing / incomplete detection
       - patching (to fill digit 2 or override traditions)
+      - positional context of entries in pi (with an attached PiDigitStore)
+
+    Merged views, their case-folded key index and digit summaries are
+    memoized per digit and dropped when patch_digit() touches that digit.
+    Merged views are returned as read-only mappings.
     """
 
-    def __init__(self, path: str | Path = "data/pi_ontology.json") -> None:
-        self.path = Path(path)
-        self._entries: List[DigitEntry] = []
-        self._by_digit: Dict[int, List[DigitEntry]] = {}
-        self._patches: Dict[int, Dict[str, str]] = {}
+    _digit_store: Optional[PiDigitStore] = None
+
+    def __init__(
+        self,
+        path: str | Path = "data/pi_ontology.json",
+        *,
+        snapshot: str | Path | bool | None = None,
+    ) -> None:
+        """
+        snapshot: load from a compiled binary snapshot (see ontology_snapshot.py)
+        instead of parsing the JSON. True uses `<path>.snap`; a path picks the
+        file. The snapshot is recompiled whenever the JSON content hash changes.
+        """
+        self._init_empty(path)
+
+        if snapshot:
+            from .ontology_snapshot import load_or_compile
+
+            self._entries, self._by_digit = load_or_compile(
+                self.path, None if snapshot is True else snapshot
+            )
+            return
 
         raw = self._read_text(self.path)
         data = self._parse_lenient_json(raw)
@@ -61,7 +116,7 @@ class PiOntology:
 
     def is_digit_missing_or_incomplete(self, digit: int, *, inverted: bool = False) -> bool:
         d = invert_digit(digit) if inverted else digit
-        entries = self._by_digit.get(d, [])
+        entries = list(self._digit_entries(d))
         if not entries:
             return True
 
@@ -79,9 +134,51 @@ class PiOntology:
 
         return False
 
+    @property
+    def patched_digits(self) -> List[int]:
+        return sorted(d for d, p in self._patches.items() if p)
+
+    def get_patch(self, digit: int, *, inverted: bool = False) -> Mapping[str, str]:
+        """Read-only view of the traditions patched onto a digit (empty if none)."""
+        d = invert_digit(digit) if inverted else digit
+        return MappingProxyType(dict(self._patches.get(d, {})))
+
+    def add_patch_listener(self, listener: Callable[[int], None]) -> None:
+        """Call listener(digit) after every patch_digit() (digit already resolved)."""
+        self._patch_listeners.append(listener)
+
     def get_entries(self, digit: int, *, inverted: bool = False) -> List[DigitEntry]:
         d = invert_digit(digit) if inverted else digit
-        return list(self._by_digit.get(d, []))
+        return list(self._digit_entries(d))
+
+    def attach_digit_store(self, store: Optional[PiDigitStore]) -> None:
+        """Resolve entry indexes against `store` (positions in pi); None detaches."""
+        self._digit_store = store
+
+    def get_context(self, index: int, *, radius: int = 8) -> PiContext:
+        """Digits of pi within `radius` positions of `index` (needs attach_digit_store())."""
+        if self._digit_store is None:
+            raise OntologyError("No pi digit store attached (see attach_digit_store()).")
+        return self._digit_store.context(index, radius)
+
+    def get_entries_with_context(
+        self,
+        digit: int,
+        *,
+        inverted: bool = False,
+        radius: int = 8,
+    ) -> List[Tuple[DigitEntry, Optional[PiContext]]]:
+        """
+        get_entries() paired with each entry's positional context in pi.
+        Context is None for entries whose index is outside the store.
+        """
+        store = self._digit_store
+        if store is None:
+            raise OntologyError("No pi digit store attached (see attach_digit_store()).")
+        return [
+            (e, store.context(e.index, radius) if 0 <= e.index < len(store) else None)
+            for e in self.get_entries(digit, inverted=inverted)
+        ]
 
     def get_analysis(
         self,
@@ -90,36 +187,26 @@ class PiOntology:
         inverted: bool = False,
         merged: bool = True,
         merge_policy: str = "last",
-    ) -> Dict[str, str] | List[Dict[str, str]]:
+    ) -> Mapping[str, str] | List[Dict[str, str]]:
         """
-        merged=True  -> returns one dict {tradition -> text}
-        merged=False -> returns list of analysis dicts (raw)
+        merged=True  -> returns one read-only mapping {tradition -> text}
+        merged=False -> returns list of analysis dicts (raw copies)
         merge_policy: "first" | "last" | "concat"
           - first: first seen wins
           - last: last seen wins (default)
           - concat: join duplicates with " / "
         """
         d = invert_digit(digit) if inverted else digit
-        entries = self._by_digit.get(d, [])
-        raw_list = [dict(e.analysis) for e in entries]
-
-        patch = self._patches.get(d, {})
 
         if not merged:
+            raw_list = [dict(e.analysis) for e in self._digit_entries(d)]
             # Apply patch as an extra "virtual" analysis entry at the end (if any).
+            patch = self._patches.get(d, {})
             if patch:
                 raw_list.append(dict(patch))
             return raw_list
 
-        merged_map: Dict[str, str] = {}
-        for e in entries:
-            for k, v in e.analysis.items():
-                merged_map = self._merge_key(merged_map, k, v, merge_policy=merge_policy)
-
-        for k, v in patch.items():
-            merged_map = self._merge_key(merged_map, k, v, merge_policy=merge_policy)
-
-        return merged_map
+        return self._cached(d, ("merged", merge_policy), lambda: self._build_merged(d, merge_policy))
 
     def get_tradition_text(
         self,
@@ -129,13 +216,10 @@ class PiOntology:
         inverted: bool = False,
         default: Optional[str] = None,
     ) -> Optional[str]:
-        analysis = self.get_analysis(digit, inverted=inverted, merged=True)
-        # normalize key match (case-insensitive)
-        t = tradition.strip().lower()
-        for k, v in analysis.items():
-            if k.strip().lower() == t:
-                return v
-        return default
+        d = invert_digit(digit) if inverted else digit
+        # normalize key match (case-insensitive), first matching key wins
+        folded = self._cached(d, ("folded", "last"), lambda: self._build_folded(d, "last"))
+        return folded.get(tradition.strip().lower(), default)
 
     def patch_digit(self, digit: int, patch: Dict[str, str], *, inverted: bool = False) -> None:
         """
@@ -147,6 +231,9 @@ class PiOntology:
             self._patches[d] = {}
         for k, v in patch.items():
             self._patches[d][str(k)] = str(v)
+        self._invalidate(d)
+        for listener in self._patch_listeners:
+            listener(d)
 
     def summarize_digit(
         self,
@@ -159,16 +246,73 @@ class PiOntology:
         """
         Returns a short list of (tradition, excerpt) items for display/debug.
         """
-        analysis = self.get_analysis(digit, inverted=inverted, merged=True, merge_policy=merge_policy)
-        items = sorted(analysis.items(), key=lambda kv: kv[0].lower())
-        out: List[Tuple[str, str]] = []
-        for k, v in items[:max_items]:
-            excerpt = self._excerpt(v, 220)
-            out.append((k, excerpt))
-        return out
+        d = invert_digit(digit) if inverted else digit
+
+        def build() -> Tuple[Tuple[str, str], ...]:
+            analysis = self.get_analysis(d, merged=True, merge_policy=merge_policy)
+            items = sorted(analysis.items(), key=lambda kv: kv[0].lower())
+            return tuple((k, self._excerpt(v, 220)) for k, v in items[:max_items])
+
+        return list(self._cached(d, ("summary", merge_policy, max_items), build))
+
+    def view_cache_stats(self) -> ViewCacheStats:
+        """Snapshot of the merged-view cache counters."""
+        s = self._view_stats
+        size = sum(len(v) for v in self._views.values())
+        return ViewCacheStats(hits=s.hits, misses=s.misses, invalidations=s.invalidations, size=size)
 
     # ---------- internals ----------
 
+    def _init_empty(self, path: str | Path) -> None:
+        """
+        Every instance attribute, for an ontology with no entries yet.
+        Subclasses with their own loading (lazy, shared memory) call this
+        instead of PiOntology.__init__, then fill in their data.
+        """
+        self.path = Path(path)
+        self._entries: List[DigitEntry] = []
+        self._by_digit: Dict[int, List[DigitEntry]] = {}
+        self._patches: Dict[int, Dict[str, str]] = {}
+        # digit -> {(kind, *params) -> cached view}; see _cached()
+        self._views: Dict[int, Dict[Tuple[Any, ...], Any]] = {}
+        self._view_stats = ViewCacheStats()
+        self._patch_listeners: List[Callable[[int], None]] = []
+
+    def _digit_entries(self, d: int) -> Iterable[DigitEntry]:
+        """Entries of digit `d` in file order (the one place entries are read from)."""
+        return self._by_digit.get(d, ())
+
+    def _cached(self, d: int, key: Tuple[Any, ...], build: Any) -> Any:
+        views = self._views.get(d)
+        if views is not None and key in views:
+            self._view_stats.hits += 1
+            return views[key]
+        self._view_stats.misses += 1
+        value = build()
+        self._views.setdefault(d, {})[key] = value
+        return value
+
+    def _invalidate(self, d: int) -> None:
+        if self._views.pop(d, None) is not None:
+            self._view_stats.invalidations += 1
+
+    def _build_merged(self, d: int, merge_policy: str) -> Mapping[str, str]:
+        merged_map: Dict[str, str] = {}
+        for e in self._digit_entries(d):
+            for k, v in e.analysis.items():
+                merged_map = self._merge_key(merged_map, k, v, merge_policy=merge_policy)
+
+        for k, v in self._patches.get(d, {}).items():
+            merged_map = self._merge_key(merged_map, k, v, merge_policy=merge_policy)
+
+        return MappingProxyType(merged_map)
+
+    def _build_folded(self, d: int, merge_policy: str) -> Mapping[str, str]:
+        folded: Dict[str, str] = {}
+        for k, v in self.get_analysis(d, merged=True, merge_policy=merge_policy).items():
+            folded.setdefault(k.strip().lower(), v)
+        return MappingProxyType(folded)
+
     @staticmethod
     def _read_text(path: Path) -> str:
         if not path.exists():
@@ -183,9 +327,11 @@ class PiOntology:
         """
         pi_ontology.json may be malformed (e.g., concatenated arrays: `][`).
         Strategy:
+          0) drop a markdown code fence around the file (strip_code_fence)
           1) try json.loads
           2) if fails, repair common pattern: `]\s*\[` -> `,`
         """
+        raw = strip_code_fence(raw)
         try:
             return json.loads(raw)
         except json.JSONDecodeError:
@@ -209,40 +355,48 @@ class PiOntology:
 
         entries: List[DigitEntry] = []
         for obj in data:
-            if not isinstance(obj, dict):
-                continue
-            if "digit" not in obj or "analysis" not in obj:
-                continue
-            digit = obj.get("digit")
-            index = obj.get("index", -1)
-            analysis = obj.get("analysis", {})
-            if not isinstance(digit, int):
-                # sometimes digit could be string
-                try:
-                    digit = int(digit)
-                except Exception:
-                    continue
-            if not isinstance(index, int):
-                try:
-                    index = int(index)
-                except Exception:
-                    index = -1
-            if not isinstance(analysis, dict):
-                continue
-
-            # enforce string->string in analysis
-            clean_analysis: Dict[str, str] = {}
-            for k, v in analysis.items():
-                if v is None:
-                    continue
-                clean_analysis[str(k)] = str(v)
-
-            entries.append(DigitEntry(index=index, digit=digit, analysis=clean_analysis))
+            entry = PiOntology._normalize_entry(obj)
+            if entry is not None:
+                entries.append(entry)
 
         if not entries:
             raise OntologyError("No usable entries found in pi_ontology.json.")
         return entries
 
+    @staticmethod
+    def _normalize_entry(obj: Any) -> Optional[DigitEntry]:
+        """One {index, digit, analysis} object -> DigitEntry, or None if unusable."""
+        if not isinstance(obj, dict):
+            return None
+        if "digit" not in obj or "analysis" not in obj:
+            return None
+        # sometimes digit could be string
+        digit = PiOntology._coerce_int(obj.get("digit"))
+        if digit is None:
+            return None
+        index = PiOntology._coerce_int(obj.get("index", -1), -1)
+        analysis = obj.get("analysis", {})
+        if not isinstance(analysis, dict):
+            return None
+
+        # enforce string->string in analysis
+        clean_analysis: Dict[str, str] = {}
+        for k, v in analysis.items():
+            if v is None:
+                continue
+            clean_analysis[str(k)] = str(v)
+
+        return DigitEntry(index=index, digit=digit, analysis=clean_analysis)
+
+    @staticmethod
+    def _coerce_int(value: Any, default: Optional[int] = None) -> Optional[int]:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(value)
+        except Exception:
+            return default
+
     @staticmethod
     def _index_by_digit(entries: Iterable[DigitEntry]) -> Dict[int, List[DigitEntry]]:
         by: Dict[int, List[DigitEntry]] = {}
@@ -285,6 +439,26 @@ class PiOntology:
         return t if len(t) <= n else (t[: n - 1] + "…")
 
 
+# -------------------------
+# digit -> traits projection
+# -------------------------
+
+@lru_cache(maxsize=1)
+def default_projection() -> TraitProjection:
+    """Projection compiled once from docs/traits_schema.md (see traits.py)."""
+    return TraitProjection()
+
+
+def digit_to_traits(digit: int) -> TraitView:
+    """Shared read-only {trait -> weight} view for an archetype digit (0..9)."""
+    return default_projection().vector(digit)
+
+
+def digits_to_traits(digits: Iterable[int]) -> array:
+    """M archetype digits -> flat M x N trait matrix (row-major array('d'))."""
+    return default_projection().project(digits)
+
+
 if __name__ == "__main__":
     # Minimal smoke test (expects repo layout).
     onto = PiOntology("data/pi_ontology.json")
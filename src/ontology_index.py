@@ -0,0 +1,273 @@
+# Ame-Artificielle/src/ontology_index.py
+"""
+Full-text inverted index over PiOntology tradition texts.
+
+One document per distinct (digit, tradition, text). A pi-indexed ontology
+repeats a digit's texts at every position of that digit, so each document
+keeps the list of entry indexes it occurs at instead of being indexed once
+per position; index size and query cost follow the number of distinct
+texts, not the number of positions. Patched traditions are documents too.
+Text is tokenized accent-insensitively (same NFKD stripping as
+numerology.normalize_name), so "equilibre" finds "équilibre".
+
+Query syntax (clauses are OR-ed, scores add up, BM25):
+  jupiter            term
+  "unité divine"     phrase (consecutive tokens)
+  harmon*            prefix
+Results can be filtered by digit (optionally given as inverted digits, like
+the PiOntology API) and by tradition name.
+
+The index follows patch_digit(): only the patched digit's patch
+occurrences are replaced.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+from operator import itemgetter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .numerology import _strip_accents
+from .ontology import PiOntology, invert_digit
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+_LIGATURES = str.maketrans({"œ": "oe", "æ": "ae"})
+
+PATCH_INDEX = -1  # occurrence index reported for patched traditions
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, accent-free alphanumeric tokens."""
+    return _TOKEN_RE.findall(_strip_accents(text.lower().translate(_LIGATURES)))
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    digit: int
+    tradition: str
+    indexes: Tuple[int, ...]  # DigitEntry.index values carrying this text (PATCH_INDEX for a patch)
+    score: float
+
+    @property
+    def inverted_digit(self) -> int:
+        return invert_digit(self.digit) if 0 <= self.digit <= 9 else self.digit
+
+
+class OntologyIndex:
+    """Positional inverted index with BM25 ranking (k1, b as usual)."""
+
+    def __init__(self, onto: PiOntology, *, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._onto = onto
+
+        # doc id -> (digit, tradition, lower-cased tradition, text, length in tokens); None once removed
+        self._docs: List[Optional[Tuple[int, str, str, str, int]]] = []
+        self._doc_terms: List[Tuple[str, ...]] = []
+        self._occurrences: List[List[int]] = []
+        self._doc_ids: Dict[Tuple[int, str, str], int] = {}
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+        self._patch_docs: Dict[int, List[int]] = {}  # digit -> doc ids holding a PATCH_INDEX occurrence
+        self._n_docs = 0
+        self._total_len = 0
+        self._sorted_terms: Optional[List[str]] = None
+        # term -> {doc id -> BM25 weight}; valid until the next add/remove changes N or avgdl
+        self._impact_cache: Dict[str, Dict[int, float]] = {}
+
+        for d in onto.digits_present:
+            for e in onto.get_entries(d):
+                for tradition, text in e.analysis.items():
+                    self._add(e.digit, tradition, e.index, text)
+        for d in onto.patched_digits:
+            self._index_patch(d)
+
+        onto.add_patch_listener(self._index_patch)
+
+    # ---------- public API ----------
+
+    def __len__(self) -> int:
+        """Number of distinct documents."""
+        return self._n_docs
+
+    def search(
+        self,
+        query: str,
+        *,
+        digits: Optional[Iterable[int]] = None,
+        inverted: bool = False,
+        traditions: Optional[Iterable[str]] = None,
+        limit: int = 10,
+    ) -> List[SearchHit]:
+        """
+        Rank documents matching any query clause.
+        digits: keep only these digits (interpreted as inverted digits if inverted=True).
+        traditions: keep only these tradition names (case-insensitive).
+        """
+        scores: Dict[int, float] = {}
+        for tokens, prefix in self._parse(query):
+            if prefix:
+                for term in self._expand_prefix(tokens[0]):
+                    self._accumulate(scores, self._impacts(term))
+            elif len(tokens) == 1:
+                self._accumulate(scores, self._impacts(tokens[0]))
+            else:
+                self._score_phrase(tokens, scores)
+
+        if digits is not None or traditions is not None:
+            digit_set = None if digits is None else {invert_digit(d) if inverted else d for d in digits}
+            tradition_set = None if traditions is None else {t.strip().lower() for t in traditions}
+            docs = self._docs
+            scores = {
+                doc_id: score for doc_id, score in scores.items()
+                if (digit_set is None or docs[doc_id][0] in digit_set)
+                and (tradition_set is None or docs[doc_id][2] in tradition_set)
+            }
+
+        hits = []
+        for doc_id, score in heapq.nlargest(limit, scores.items(), key=itemgetter(1)):
+            digit, tradition, _, _, _ = self._docs[doc_id]
+            indexes = tuple(self._occurrences[doc_id])
+            hits.append(SearchHit(digit=digit, tradition=tradition, indexes=indexes, score=score))
+        return hits
+
+    # ---------- indexing ----------
+
+    def _add(self, digit: int, tradition: str, index: int, text: str) -> int:
+        key = (digit, tradition, text)
+        doc_id = self._doc_ids.get(key)
+        if doc_id is not None:
+            self._occurrences[doc_id].append(index)
+            return doc_id
+
+        tokens = tokenize(f"{tradition} {text}")
+        doc_id = len(self._docs)
+        positions: Dict[str, List[int]] = {}
+        for pos, tok in enumerate(tokens):
+            positions.setdefault(tok, []).append(pos)
+        for tok, pos_list in positions.items():
+            postings = self._postings.get(tok)
+            if postings is None:
+                postings = self._postings[tok] = {}
+                self._sorted_terms = None
+            postings[doc_id] = pos_list
+        self._docs.append((digit, tradition, tradition.strip().lower(), text, len(tokens)))
+        self._doc_terms.append(tuple(positions))
+        self._occurrences.append([index])
+        self._doc_ids[key] = doc_id
+        self._n_docs += 1
+        self._total_len += len(tokens)
+        self._impact_cache.clear()
+        return doc_id
+
+    def _remove_occurrence(self, doc_id: int, index: int) -> None:
+        occurrences = self._occurrences[doc_id]
+        occurrences.remove(index)
+        if occurrences:
+            return
+        digit, tradition, _, text, length = self._docs[doc_id]
+        for tok in self._doc_terms[doc_id]:
+            postings = self._postings[tok]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[tok]
+                self._sorted_terms = None
+        del self._doc_ids[(digit, tradition, text)]
+        self._docs[doc_id] = None
+        self._doc_terms[doc_id] = ()
+        self._n_docs -= 1
+        self._total_len -= length
+        self._impact_cache.clear()
+
+    def _index_patch(self, digit: int) -> None:
+        for doc_id in self._patch_docs.pop(digit, []):
+            self._remove_occurrence(doc_id, PATCH_INDEX)
+        patch = self._onto.get_patch(digit)
+        if patch:
+            self._patch_docs[digit] = [self._add(digit, t, PATCH_INDEX, text) for t, text in patch.items()]
+
+    # ---------- querying ----------
+
+    @staticmethod
+    def _parse(query: str) -> List[Tuple[List[str], bool]]:
+        clauses: List[Tuple[List[str], bool]] = []
+        for phrase, word in _QUERY_RE.findall(query):
+            if phrase:
+                tokens = tokenize(phrase)
+                if tokens:
+                    clauses.append((tokens, False))
+                continue
+            prefix = word.endswith("*")
+            tokens = tokenize(word)
+            if not tokens:
+                continue
+            if prefix and len(tokens) == 1:
+                clauses.append((tokens, True))
+            else:
+                # "l’équilibre" tokenizes to two tokens: match them as a phrase
+                clauses.append((tokens, False))
+        return clauses
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        lo = bisect.bisect_left(terms, prefix)
+        hi = bisect.bisect_left(terms, prefix + "\uffff")
+        return terms[lo:hi]
+
+    def _idf(self, df: int) -> float:
+        return math.log(1.0 + (self._n_docs - df + 0.5) / (df + 0.5))
+
+    def _impacts(self, term: str) -> Dict[int, float]:
+        impacts = self._impact_cache.get(term)
+        if impacts is not None:
+            return impacts
+        postings = self._postings.get(term)
+        if not postings:
+            return {}
+        idf = self._idf(len(postings))
+        k1, b = self.k1, self.b
+        avgdl = self._total_len / self._n_docs
+        docs = self._docs
+        impacts = {}
+        for doc_id, positions in postings.items():
+            tf = len(positions)
+            dl = docs[doc_id][4]
+            impacts[doc_id] = idf * tf * (k1 + 1.0) / (tf + k1 * (1.0 - b + b * dl / avgdl))
+        self._impact_cache[term] = impacts
+        return impacts
+
+    @staticmethod
+    def _accumulate(scores: Dict[int, float], impacts: Dict[int, float]) -> None:
+        if not scores:
+            scores.update(impacts)
+            return
+        get = scores.get
+        for doc_id, w in impacts.items():
+            scores[doc_id] = get(doc_id, 0.0) + w
+
+    def _score_phrase(self, tokens: List[str], scores: Dict[int, float]) -> None:
+        lists: List[Dict[int, List[int]]] = []
+        for tok in tokens:
+            postings = self._postings.get(tok)
+            if not postings:
+                return
+            lists.append(postings)
+
+        first, rest = lists[0], lists[1:]
+        matched: List[int] = []
+        for doc_id in min(lists, key=len):
+            if not all(doc_id in p for p in lists):
+                continue
+            following = [set(p[doc_id]) for p in rest]
+            if any(all(start + i in pos for i, pos in enumerate(following, 1)) for start in first[doc_id]):
+                matched.append(doc_id)
+
+        for tok in tokens:
+            impacts = self._impacts(tok)
+            self._accumulate(scores, {doc_id: impacts[doc_id] for doc_id in matched})
@@ -0,0 +1,224 @@
+# Ame-Artificielle/src/ontology_lazy.py
+"""
+Lazy, streaming loader for very large pi-indexed ontologies.
+
+PiOntology reads the whole JSON into one string, parses it and keeps every
+analysis dict alive. LazyPiOntology instead stream-parses the file once,
+one array element at a time, and keeps only:
+
+  - a compact table per entry: index, digit, byte offset and byte length
+    (array-backed, ~28 bytes per entry), plus per-digit entry ids
+  - concatenated arrays (`][`) and a markdown code fence around the file
+    are accepted under the same rules as PiOntology (ontology.strip_code_fence,
+    lenient `][` repair); any other text outside the arrays is an error
+
+Analysis dicts are materialized on demand (one json.loads of the entry's
+byte range in a read-only map of the file) through a bounded LRU cache, so
+resident memory stays flat as the ontology grows. Merged views, patches and the
+rest of the PiOntology API behave exactly as in the eager loader.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import mmap
+import re
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .ontology import DigitEntry, OntologyError, PiOntology, strip_code_fence
+
+ENTRY_CACHE_SIZE = 4096
+
+READ_CHUNK = 1 << 20
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# _scan states inside an array
+_FIRST = 0  # after `[`: an element or `]`
+_ELEMENT = 1  # after `,`: an element
+_SEPARATOR = 2  # after an element: `,` or `]`
+
+
+class LazyPiOntology(PiOntology):
+    """
+    PiOntology over an offset table; entries are parsed when first read.
+    cache_size bounds the number of materialized entries kept alive.
+    """
+
+    def __init__(self, path: str | Path = "data/pi_ontology.json", *, cache_size: int = ENTRY_CACHE_SIZE) -> None:
+        self._init_empty(path)
+
+        self._index = array("q")
+        self._digit = array("q")
+        self._offset = array("Q")
+        self._length = array("I")
+        self._rows: Dict[int, array] = {}
+
+        if not self.path.exists():
+            raise OntologyError(
+                f"Ontology file not found: {self.path} "
+                f"(expected in repo at data/pi_ontology.json)."
+            )
+        with self.path.open("rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise OntologyError("No usable entries found in pi_ontology.json.") from e
+
+        self._scan()
+        if not self._index:
+            self._mm.close()
+            raise OntologyError("No usable entries found in pi_ontology.json.")
+
+        self._entry_at = lru_cache(maxsize=cache_size)(self._materialize)
+
+    def __len__(self) -> int:
+        """Number of usable entries."""
+        return len(self._index)
+
+    def close(self) -> None:
+        """Drop cached entries/views and unmap the file."""
+        self._entry_at.cache_clear()
+        self._views.clear()
+        self._mm.close()
+
+    def entry_cache_info(self):
+        """functools-style (hits, misses, maxsize, currsize) of the entry cache."""
+        return self._entry_at.cache_info()
+
+    def iter_entries(self) -> Iterator[DigitEntry]:
+        """All entries in file order (materialized one at a time)."""
+        for i in range(len(self._index)):
+            yield self._entry_at(i)
+
+    # ---------- PiOntology hooks ----------
+
+    @property
+    def digits_present(self) -> List[int]:
+        return sorted(self._rows)
+
+    def _digit_entries(self, d: int) -> Iterator[DigitEntry]:
+        for i in self._rows.get(d, ()):
+            yield self._entry_at(i)
+
+    # ---------- internals ----------
+
+    def _materialize(self, i: int) -> DigitEntry:
+        start = self._offset[i]
+        obj = json.loads(self._mm[start:start + self._length[i]].decode("utf-8"))
+        entry = self._normalize_entry(obj)
+        if entry is None or entry.digit != self._digit[i]:
+            raise OntologyError(f"Ontology file changed on disk since it was scanned: {self.path}")
+        return entry
+
+    def _scan(self) -> None:
+        """
+        One sequential pass over the file in READ_CHUNK windows. Each array
+        element is decoded on its own (json's C scanner) and dropped right
+        after its table row is written, so only one entry is alive at a time.
+        """
+        decoder = json.JSONDecoder()
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+        buf = ""
+        i = 0
+        byte_pos = 0  # file offset of buf[i]
+        in_array = False
+        expect = _FIRST  # inside an array: what may come next (JSON comma rules)
+        eof = False
+        outside: List[str] = []  # text outside the arrays, checked against strip_code_fence()
+        lead: Optional[str] = None  # text before the first array
+
+        with self.path.open("rb") as f:
+            while True:
+                if i >= len(buf):
+                    if eof:
+                        break
+                    chunk = f.read(READ_CHUNK)
+                    eof = not chunk
+                    buf, i = utf8.decode(chunk, final=eof), 0
+                    continue
+
+                c = buf[i]
+                if in_array:
+                    j = _WHITESPACE_RE.match(buf, i).end()
+                    if j > i:
+                        byte_pos += j - i
+                        i = j
+                        continue
+                    if c == "]" and expect != _ELEMENT:
+                        in_array = False
+                        byte_pos += 1
+                        i += 1
+                        continue
+                    if c == "," and expect == _SEPARATOR:
+                        expect = _ELEMENT
+                        byte_pos += 1
+                        i += 1
+                        continue
+                    if expect == _SEPARATOR or c in ",]":
+                        wanted = "',' or ']'" if expect == _SEPARATOR else "an array element"
+                        raise OntologyError(f"Failed to parse {self.path} at byte {byte_pos}: expected {wanted}.")
+                    try:
+                        obj, end = decoder.raw_decode(buf, i)
+                    except json.JSONDecodeError as e:
+                        if eof:
+                            raise OntologyError(f"Failed to parse {self.path} at byte {byte_pos}.") from e
+                        # element cut by the window: pull in more text and retry
+                        chunk = f.read(READ_CHUNK)
+                        eof = not chunk
+                        buf, i = buf[i:] + utf8.decode(chunk, final=eof), 0
+                        continue
+                    length = len(buf[i:end].encode("utf-8"))
+                    self._add_row(obj, byte_pos, length)
+                    byte_pos += length
+                    i = end
+                    expect = _SEPARATOR
+                elif c == "[":
+                    # first array, or the next one of a concatenated `][` file
+                    text = "".join(outside)
+                    outside.clear()
+                    if lead is None:
+                        lead = text
+                    elif text.strip():
+                        raise OntologyError(f"Unexpected text between JSON arrays in {self.path}.")
+                    in_array = True
+                    expect = _FIRST
+                    byte_pos += 1
+                    i += 1
+                elif c == "{":
+                    raise OntologyError("pi_ontology.json root must be a JSON array.")
+                else:
+                    # whitespace or a markdown fence around the arrays
+                    outside.append(c)
+                    byte_pos += len(c.encode("utf-8"))
+                    i += 1
+
+        if in_array:
+            raise OntologyError(f"Ontology file is truncated: {self.path}")
+        if lead is None:
+            raise OntologyError("pi_ontology.json root must be a JSON array.")
+        if strip_code_fence(lead + "[]" + "".join(outside)).strip() != "[]":
+            raise OntologyError(f"Unexpected text around the JSON arrays in {self.path} (only a markdown code fence is allowed).")
+
+    def _add_row(self, obj: Any, start: int, length: int) -> None:
+        # Same acceptance rules as PiOntology._normalize_entry, without copying the analysis.
+        if not isinstance(obj, dict) or "digit" not in obj or not isinstance(obj.get("analysis"), dict):
+            return
+        digit = self._coerce_int(obj["digit"])
+        if digit is None:
+            return
+        index = self._coerce_int(obj.get("index", -1), -1)
+
+        row = len(self._index)
+        self._index.append(index)
+        self._digit.append(digit)
+        self._offset.append(start)
+        self._length.append(length)
+        ids = self._rows.get(digit)
+        if ids is None:
+            ids = self._rows[digit] = array("I")
+        ids.append(row)
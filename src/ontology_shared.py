@@ -0,0 +1,224 @@
+# Ame-Artificielle/src/ontology_shared.py
+"""
+Shared-memory ontology for multi-process deployments.
+
+One process publishes a normalized PiOntology into a
+multiprocessing.shared_memory segment:
+
+    segment = SharedOntologySegment(PiOntology("pi_ontology.json"))
+    ... hand segment.name to the workers ...
+    segment.close(); segment.unlink()
+
+Workers attach read-only and use the usual PiOntology API
+(get_analysis, get_tradition_text, summarize_digit, digits_present, ...):
+
+    onto = SharedPiOntology(name)
+
+Layout (same string/entry/pair/by-digit encoding as ontology_snapshot):
+
+  header   magic, version, section counts
+  strings  deduplicated string table
+  entries  (index, digit, first pair, pair count)
+  pairs    (key id, value id)
+  digits   (digit, start, count) + entry-id list
+  views    (digit, kind, first, count) into view pairs; kind is a merge
+           policy (precomputed merged view) or PATCH (the digit's patch)
+  vpairs   (key id, value id)
+
+Attached processes share one copy of the data in the segment, not a
+private parse of the JSON each. Patches are decoded on attach; a digit's
+entries are decoded the first time they are read (the _digit_entries hook)
+and kept; precomputed merged views are decoded on first use and cached by the
+inherited PiOntology view cache.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .ontology import DigitEntry, OntologyError, PiOntology
+from .ontology_snapshot import _DIGIT, _ENTRY, _PAIR, StringTable, encode_entries
+
+MAGIC = b"ASESHM\x00\x00"
+VERSION = 1
+
+# magic, version, n_strings, n_entries, n_pairs, n_digits, n_refs, n_views, n_view_pairs
+_HEADER = struct.Struct("<8sIIIIIIII")
+_VIEW = struct.Struct("<iBxxxII")
+
+MERGE_POLICIES = ("first", "last", "concat")
+_PATCH_KIND = 255
+
+
+class SharedOntologySegment:
+    """Owner side: encodes `onto` (entries, patches, merged views) into a new segment."""
+
+    def __init__(
+        self,
+        onto: PiOntology,
+        *,
+        name: Optional[str] = None,
+        policies: Sequence[str] = MERGE_POLICIES,
+    ) -> None:
+        entries = [e for d in onto.digits_present for e in onto.get_entries(d)]
+
+        strings = StringTable()
+        entry_blob, pair_blob, digit_blob, n_pairs, n_digits, n_refs = encode_entries(entries, strings)
+
+        view_blob = bytearray()
+        vpair_blob = bytearray()
+        n_vpairs = 0
+        n_views = 0
+
+        def add_view(digit: int, kind: int, mapping: Mapping[str, str]) -> None:
+            nonlocal n_vpairs, n_views
+            view_blob.extend(_VIEW.pack(digit, kind, n_vpairs, len(mapping)))
+            for k, v in mapping.items():
+                vpair_blob.extend(_PAIR.pack(strings.sid(k), strings.sid(v)))
+                n_vpairs += 1
+            n_views += 1
+
+        for d in sorted(set(onto.digits_present) | set(onto.patched_digits)):
+            for policy in policies:
+                add_view(d, MERGE_POLICIES.index(policy), onto.get_analysis(d, merged=True, merge_policy=policy))
+        for d in onto.patched_digits:
+            add_view(d, _PATCH_KIND, onto.get_patch(d))
+
+        header = _HEADER.pack(
+            MAGIC, VERSION, len(strings), len(entries), n_pairs, n_digits, n_refs, n_views, n_vpairs,
+        )
+        payload = b"".join((header, strings.encode(), entry_blob, pair_blob, digit_blob, view_blob, vpair_blob))
+
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+        self._shm.buf[: len(payload)] = payload
+        self.size = len(payload)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedOntologySegment":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+        self.unlink()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        # Attaching must not hand the segment's lifetime to this process's
+        # resource tracker (it would unlink it when the worker exits). Only
+        # POSIX segments are tracked, under their OS name: "/" + shm.name.
+        if os.name == "posix":
+            resource_tracker.unregister("/" + shm.name.lstrip("/"), "shared_memory")
+        return shm
+
+
+class SharedPiOntology(PiOntology):
+    """
+    Read-only PiOntology backed by a segment published by SharedOntologySegment.
+    patch_digit() raises OntologyError: patch on the owner and republish.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._init_empty(f"shm://{name}")
+
+        self._shm = _attach(name)
+        buf = self._buf = self._shm.buf
+        magic, version, n_strings, n_entries, n_pairs, n_digits, n_refs, n_views, n_vpairs = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self._shm.close()
+            raise OntologyError(f"Shared memory segment {name!r} is not a published ontology.")
+
+        pos = _HEADER.size
+        self._str_offsets = pos
+        pos += 4 * (n_strings + 1)
+        self._str_blob = pos
+        pos += struct.unpack_from("<I", buf, self._str_offsets + 4 * n_strings)[0]
+        self._entries_at = pos
+        pos += n_entries * _ENTRY.size
+        self._pairs_at = pos
+        pos += n_pairs * _PAIR.size
+
+        self._digit_rows: Dict[int, Tuple[int, int]] = {}
+        for i in range(n_digits):
+            d, start, count = _DIGIT.unpack_from(buf, pos + i * _DIGIT.size)
+            self._digit_rows[d] = (start, count)
+        pos += n_digits * _DIGIT.size
+        self._refs_at = pos
+        pos += 4 * n_refs
+
+        self._view_rows: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        for i in range(n_views):
+            d, kind, first, count = _VIEW.unpack_from(buf, pos + i * _VIEW.size)
+            self._view_rows[(d, kind)] = (first, count)
+        pos += n_views * _VIEW.size
+        self._vpairs_at = pos
+
+        for (d, kind), row in self._view_rows.items():
+            if kind == _PATCH_KIND:
+                self._patches[d] = self._decode_pairs(self._vpairs_at, *row)
+
+    def close(self) -> None:
+        """Drop cached views and detach from the segment."""
+        self._views.clear()
+        self._buf = None
+        self._shm.close()
+
+    # ---------- decoding ----------
+
+    def _str(self, sid: int) -> str:
+        a, b = struct.unpack_from("<II", self._buf, self._str_offsets + 4 * sid)
+        return str(self._buf[self._str_blob + a:self._str_blob + b], "utf-8")
+
+    def _decode_pairs(self, at: int, first: int, count: int) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        for k, v in _PAIR.iter_unpack(self._buf[at + first * _PAIR.size:at + (first + count) * _PAIR.size]):
+            out[self._str(k)] = self._str(v)
+        return out
+
+    def _entry(self, i: int) -> DigitEntry:
+        index, digit, first, count = _ENTRY.unpack_from(self._buf, self._entries_at + i * _ENTRY.size)
+        return DigitEntry(index=index, digit=digit, analysis=self._decode_pairs(self._pairs_at, first, count))
+
+    # ---------- PiOntology hooks ----------
+
+    @property
+    def digits_present(self) -> List[int]:
+        return sorted(self._digit_rows)
+
+    def _digit_entries(self, d: int) -> List[DigitEntry]:
+        # _by_digit doubles as the cache of decoded digits
+        entries = self._by_digit.get(d)
+        if entries is None:
+            if d not in self._digit_rows:
+                return []
+            start, count = self._digit_rows[d]
+            refs = struct.unpack_from(f"<{count}I", self._buf, self._refs_at + 4 * start)
+            entries = self._by_digit[d] = [self._entry(i) for i in refs]
+        return entries
+
+    def patch_digit(self, digit: int, patch: Dict[str, str], *, inverted: bool = False) -> None:
+        raise OntologyError("SharedPiOntology is read-only; patch the published ontology and republish.")
+
+    def _build_merged(self, d: int, merge_policy: str) -> Mapping[str, str]:
+        if merge_policy in MERGE_POLICIES:
+            row = self._view_rows.get((d, MERGE_POLICIES.index(merge_policy)))
+            if row is not None:
+                return MappingProxyType(self._decode_pairs(self._vpairs_at, *row))
+        # Policy not precomputed (or digit absent): merge from the entries.
+        return super()._build_merged(d, merge_policy)
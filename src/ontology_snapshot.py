@@ -0,0 +1,187 @@
+# Ame-Artificielle/src/ontology_snapshot.py
+"""
+Compiled binary snapshot of pi_ontology.json.
+
+PiOntology normally re-reads the JSON, retries with the `][` repair and
+normalizes every object on each construction. compile_snapshot() does that
+once and writes a versioned file that load_snapshot() maps read-only:
+
+  header   magic, version, sha256 of the source JSON, sha256 of the payload,
+           section counts
+  strings  deduplicated string table (u32 offsets + one UTF-8 blob)
+  entries  (index, digit, first pair, pair count) per entry
+  pairs    (key string id, value string id) per analysis item
+  digits   by-digit index: (digit, start, count) rows into an entry-id list
+
+load_or_compile() rebuilds the snapshot only when the source hash changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from .ontology import DigitEntry, OntologyError, PiOntology
+
+MAGIC = b"ASEONTO\x00"
+VERSION = 1
+
+# magic, version, source sha256, payload sha256, n_strings, n_entries, n_pairs, n_digits, n_digit_refs
+_HEADER = struct.Struct("<8sI32s32sIIIII")
+_ENTRY = struct.Struct("<qiII")
+_PAIR = struct.Struct("<II")
+_DIGIT = struct.Struct("<iII")
+
+Snapshot = Tuple[List[DigitEntry], Dict[int, List[DigitEntry]]]
+
+
+class StringTable:
+    """Deduplicating string table: sid() hands out ids, encode() lays them out."""
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def sid(self, s: str) -> int:
+        i = self._ids.get(s)
+        if i is None:
+            i = self._ids[s] = len(self._ids)
+        return i
+
+    def encode(self) -> bytes:
+        """u32 offsets (n + 1) followed by the concatenated UTF-8 blob."""
+        encoded = [s.encode("utf-8") for s in self._ids]
+        offsets = [0]
+        for b in encoded:
+            offsets.append(offsets[-1] + len(b))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+def snapshot_path_for(source: Union[str, Path]) -> Path:
+    source = Path(source)
+    return source.with_name(source.name + ".snap")
+
+
+def source_hash(source: Union[str, Path]) -> bytes:
+    try:
+        return hashlib.sha256(Path(source).read_bytes()).digest()
+    except FileNotFoundError as e:
+        raise OntologyError(f"Ontology file not found: {source}") from e
+
+
+def encode_entries(entries: List[DigitEntry], strings: StringTable) -> Tuple[bytes, bytes, bytes, int, int, int]:
+    """
+    Entry, pair and by-digit sections for `entries` (strings go to `strings`).
+    Returns (entry_blob, pair_blob, digit_blob, n_pairs, n_digits, n_refs).
+    """
+    sid = strings.sid
+    entry_blob = bytearray()
+    pair_blob = bytearray()
+    n_pairs = 0
+    for e in entries:
+        entry_blob += _ENTRY.pack(e.index, e.digit, n_pairs, len(e.analysis))
+        for k, v in e.analysis.items():
+            pair_blob += _PAIR.pack(sid(k), sid(v))
+            n_pairs += 1
+
+    by_digit = PiOntology._index_by_digit(entries)
+    position = {id(e): i for i, e in enumerate(entries)}
+    digit_blob = bytearray()
+    refs: List[int] = []
+    for d, members in by_digit.items():
+        digit_blob += _DIGIT.pack(d, len(refs), len(members))
+        refs.extend(position[id(e)] for e in members)
+    digit_blob += struct.pack(f"<{len(refs)}I", *refs)
+    return bytes(entry_blob), bytes(pair_blob), bytes(digit_blob), n_pairs, len(by_digit), len(refs)
+
+
+def compile_snapshot(source: Union[str, Path], snapshot: Union[str, Path, None] = None) -> Path:
+    """Parse + normalize `source` once and write its snapshot (atomically)."""
+    source = Path(source)
+    snapshot = Path(snapshot) if snapshot is not None else snapshot_path_for(source)
+
+    digest = source_hash(source)
+    raw = PiOntology._read_text(source)
+    entries = PiOntology._normalize_entries(PiOntology._parse_lenient_json(raw))
+
+    strings = StringTable()
+    entry_blob, pair_blob, digit_blob, n_pairs, n_digits, n_refs = encode_entries(entries, strings)
+    payload = strings.encode() + entry_blob + pair_blob + digit_blob
+    header = _HEADER.pack(
+        MAGIC, VERSION, digest, hashlib.sha256(payload).digest(),
+        len(strings), len(entries), n_pairs, n_digits, n_refs,
+    )
+
+    tmp = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp, snapshot)
+    return snapshot
+
+
+def load_snapshot(snapshot: Union[str, Path], *, expected_hash: bytes | None = None) -> Snapshot:
+    """
+    Map a snapshot and rebuild (entries, by_digit). Raises OntologyError if
+    the file is foreign, corrupt, or was compiled from a different source.
+    """
+    with open(snapshot, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            raise OntologyError(f"Ontology snapshot truncated: {snapshot}")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with mm:
+        (magic, version, digest, payload_hash,
+         n_strings, n_entries, n_pairs, n_digits, n_refs) = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise OntologyError(f"Not an ontology snapshot (or unsupported version): {snapshot}")
+        if expected_hash is not None and digest != expected_hash:
+            raise OntologyError(f"Ontology snapshot is stale: {snapshot}")
+        if hashlib.sha256(memoryview(mm)[_HEADER.size:]).digest() != payload_hash:
+            raise OntologyError(f"Ontology snapshot checksum mismatch: {snapshot}")
+
+        pos = _HEADER.size
+        offsets = struct.unpack_from(f"<{n_strings + 1}I", mm, pos)
+        pos += 4 * (n_strings + 1)
+        blob = mm[pos:pos + offsets[-1]]
+        strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n_strings)]
+        pos += offsets[-1]
+
+        entry_rows = list(_ENTRY.iter_unpack(mm[pos:pos + n_entries * _ENTRY.size]))
+        pos += n_entries * _ENTRY.size
+        pairs = list(_PAIR.iter_unpack(mm[pos:pos + n_pairs * _PAIR.size]))
+        pos += n_pairs * _PAIR.size
+        digit_rows = list(_DIGIT.iter_unpack(mm[pos:pos + n_digits * _DIGIT.size]))
+        pos += n_digits * _DIGIT.size
+        refs = struct.unpack_from(f"<{n_refs}I", mm, pos)
+
+    entries = [
+        DigitEntry(
+            index=index,
+            digit=digit,
+            analysis={strings[k]: strings[v] for k, v in pairs[first:first + count]},
+        )
+        for index, digit, first, count in entry_rows
+    ]
+    by_digit: Dict[int, List[DigitEntry]] = {}
+    for d, start, count in digit_rows:
+        by_digit[d] = [entries[i] for i in refs[start:start + count]]
+    return entries, by_digit
+
+
+def load_or_compile(source: Union[str, Path], snapshot: Union[str, Path, None] = None) -> Snapshot:
+    """Load the snapshot for `source`, recompiling it if missing, invalid or stale."""
+    snapshot = Path(snapshot) if snapshot is not None else snapshot_path_for(source)
+    digest = source_hash(source)
+    try:
+        return load_snapshot(snapshot, expected_hash=digest)
+    except (OSError, OntologyError, struct.error):
+        compile_snapshot(source, snapshot)
+        return load_snapshot(snapshot, expected_hash=digest)
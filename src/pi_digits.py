@@ -0,0 +1,380 @@
+# Ame-Artificielle/src/pi_digits.py
+"""
+Memory-mapped pi digit store ("Sillon" navigation).
+
+Digits are kept packed 4 bits per digit (BCD, high nibble first), so
+10^8 digits take 50 MB and bytes.hex() of any byte range is directly the
+digit string. Position 0 is the leading "3", as in DigitEntry.index.
+
+  store file   header (magic, version, CRC-32 of the packed digits,
+               n_digits) + packed digits
+  k-gram file  `<store>.kgram`: for every k-digit code, the sorted positions
+               where it starts (counting-sorted: 10^k + 1 offsets, then one
+               position array), built once by build_index(); its header
+               records the store's CRC-32, so an index built for other
+               digits is ignored even when the length matches
+
+find() reads one bucket of the k-gram index (or a contiguous bucket range
+for sequences shorter than k) instead of rescanning the digits; without an
+index it falls back to a chunked scan.
+
+Sources: compute_pi_digits() (Chudnovsky; ~1 s for 10^5 digits) or
+import_digit_text() for an external digit dump (10^8+ digits).
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import re
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+MAGIC = b"ASEPI4\x00\x00"
+KGRAM_MAGIC = b"ASEPIK\x00\x00"
+VERSION = 2
+_STORE_VERSIONS = (1, 2)  # v1 stores kept no checksum: computed on open
+DEFAULT_K = 6
+
+# magic, version, crc32, n_digits
+_HEADER = struct.Struct("<8sIIQ")
+# magic, version, k, n_digits, n_grams, store crc32
+_KGRAM_HEADER = struct.Struct("<8sIIQQIxxxx")
+
+_CHUNK = 1 << 20  # digits per chunk when scanning / importing / indexing
+_NON_DIGIT_RE = re.compile(r"[^0-9]+")
+
+
+@dataclass(frozen=True)
+class PiContext:
+    """Digits of pi around one position (`index`), clipped to the store bounds."""
+    index: int
+    start: int
+    digits: str
+
+    @property
+    def digit(self) -> int:
+        return int(self.digits[self.index - self.start])
+
+    @property
+    def before(self) -> str:
+        return self.digits[: self.index - self.start]
+
+    @property
+    def after(self) -> str:
+        return self.digits[self.index - self.start + 1:]
+
+
+# -------------------------
+# Producing digits
+# -------------------------
+
+def compute_pi_digits(n: int) -> str:
+    """First n digits of pi ("31415..."), Chudnovsky with binary splitting."""
+    if n < 1:
+        return ""
+    prec = n + 10
+    c3_24 = 640320 ** 3 // 24
+
+    def split(a: int, b: int):
+        if b - a == 1:
+            if a == 0:
+                p = q = 1
+            else:
+                p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+                q = a * a * a * c3_24
+            t = p * (13591409 + 545140134 * a)
+            return p, q, -t if a & 1 else t
+        m = (a + b) // 2
+        p1, q1, t1 = split(a, m)
+        p2, q2, t2 = split(m, b)
+        return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+    _, q, t = split(0, prec // 14 + 2)
+    one = 10 ** prec
+    pi = q * 426880 * math.isqrt(10005 * one * one) // t
+    return _int_digits(pi, prec + 1)[:n]
+
+
+def _int_digits(x: int, width: int) -> str:
+    # Divide and conquer: str() is quadratic and capped (int_max_str_digits) on big ints.
+    if width <= 2000:
+        return str(x).zfill(width)
+    low = width // 2
+    hi, lo = divmod(x, 10 ** low)
+    return _int_digits(hi, width - low) + _int_digits(lo, low)
+
+
+def write_digit_store(path: Union[str, Path], chunks: Iterable[str]) -> int:
+    """
+    Pack digit text into a store file (atomically); characters other than
+    0-9 (the "." of "3.14", newlines, ...) are dropped. Returns n_digits.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    n = 0
+    crc = 0
+    carry = ""
+    with tmp.open("wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+        for chunk in chunks:
+            digits = carry + _NON_DIGIT_RE.sub("", chunk)
+            even = len(digits) & ~1
+            packed = bytes.fromhex(digits[:even])
+            f.write(packed)
+            crc = zlib.crc32(packed, crc)
+            n += even
+            carry = digits[even:]
+        if carry:
+            packed = bytes.fromhex(carry + "f")
+            f.write(packed)
+            crc = zlib.crc32(packed, crc)
+            n += 1
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, crc, n))
+    os.replace(tmp, path)
+    return n
+
+
+def import_digit_text(src: Union[str, Path], dst: Union[str, Path]) -> int:
+    """Stream a digit text dump (e.g. "3.1415...") into a store file."""
+    with open(src, "r", encoding="ascii", errors="ignore") as f:
+        return write_digit_store(dst, iter(lambda: f.read(_CHUNK), ""))
+
+
+def kgram_path_for(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".kgram")
+
+
+# -------------------------
+# Store
+# -------------------------
+
+class PiDigitStore:
+    """
+    Read-only view over a store file.
+      store[i]            digit at position i (O(1))
+      store[a:b]          digit string
+      store.find("1415")  all positions where the sequence starts
+    """
+
+    def __init__(self, path: Union[str, Path], *, kgram_path: Union[str, Path, None] = None) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, crc, n = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version not in _STORE_VERSIONS:
+            self._mm.close()
+            raise ValueError(f"not a pi digit store (or unsupported version): {self.path}")
+        if version == 1:
+            with memoryview(self._mm) as view:
+                crc = zlib.crc32(view[_HEADER.size:])
+        self._n = n
+        self.checksum = crc  # CRC-32 of the packed digits
+
+        self.kgram_path = Path(kgram_path) if kgram_path is not None else kgram_path_for(self.path)
+        self._k = 0
+        self._kgram_mm: Optional[mmap.mmap] = None
+        self._offsets: Optional[memoryview] = None
+        self._positions: Optional[memoryview] = None
+        self._open_index()
+
+    # ---------- access ----------
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, str]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._n)
+            if step != 1:
+                return "".join(str(self.digit_at(i)) for i in range(start, stop, step))
+            return self.digits(start, stop)
+        return self.digit_at(key)
+
+    def digit_at(self, pos: int) -> int:
+        if pos < 0:
+            pos += self._n
+        if not 0 <= pos < self._n:
+            raise IndexError(f"pi digit position out of range: {pos}")
+        b = self._mm[_HEADER.size + (pos >> 1)]
+        return b & 0x0F if pos & 1 else b >> 4
+
+    def digits(self, start: int, stop: int) -> str:
+        """Digit string for positions [start, stop), clipped to the store."""
+        start = max(start, 0)
+        stop = min(stop, self._n)
+        if start >= stop:
+            return ""
+        base = _HEADER.size
+        text = self._mm[base + (start >> 1):base + ((stop + 1) >> 1)].hex()
+        skip = start & 1
+        return text[skip:skip + stop - start]
+
+    def context(self, index: int, radius: int = 8) -> PiContext:
+        """Digits within `radius` positions of `index`."""
+        if not 0 <= index < self._n:
+            raise IndexError(f"pi digit position out of range: {index}")
+        start = max(index - radius, 0)
+        return PiContext(index=index, start=start, digits=self.digits(start, index + radius + 1))
+
+    def iter_chunks(self, size: int = _CHUNK, overlap: int = 0) -> Iterator[tuple]:
+        """(start, digits) windows of `size` new digits, each preceded by `overlap` old ones."""
+        for start in range(0, self._n, size):
+            lo = max(start - overlap, 0)
+            yield lo, self.digits(lo, start + size)
+
+    # ---------- search ----------
+
+    @property
+    def has_index(self) -> bool:
+        return self._positions is not None
+
+    def find(self, seq: str, *, limit: Optional[int] = None) -> List[int]:
+        """Sorted start positions of `seq` (a non-empty string of digits)."""
+        if not seq or not seq.isdigit() or not seq.isascii():
+            raise ValueError(f"search sequence must be a non-empty digit string: {seq!r}")
+        m = len(seq)
+        if m > self._n:
+            return []
+        if self._positions is None:
+            return self._scan(seq, limit)
+
+        k = self._k
+        offsets, positions = self._offsets, self._positions
+        if m >= k:
+            code = int(seq[:k])
+            bucket = positions[offsets[code]:offsets[code + 1]]
+            if m == k:
+                hits = bucket.tolist()
+            else:
+                digits = self.digits
+                hits = [p for p in bucket if digits(p, p + m) == seq]
+        else:
+            # every k-gram starting with seq: one contiguous run of buckets
+            scale = 10 ** (k - m)
+            code = int(seq) * scale
+            hits = sorted(positions[offsets[code]:offsets[code + scale]])
+            # the last k - 1 positions start no full k-gram
+            digits = self.digits
+            hits.extend(p for p in range(max(self._n - k + 1, 0), self._n - m + 1) if digits(p, p + m) == seq)
+        return hits if limit is None else hits[:limit]
+
+    def count(self, seq: str) -> int:
+        return len(self.find(seq))
+
+    def _scan(self, seq: str, limit: Optional[int]) -> List[int]:
+        hits: List[int] = []
+        for base, text in self.iter_chunks(overlap=len(seq) - 1):
+            i = text.find(seq)
+            while i != -1:
+                if not hits or base + i > hits[-1]:
+                    hits.append(base + i)
+                    if limit is not None and len(hits) >= limit:
+                        return hits
+                i = text.find(seq, i + 1)
+        return hits
+
+    # ---------- k-gram index ----------
+
+    def build_index(self, k: int = DEFAULT_K) -> Path:
+        """
+        Counting-sort every k-gram start position into `<store>.kgram`
+        (written atomically, then opened). One pass counts, one pass fills.
+        """
+        if not 1 <= k <= 9:
+            raise ValueError("k must be in 1..9")
+        n_grams = max(self._n - k + 1, 0)
+        buckets = 10 ** k
+
+        # flat per-code counts (4 bytes per bucket), then exclusive prefix sums
+        counts = array("I", bytes(4 * buckets))
+        for _, codes in self._iter_codes(k):
+            for code in codes:
+                counts[code] += 1
+        offsets = array("Q", [0])
+        offsets.extend(accumulate(counts))
+        del counts
+
+        width = "I" if self._n < 2 ** 32 else "Q"
+        pos_at = _KGRAM_HEADER.size + 8 * (buckets + 1)
+        size = pos_at + array(width).itemsize * n_grams
+
+        self._close_index()
+        tmp = self.kgram_path.with_name(f"{self.kgram_path.name}.{os.getpid()}.tmp")
+        with tmp.open("w+b") as f:
+            f.truncate(size)
+            f.write(_KGRAM_HEADER.pack(KGRAM_MAGIC, VERSION, k, self._n, n_grams, self.checksum))
+            f.write(offsets.tobytes())
+            f.flush()
+            if n_grams:
+                with mmap.mmap(f.fileno(), size) as out:
+                    positions = memoryview(out)[pos_at:].cast(width)
+                    cursor = offsets
+                    for base, codes in self._iter_codes(k):
+                        for p, code in enumerate(codes, base):
+                            i = cursor[code]
+                            positions[i] = p
+                            cursor[code] = i + 1
+                    positions.release()
+                    out.flush()
+        os.replace(tmp, self.kgram_path)
+        self._open_index()
+        return self.kgram_path
+
+    def _iter_codes(self, k: int) -> Iterator[tuple]:
+        """(first position, [k-gram codes]) per chunk, chunks overlapping by k - 1 digits."""
+        for start in range(0, max(self._n - k + 1, 0), _CHUNK):
+            text = self.digits(start, start + _CHUNK + k - 1)
+            n = len(text) - k + 1
+            yield start, list(map(int, map(text.__getitem__, map(slice, range(n), range(k, n + k)))))
+
+    def _open_index(self) -> None:
+        try:
+            with self.kgram_path.open("rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        if len(mm) < _KGRAM_HEADER.size:
+            mm.close()
+            return
+        magic, version, k, n, n_grams, crc = _KGRAM_HEADER.unpack_from(mm, 0)
+        if magic != KGRAM_MAGIC or version != VERSION or n != self._n or crc != self.checksum:
+            mm.close()  # foreign or stale: behave as if absent
+            return
+        pos_at = _KGRAM_HEADER.size + 8 * (10 ** k + 1)
+        view = memoryview(mm)
+        self._kgram_mm = mm
+        self._k = k
+        self._offsets = view[_KGRAM_HEADER.size:pos_at].cast("Q")
+        self._positions = view[pos_at:].cast("I" if n < 2 ** 32 else "Q")
+        view.release()
+
+    def _close_index(self) -> None:
+        if self._kgram_mm is None:
+            return
+        self._offsets.release()
+        self._positions.release()
+        self._offsets = self._positions = None
+        self._kgram_mm.close()
+        self._kgram_mm = None
+        self._k = 0
+
+    # ---------- lifetime ----------
+
+    def close(self) -> None:
+        self._close_index()
+        self._mm.close()
+
+    def __enter__(self) -> "PiDigitStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,279 @@
+# Ame-Artificielle/src/pipeline.py
+"""
+Streaming identity ingestion (CSV / JSONL -> compact signature rows).
+
+Flow:
+  read_identities()  generator, one dict per input row (never loads the file)
+  iter_chunks()      groups rows into fixed-size chunks
+  process_chunk()    signature + archetype per row (runs in worker processes)
+  run_pipeline()     bounded fan-out to a ProcessPoolExecutor, ordered or
+                     unordered merge, ResultWriter output, throughput stats
+
+Rows that cannot be processed (bad date, empty name, ...) are written with
+an "error" field instead of aborting the run.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+
+from .numerology import NumerologyConfig, compute_signature, invert_digit, reduce_signature
+
+Row = Dict[str, Any]
+Chunk = List[Tuple[int, Row]]
+
+NUMBER_KEYS = ("life_path", "birth_day", "expression", "soul_urge", "personality")
+OUTPUT_FIELDS = ("row", "id", "archetype", "core_digit") + NUMBER_KEYS + ("error",)
+
+
+@dataclass
+class PipelineStats:
+    rows: int = 0
+    errors: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+# -------------------------
+# Reading
+# -------------------------
+
+def _detect_format(path: Path, fmt: Optional[str]) -> str:
+    fmt = (fmt or path.suffix.lstrip(".")).lower()
+    if fmt in {"jsonl", "ndjson"}:
+        return "jsonl"
+    if fmt in {"csv", "tsv"}:
+        return fmt
+    raise ValueError(f"unsupported identity format: {fmt!r} (expected csv, tsv or jsonl)")
+
+
+def read_identities(path: Union[str, Path], *, fmt: Optional[str] = None) -> Iterator[Row]:
+    """
+    Yield one identity dict per row. Blank JSONL lines are skipped; a JSONL
+    line that is not a JSON object is yielded as {"_error": ...} so it still
+    gets an output row.
+    """
+    path = Path(path)
+    kind = _detect_format(path, fmt)
+    with path.open("r", encoding="utf-8", newline="") as f:
+        if kind == "jsonl":
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield {"_error": f"invalid JSON: {e.msg}"}
+                    continue
+                yield obj if isinstance(obj, dict) else {"_error": "JSON row is not an object"}
+        else:
+            yield from csv.DictReader(f, delimiter="\t" if kind == "tsv" else ",")
+
+
+def iter_chunks(rows: Iterable[Row], size: int) -> Iterator[Chunk]:
+    """Group rows into lists of (row_number, row) of at most `size` items."""
+    if size < 1:
+        raise ValueError("chunk size must be >= 1")
+    chunk: Chunk = []
+    for i, row in enumerate(rows):
+        chunk.append((i, row))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# -------------------------
+# Processing (worker side)
+# -------------------------
+
+def process_row(row: Row, cfg: NumerologyConfig, inversion_enabled: bool = True) -> Row:
+    """Signature + archetype for one identity, as a flat output row."""
+    out: Row = {"id": row.get("id")}
+    if "_error" in row:
+        out["error"] = row["_error"]
+        return out
+    try:
+        signature = compute_signature({k: v for k, v in row.items() if v not in (None, "")}, cfg=cfg)
+        core = reduce_signature(signature)["core_digit"]
+    except (ValueError, TypeError) as e:
+        # e.g. date.fromisoformat() rejecting "1990-13-45" in numerology._parse_date
+        out["error"] = f"{type(e).__name__}: {e}"
+        return out
+
+    out["core_digit"] = core
+    out["archetype"] = invert_digit(core) if inversion_enabled else core
+    for key in NUMBER_KEYS:
+        if key in signature:
+            out[key] = signature[key]["pythagorean"]
+    return out
+
+
+def process_chunk(chunk: Chunk, cfg: NumerologyConfig, inversion_enabled: bool = True) -> List[Row]:
+    results: List[Row] = []
+    for i, row in chunk:
+        out = process_row(row, cfg, inversion_enabled)
+        out["row"] = i
+        results.append(out)
+    return results
+
+
+# -------------------------
+# Writing
+# -------------------------
+
+class ResultWriter:
+    """
+    Compact output: CSV with OUTPUT_FIELDS (empty cells for absent numbers),
+    or minified JSONL without absent keys.
+    """
+
+    def __init__(self, f: TextIO, *, fmt: str = "csv") -> None:
+        if fmt not in {"csv", "jsonl"}:
+            raise ValueError(f"unsupported output format: {fmt!r}")
+        self._f = f
+        self._fmt = fmt
+        self._csv: Optional[csv.DictWriter] = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write_many(self, results: Iterable[Row]) -> None:
+        if self._csv is not None:
+            self._csv.writerows(results)
+            return
+        write = self._f.write
+        for r in results:
+            write(json.dumps({k: v for k, v in r.items() if v is not None}, ensure_ascii=False, separators=(",", ":")))
+            write("\n")
+
+
+# -------------------------
+# Orchestration
+# -------------------------
+
+def run_pipeline(
+    rows: Iterable[Row],
+    sink: Callable[[List[Row]], None],
+    *,
+    cfg: NumerologyConfig = NumerologyConfig(),
+    inversion_enabled: bool = True,
+    chunk_size: int = 5000,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    on_progress: Optional[Callable[[PipelineStats], None]] = None,
+) -> PipelineStats:
+    """
+    Stream `rows` through process_chunk() and hand each result chunk to `sink`.
+
+    workers=0 processes chunks in the calling process (no pool).
+    max_in_flight bounds the number of submitted-but-unmerged chunks
+    (default 2 * workers), which bounds memory on arbitrarily large inputs.
+    ordered=True merges chunks in input order; ordered=False merges them as
+    they complete.
+    """
+    stats = PipelineStats()
+    t0 = time.perf_counter()
+
+    def merge(results: List[Row]) -> None:
+        sink(results)
+        stats.chunks += 1
+        stats.rows += len(results)
+        stats.errors += sum(1 for r in results if r.get("error"))
+        stats.seconds = time.perf_counter() - t0
+        if on_progress is not None:
+            on_progress(stats)
+
+    chunks = iter_chunks(rows, chunk_size)
+
+    if workers == 0:
+        for chunk in chunks:
+            merge(process_chunk(chunk, cfg, inversion_enabled))
+        stats.seconds = time.perf_counter() - t0
+        return stats
+
+    workers = workers or os.cpu_count() or 1
+    limit = max_in_flight or 2 * workers
+    if limit < 1:
+        raise ValueError("max_in_flight must be >= 1")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if ordered:
+            queue: Deque[Future] = deque()
+            for chunk in chunks:
+                if len(queue) >= limit:
+                    merge(queue.popleft().result())
+                queue.append(pool.submit(process_chunk, chunk, cfg, inversion_enabled))
+            while queue:
+                merge(queue.popleft().result())
+        else:
+            pending: Set[Future] = set()
+            for chunk in chunks:
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        merge(fut.result())
+                pending.add(pool.submit(process_chunk, chunk, cfg, inversion_enabled))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    merge(fut.result())
+
+    stats.seconds = time.perf_counter() - t0
+    return stats
+
+
+def run_file(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    *,
+    in_fmt: Optional[str] = None,
+    out_fmt: Optional[str] = None,
+    **kwargs: Any,
+) -> PipelineStats:
+    """File-to-file wrapper around run_pipeline(); output format from dst suffix."""
+    dst = Path(dst)
+    fmt = out_fmt or ("jsonl" if dst.suffix.lower() in {".jsonl", ".ndjson"} else "csv")
+    with dst.open("w", encoding="utf-8", newline="") as f:
+        writer = ResultWriter(f, fmt=fmt)
+        return run_pipeline(read_identities(src, fmt=in_fmt), writer.write_many, **kwargs)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Stream identities into signature rows.")
+    ap.add_argument("src")
+    ap.add_argument("dst")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--chunk-size", type=int, default=5000)
+    ap.add_argument("--max-in-flight", type=int, default=None)
+    ap.add_argument("--unordered", action="store_true")
+    ap.add_argument("--no-inversion", action="store_true")
+    args = ap.parse_args()
+
+    stats = run_file(
+        args.src,
+        args.dst,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_in_flight=args.max_in_flight,
+        ordered=not args.unordered,
+        inversion_enabled=not args.no_inversion,
+    )
+    print(f"rows={stats.rows} errors={stats.errors} chunks={stats.chunks} "
+          f"seconds={stats.seconds:.2f} rows/s={stats.rows_per_s:,.0f}")
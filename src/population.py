@@ -0,0 +1,140 @@
+# Ame-Artificielle/src/population.py
+"""
+Structure-of-arrays population of agents for large simulations.
+
+One SoulPopulation holds M agents as parallel arrays instead of M SoulState
+objects:
+
+  digit_archetype  array('b')  0..9, NO_DIGIT if unset
+  axis             array('b')  1..9
+  mood             array('b')  2..8, NO_MOOD if unset
+  traits           array('d')  M x N trait matrix, row-major (traits.TraitSchema order)
+  inertia          array('d')  per-agent dynamics inertia, derived from traits
+
+update_dynamics_batch() advances every agent for one tick from arrays of
+stimulus features (pull, intensity; see interpolation.stimulus_features),
+with the exact arithmetic of interpolation.update_dynamics(). Its kernel,
+step_dynamics_batch(), is shared with ArtificialSoulEngine.react_many().
+from_states() / to_states() convert to and from SoulState objects.
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import floor
+from typing import Iterable, List, MutableSequence, Optional, Sequence
+
+from .engine import SoulState
+from .interpolation import dynamics_inertia
+from .ontology import default_projection
+from .traits import TraitSchema, TraitVector, load_traits_schema
+
+NO_DIGIT = -1
+NO_MOOD = 0
+
+
+class SoulPopulation:
+    """M agents over one trait schema, stored column-wise."""
+
+    __slots__ = ("schema", "digit_archetype", "axis", "mood", "traits", "inertia")
+
+    def __init__(self, schema: Optional[TraitSchema] = None, size: int = 0, *, axis: int = 5) -> None:
+        self.schema = schema or load_traits_schema()[0]
+        self.digit_archetype = array("b", [NO_DIGIT]) * size
+        self.axis = array("b", [max(1, min(9, int(axis)))]) * size
+        self.mood = array("b", [NO_MOOD]) * size
+        self.traits = array("d", bytes(8 * size * len(self.schema)))
+        self.inertia = array("d", [dynamics_inertia(0.0, 0.0)]) * size
+
+    def __len__(self) -> int:
+        return len(self.axis)
+
+    # ---------- construction ----------
+
+    @classmethod
+    def from_digits(cls, digits: Sequence[int], *, axis: int = 5) -> "SoulPopulation":
+        """Agents from archetype digits, traits from the compiled ontology projection."""
+        projection = default_projection()
+        pop = cls(projection.schema, 0)
+        pop.digit_archetype = array("b", digits)
+        pop.axis = array("b", [max(1, min(9, int(axis)))]) * len(pop.digit_archetype)
+        pop.mood = array("b", [NO_MOOD]) * len(pop.digit_archetype)
+        pop.traits = projection.project(pop.digit_archetype)
+        pop.refresh_inertia()
+        return pop
+
+    @classmethod
+    def from_states(cls, states: Iterable[SoulState], schema: Optional[TraitSchema] = None) -> "SoulPopulation":
+        pop = cls(schema, 0)
+        for st in states:
+            pop.digit_archetype.append(NO_DIGIT if st.digit_archetype is None else st.digit_archetype)
+            pop.axis.append(st.axis_position)
+            pop.mood.append(NO_MOOD if st.mood is None else st.mood)
+            pop.traits.extend(TraitVector.from_mapping(pop.schema, st.trait_vector).data)
+        pop.refresh_inertia()
+        return pop
+
+    def refresh_inertia(self) -> None:
+        """Recompute `inertia` after editing `traits` in place."""
+        n = len(self.schema)
+        index = self.schema.index
+        traits = self.traits
+        es = index.get("emotional_stability")
+        disc = index.get("discipline")
+        self.inertia = array("d", (
+            dynamics_inertia(
+                traits[row + es] if es is not None else 0.0,
+                traits[row + disc] if disc is not None else 0.0,
+            )
+            for row in range(0, len(traits), n)
+        ))
+
+    # ---------- back to objects ----------
+
+    def state(self, i: int) -> SoulState:
+        n = len(self.schema)
+        digit = self.digit_archetype[i]
+        mood = self.mood[i]
+        return SoulState(
+            trait_vector=dict(zip(self.schema.names, self.traits[i * n:(i + 1) * n])),
+            digit_archetype=None if digit == NO_DIGIT else digit,
+            axis_position=self.axis[i],
+            mood=None if mood == NO_MOOD else mood,
+        )
+
+    def to_states(self) -> List[SoulState]:
+        return [self.state(i) for i in range(len(self))]
+
+
+def update_dynamics_batch(population: SoulPopulation, pull: Sequence[float], intensity: Sequence[float]) -> SoulPopulation:
+    """
+    One tick for every agent: pull[i], intensity[i] are agent i's stimulus
+    features. Updates population.axis / population.mood in place.
+    """
+    m = len(population)
+    if len(pull) != m or len(intensity) != m:
+        raise ValueError(f"expected {m} stimulus features per array")
+    step_dynamics_batch(population.axis, population.mood, population.inertia, pull, intensity)
+    return population
+
+
+def step_dynamics_batch(
+    axis: MutableSequence[int],
+    mood: MutableSequence[int],
+    inertia: Sequence[float],
+    pull: Sequence[float],
+    intensity: Sequence[float],
+) -> None:
+    """
+    Column kernel of update_dynamics_batch(): same arithmetic as
+    interpolation.step_dynamics(), inlined. Writes axis[i] / mood[i] in place
+    (NO_MOOD where intensity is 0); works on arrays and lists alike.
+    """
+    for i, (p, s, k) in enumerate(zip(pull, intensity, inertia)):
+        x = floor(axis[i] + 4.0 * p * s * (1.0 - k) + 0.5)
+        axis[i] = 1 if x < 1 else 9 if x > 9 else x
+        if s <= 0.0:
+            mood[i] = NO_MOOD
+        else:
+            y = floor(5.0 + 3.0 * p * s + 0.5)
+            mood[i] = 2 if y < 2 else 8 if y > 8 else y
@@ -0,0 +1,208 @@
+# Ame-Artificielle/src/profile_cache.py
+"""
+Identity-keyed cache of soul profiles for ArtificialSoulEngine.
+
+A profile is everything build_state_from_identity() derives from an identity
+and the engine's inversion setting: signature, reduction, archetype digit and
+trait vector. The same identities come back constantly (session restarts,
+retries, many sessions per user), so profiles are built once and shared:
+states built from a cached profile reference its read-only signature,
+reduction and trait vector instead of copying them.
+
+Key: identity_key() hashes the normalized name (numerology.normalize_name),
+the parsed date of birth and the inversion flag, so "Élise-Marie" /
+"ELISE MARIE" and "1990/07/14" / "1990-07-14" share one profile.
+
+ProfileCache is a size-bounded LRU; with `path`, save() writes it to a JSON
+file (atomically) that the next ProfileCache(path=...) loads back.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from .numerology import _parse_date, normalize_name
+from .ontology import digit_to_traits
+
+PROFILE_CACHE_SIZE = 4096
+KEY_VERSION = 1
+FILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SoulProfile:
+    """Immutable identity-derived part of a SoulState (shared between states)."""
+    key: str
+    digit_archetype: int
+    trait_vector: Mapping[str, float]
+    signature: Mapping[str, Mapping[str, int]]
+    reduced: Mapping[str, Any]
+
+    @classmethod
+    def create(cls, key: str, digit_archetype: int, signature: Mapping[str, Any], reduced: Mapping[str, Any]) -> "SoulProfile":
+        """Freeze signature/reduction; traits are the shared ontology projection row."""
+        return cls(
+            key=key,
+            digit_archetype=digit_archetype,
+            trait_vector=digit_to_traits(digit_archetype),
+            signature=_freeze(signature),
+            reduced=_freeze(reduced),
+        )
+
+
+@dataclass
+class ProfileCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def identity_key(identity: Mapping[str, Any], *, inversion_enabled: bool) -> str:
+    """
+    Canonical hash of an identity payload (same fields as
+    numerology.compute_signature: name/name_full, dob/birthdate).
+    Raises like compute_signature on an unparsable date.
+    """
+    name = identity.get("name", identity.get("name_full"))
+    dob = identity.get("dob", identity.get("birthdate"))
+    parts = (
+        f"v{KEY_VERSION}",
+        "-" if name is None else "N" + normalize_name(name),
+        "-" if dob is None else _parse_date(dob).isoformat(),
+        "I" if inversion_enabled else "i",
+    )
+    return hashlib.blake2b("|".join(parts).encode("ascii"), digest_size=16).hexdigest()
+
+
+class ProfileCache:
+    """LRU of SoulProfiles by identity_key(); optionally persisted to `path`."""
+
+    def __init__(self, maxsize: int = PROFILE_CACHE_SIZE, *, path: Union[str, Path, None] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.path = Path(path) if path is not None else None
+        self._profiles: "OrderedDict[str, SoulProfile]" = OrderedDict()
+        self._stats = ProfileCacheStats()
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._profiles
+
+    def get_or_build(
+        self,
+        identity: Mapping[str, Any],
+        *,
+        inversion_enabled: bool,
+        build: Callable[[str], SoulProfile],
+    ) -> SoulProfile:
+        """Cached profile for `identity`, or build(key) stored as most recently used."""
+        key = identity_key(identity, inversion_enabled=inversion_enabled)
+        profile = self._profiles.get(key)
+        if profile is not None:
+            self._profiles.move_to_end(key)
+            self._stats.hits += 1
+            return profile
+        self._stats.misses += 1
+        profile = build(key)
+        self._profiles[key] = profile
+        if len(self._profiles) > self.maxsize:
+            self._profiles.popitem(last=False)
+            self._stats.evictions += 1
+        return profile
+
+    def stats(self) -> ProfileCacheStats:
+        return ProfileCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            size=len(self._profiles),
+        )
+
+    def clear(self) -> None:
+        """Drop every profile and reset the counters."""
+        self._profiles.clear()
+        self._stats = ProfileCacheStats()
+
+    # ---------- persistence ----------
+
+    def save(self, path: Union[str, Path, None] = None) -> Path:
+        """Write the cached profiles (LRU order) atomically; defaults to self.path."""
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("ProfileCache.save() needs a path")
+        rows = [
+            {"key": p.key, "digit": p.digit_archetype, "signature": _thaw(p.signature), "reduced": _thaw(p.reduced)}
+            for p in self._profiles.values()
+        ]
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": FILE_VERSION, "profiles": rows}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        return path
+
+    def load(self, path: Union[str, Path]) -> int:
+        """Add the profiles saved at `path` (most recent last); returns how many were read."""
+        with Path(path).open(encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FILE_VERSION:
+            return 0  # stale format: start cold
+        rows = data.get("profiles", [])[-self.maxsize:]
+        for row in rows:
+            self._profiles[row["key"]] = SoulProfile.create(row["key"], row["digit"], row["signature"], row["reduced"])
+            self._profiles.move_to_end(row["key"])
+        while len(self._profiles) > self.maxsize:
+            self._profiles.popitem(last=False)
+        return len(rows)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict for shared profile data: still a dict for json and
+    equality; copy.copy() / copy.deepcopy() return the same object.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("shared profile data is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> Any:
+        return (FrozenDict, (dict(self),))
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, Mapping):
+        return FrozenDict({k: _freeze(v) for k, v in obj.items()})
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    if isinstance(obj, Mapping):
+        return {k: _thaw(v) for k, v in obj.items()}
+    return obj
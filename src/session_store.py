@@ -0,0 +1,406 @@
+# Ame-Artificielle/src/session_store.py
+"""
+Session store: SoulStates by session id, hot in memory, spilled to SQLite.
+
+    store = SessionStore("sessions.sqlite", max_sessions=1_000_000)
+    store.put(sid, engine.build_state_from_identity(identity=..., compact=True))
+    state = store.get(sid)          # hot hit, or transparent reload from disk
+    engine.react(state=state, stimulus=...)
+    store.close()                   # spills every hot state; reopen to resume
+
+- The hot set is an LRU bounded by a session count and/or an estimated byte
+  budget (state_size()).
+- Evicted states are encoded (encode_state) and handed to a write-behind
+  thread in batches of `flush_every`; the caller never waits for disk on
+  put/get hits. Until their batch is committed, spilled states are served
+  from the pending buffer.
+- A miss reads the row back (the only disk access on the caller's thread)
+  and decodes it to the same state class it was stored as.
+
+Encoding (version 2), little-endian:
+  header   version, flags, digit (-1 unset), axis, mood (0 unset),
+           memory capacity, turn count
+  traits   nothing if the state uses the ontology projection row of its
+           digit (ontology.digit_to_traits), else a JSON object
+  turns    per turn: u32 length + utf-8 stimulus, u32 length + utf-8 response
+  trace    optional JSON object (last_trace), to the end of the record
+
+Flag bits: compact state, projection traits, trace present, keep_trace
+(compact states). Version 1 records had no keep_trace bit; they decode with
+keep_trace = trace present, as they were written.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from .engine import AnySoulState, CompactSoulState, MemoryRing, SoulState
+from .ontology import digit_to_traits
+
+VERSION = 2
+_SUPPORTED_VERSIONS = (1, 2)
+
+_HEADER = struct.Struct("<BBbbbxHH")
+_LEN = struct.Struct("<I")
+
+_F_COMPACT = 1
+_F_PROJECTION = 2  # trait vector is digit_to_traits(digit)
+_F_TRACE = 4  # trace payload follows the turns
+_F_KEEP_TRACE = 8  # CompactSoulState.keep_trace, independent of the payload
+
+STATE_OVERHEAD = 1024  # estimated bytes of a live state besides its turn strings
+RELOAD_SAMPLES = 100_000  # reload latencies kept for percentiles
+
+
+# -------------------------
+# Encoding
+# -------------------------
+
+def encode_state(state: AnySoulState) -> bytes:
+    """Compact bytes of a SoulState or CompactSoulState (see module docstring)."""
+    compact = isinstance(state, CompactSoulState)
+    digit = state.digit_archetype
+    flags = _F_COMPACT if compact else 0
+    if compact and state.keep_trace:
+        flags |= _F_KEEP_TRACE
+    if digit is not None and 0 <= digit <= 9 and state.trait_vector is digit_to_traits(digit):
+        flags |= _F_PROJECTION
+    trace = state.last_trace
+    if trace and (not compact or state.keep_trace):
+        flags |= _F_TRACE
+
+    memory = state.memory
+    capacity = memory.capacity if compact else 0
+    parts = [_HEADER.pack(
+        VERSION, flags,
+        -1 if digit is None else digit,
+        state.axis_position,
+        0 if state.mood is None else state.mood,
+        capacity,
+        len(memory),
+    )]
+    if not flags & _F_PROJECTION:
+        parts.append(_pack_str(json.dumps(dict(state.trait_vector), separators=(",", ":"))))
+    for turn in memory:
+        parts.append(_pack_str(turn["stimulus"]))
+        parts.append(_pack_str(turn["response"]))
+    if flags & _F_TRACE:
+        parts.append(json.dumps(trace, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+    return b"".join(parts)
+
+
+def decode_state(blob: bytes) -> AnySoulState:
+    """Inverse of encode_state()."""
+    view = memoryview(blob)
+    version, flags, digit, axis, mood, capacity, n_turns = _HEADER.unpack_from(view, 0)
+    if version not in _SUPPORTED_VERSIONS:
+        raise ValueError(f"unsupported session record version: {version}")
+    pos = _HEADER.size
+    if flags & _F_PROJECTION:
+        traits: Any = digit_to_traits(digit)
+    else:
+        raw, pos = _unpack_str(view, pos)
+        traits = json.loads(raw)
+    turns: List[Dict[str, Any]] = []
+    for _ in range(n_turns):
+        stimulus, pos = _unpack_str(view, pos)
+        response, pos = _unpack_str(view, pos)
+        turns.append({"stimulus": stimulus, "response": response})
+    trace = json.loads(str(view[pos:], "utf-8")) if flags & _F_TRACE else {}
+
+    digit_archetype = None if digit == -1 else digit
+    mood_value = None if mood == 0 else mood
+    if flags & _F_COMPACT:
+        return CompactSoulState(
+            traits, digit_archetype, axis, mood_value, turns, trace,
+            memory_capacity=capacity,
+            keep_trace=bool(flags & (_F_KEEP_TRACE if version >= 2 else _F_TRACE)),
+        )
+    return SoulState(
+        trait_vector=traits,
+        digit_archetype=digit_archetype,
+        axis_position=axis,
+        mood=mood_value,
+        memory=turns,
+        last_trace=trace,
+    )
+
+
+def _pack_str(s: str) -> bytes:
+    b = s.encode("utf-8")
+    return _LEN.pack(len(b)) + b
+
+
+def _unpack_str(view: memoryview, pos: int) -> Tuple[str, int]:
+    (n,) = _LEN.unpack_from(view, pos)
+    pos += _LEN.size
+    return str(view[pos:pos + n], "utf-8"), pos + n
+
+
+def state_size(state: AnySoulState) -> int:
+    """Rough resident bytes of a state: fixed overhead + its turn strings."""
+    memory = state.memory
+    if isinstance(memory, MemoryRing):
+        return STATE_OVERHEAD + memory.text_length()
+    return STATE_OVERHEAD + sum(len(t["stimulus"]) + len(t["response"]) for t in memory)
+
+
+# -------------------------
+# Store
+# -------------------------
+
+@dataclass
+class SessionStoreStats:
+    """Counters of a SessionStore; reload latencies in milliseconds."""
+    gets: int = 0
+    hits: int = 0
+    reloads: int = 0
+    misses: int = 0  # unknown session ids
+    puts: int = 0
+    spills: int = 0
+    flushes: int = 0
+    hot: int = 0
+    hot_bytes: int = 0
+    pending: int = 0
+    reload_p50_ms: float = 0.0
+    reload_p99_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.gets if self.gets else 0.0
+
+    @property
+    def spill_rate(self) -> float:
+        """Spills per get/put."""
+        ops = self.gets + self.puts
+        return self.spills / ops if ops else 0.0
+
+
+class SessionStore:
+    """
+    LRU of live states over a SQLite file. Use from one thread (plus the
+    store's own writer thread). max_sessions / max_bytes of None is unbounded.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_sessions: Optional[int] = 100_000,
+        max_bytes: Optional[int] = None,
+        flush_every: int = 512,
+    ) -> None:
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        if flush_every < 1:
+            raise ValueError("flush_every must be >= 1")
+        self.path = Path(path)
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.flush_every = flush_every
+
+        self._hot: "OrderedDict[str, Tuple[AnySoulState, int]]" = OrderedDict()  # sid -> (state, size)
+        self._hot_bytes = 0
+        # Not committed yet: spilled blobs, or None for a delete (tombstone).
+        # _batch is the part not handed to the writer thread yet.
+        self._pending: Dict[str, Optional[bytes]] = {}
+        self._batch: Dict[str, Optional[bytes]] = {}
+        self._lock = threading.Lock()
+        self._stats = SessionStoreStats()
+        self._reload_ns: Deque[int] = deque(maxlen=RELOAD_SAMPLES)
+
+        self._db = self._connect()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, state BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._db.commit()
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer_error: Optional[BaseException] = None
+        self._writer = threading.Thread(target=self._write_loop, name="session-store-writer", daemon=True)
+        self._writer.start()
+        self._closed = False
+
+    # ---------- API ----------
+
+    def get(self, sid: str) -> Optional[AnySoulState]:
+        """The session's state (marked most recently used), or None."""
+        self._stats.gets += 1
+        item = self._hot.get(sid)
+        if item is not None:
+            self._hot.move_to_end(sid)
+            self._stats.hits += 1
+            return item[0]
+        return self._reload(sid)
+
+    def put(self, sid: str, state: AnySoulState) -> None:
+        """Insert or replace a session (most recently used)."""
+        self._stats.puts += 1
+        old = self._hot.pop(sid, None)
+        if old is not None:
+            self._hot_bytes -= old[1]
+        self._insert(sid, state)
+
+    def touch(self, sid: str) -> bool:
+        """
+        Mark a session most recently used (reloading it if spilled). False if
+        unknown. Counted like get() in the stats.
+        """
+        return self.get(sid) is not None
+
+    def delete(self, sid: str) -> None:
+        old = self._hot.pop(sid, None)
+        if old is not None:
+            self._hot_bytes -= old[1]
+        with self._lock:
+            self._pending[sid] = None
+            self._batch[sid] = None
+        self._hand_off(force=False)
+
+    def __contains__(self, sid: object) -> bool:
+        if sid in self._hot:
+            return True
+        with self._lock:
+            if sid in self._pending:
+                return self._pending[sid] is not None
+        return self._db.execute("SELECT 1 FROM sessions WHERE id = ?", (sid,)).fetchone() is not None
+
+    def stats(self) -> SessionStoreStats:
+        """Snapshot of the counters."""
+        s = SessionStoreStats(**vars(self._stats))
+        s.hot = len(self._hot)
+        s.hot_bytes = self._hot_bytes
+        with self._lock:
+            s.pending = sum(1 for blob in self._pending.values() if blob is not None)
+        if self._reload_ns:
+            ordered = sorted(self._reload_ns)
+            s.reload_p50_ms = ordered[int(0.50 * (len(ordered) - 1))] / 1e6
+            s.reload_p99_ms = ordered[int(0.99 * (len(ordered) - 1))] / 1e6
+        return s
+
+    def flush(self) -> None:
+        """Hand every spilled state to the writer and wait until it is committed."""
+        self._hand_off(force=True)
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_writer_error()
+
+    def close(self, *, persist: bool = True) -> None:
+        """Spill the hot set too (persist=True), flush, stop the writer."""
+        if self._closed:
+            return
+        if persist:
+            while self._hot:
+                self._spill(*self._hot.popitem(last=False))
+        self._hot_bytes = 0
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        self._db.close()
+        self._closed = True
+
+    def __enter__(self) -> "SessionStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ---------- internals ----------
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _insert(self, sid: str, state: AnySoulState) -> None:
+        size = state_size(state) if self.max_bytes is not None else 0
+        self._hot[sid] = (state, size)
+        self._hot_bytes += size
+        while len(self._hot) > 1 and (
+            (self.max_sessions is not None and len(self._hot) > self.max_sessions)
+            or (self.max_bytes is not None and self._hot_bytes > self.max_bytes)
+        ):
+            self._spill(*self._hot.popitem(last=False))
+
+    def _spill(self, sid: str, item: Tuple[AnySoulState, int]) -> None:
+        state, size = item
+        self._hot_bytes -= size
+        blob = encode_state(state)
+        with self._lock:
+            self._pending[sid] = blob
+            self._batch[sid] = blob
+        self._stats.spills += 1
+        self._hand_off(force=False)
+
+    def _reload(self, sid: str) -> Optional[AnySoulState]:
+        t0 = time.perf_counter_ns()
+        with self._lock:
+            pending = sid in self._pending
+            blob = self._pending.get(sid)
+        if not pending:
+            row = self._db.execute("SELECT state FROM sessions WHERE id = ?", (sid,)).fetchone()
+            blob = row[0] if row else None
+        if blob is None:
+            self._stats.misses += 1
+            return None
+        state = decode_state(blob)
+        self._insert(sid, state)
+        self._stats.reloads += 1
+        self._reload_ns.append(time.perf_counter_ns() - t0)
+        return state
+
+    def _hand_off(self, *, force: bool) -> None:
+        self._raise_writer_error()
+        with self._lock:
+            if not self._batch or (not force and len(self._batch) < self.flush_every):
+                return
+            batch, self._batch = self._batch, {}
+        self._queue.put(batch)
+
+    def _raise_writer_error(self) -> None:
+        if self._writer_error is not None:
+            raise RuntimeError(f"session store writer failed: {self._writer_error!r}") from self._writer_error
+
+    def _write_loop(self) -> None:
+        db = self._connect()
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    return
+                if isinstance(job, threading.Event):
+                    job.set()
+                    continue
+                if self._writer_error is not None:
+                    continue
+                try:
+                    with db:
+                        db.executemany(
+                            "INSERT OR REPLACE INTO sessions (id, state) VALUES (?, ?)",
+                            [(sid, blob) for sid, blob in job.items() if blob is not None],
+                        )
+                        db.executemany(
+                            "DELETE FROM sessions WHERE id = ?",
+                            [(sid,) for sid, blob in job.items() if blob is None],
+                        )
+                except BaseException as e:  # surfaced on the caller's next spill/flush
+                    self._writer_error = e
+                    continue
+                with self._lock:
+                    for sid, blob in job.items():
+                        if sid in self._pending and self._pending[sid] is blob:
+                            del self._pending[sid]
+                self._stats.flushes += 1
+        finally:
+            db.close()
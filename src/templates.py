@@ -0,0 +1,135 @@
+# Ame-Artificielle/src/templates.py
+"""
+Compiled response templates for ArtificialSoulEngine's placeholder composer.
+
+The composed text only depends on:
+  - three slider thresholds (tone >= 0.5, humor >= 0.66, complexity >= 0.66),
+    i.e. one of 8 buckets,
+  - the axis position (band framing + the "axis=..." detail),
+  - the stimulus, the mood and the dominant traits.
+
+compile_template() bakes everything but the last three into one str.format
+pattern per (bucket, axis position); TEMPLATES holds them for axis 1..9 so
+compose() is a table lookup plus a single format call.
+
+dominant_traits() is the "k:+w.ww, ..." summary of the five heaviest traits.
+It is cached: by identity for the shared read-only vectors (ontology rows,
+profile data), whose content cannot change, and by content for any other
+mapping, so a mutated dict simply gets a new entry.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from .interpolation import AXIS_BAND_STYLES, _BAND_SHAPES, axis_band
+from .profile_cache import FrozenDict
+from .traits import TraitView
+
+TONE_CUT = 0.5
+HUMOR_CUT = 0.66
+COMPLEXITY_CUT = 0.66
+DOMINANT_K = 5
+AXIS_POSITIONS = range(1, 10)
+
+_SHARED_CACHE_MAX = 4096
+
+Template = Callable[..., str]
+
+
+def slider_bucket(tone: float, humor: float, complexity: float) -> int:
+    """0..7: bit 0 tone, bit 1 humor, bit 2 complexity over their thresholds."""
+    return (tone >= TONE_CUT) | (humor >= HUMOR_CUT) << 1 | (complexity >= COMPLEXITY_CUT) << 2
+
+
+def _literal(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@lru_cache(maxsize=256, typed=True)  # typed: axis 5 and 5.0 render differently
+def compile_template(bucket: int, axis_position: float) -> Tuple[Template, bool]:
+    """
+    (format, detailed): format(stimulus=..., mood=..., traits=...) renders the
+    response; traits/mood are only used when `detailed` (complexity bucket).
+    """
+    band = axis_band(axis_position)
+    prefix = "Réponse" if bucket & 1 else "Note"
+    if bucket & 2:
+        prefix += " (léger)"
+    head, _, tail = _BAND_SHAPES[band].partition("{}")
+    pattern = f"{_literal(prefix)}: {_literal(head)}{{stimulus}}{_literal(tail)}"
+    detailed = bool(bucket & 4)
+    if detailed:
+        pattern += _literal(f"\n\nContexte interne: axis={axis_position} ({band}: {AXIS_BAND_STYLES[band]}), mood=")
+        pattern += "{mood}, traits=[{traits}]"
+    return pattern.format, detailed
+
+
+TEMPLATES: Tuple[Dict[int, Tuple[Template, bool]], ...] = tuple(
+    {axis: compile_template(bucket, axis) for axis in AXIS_POSITIONS} for bucket in range(8)
+)
+
+
+def template_for(tone: float, humor: float, complexity: float, axis_position: float) -> Tuple[Template, bool]:
+    """Precompiled template for the sliders and axis position."""
+    bucket = slider_bucket(tone, humor, complexity)
+    compiled = TEMPLATES[bucket].get(axis_position)
+    if compiled is None or type(axis_position) is not int:
+        compiled = compile_template(bucket, axis_position)
+    return compiled
+
+
+# -------------------------
+# Dominant traits
+# -------------------------
+
+_SHARED_SUMMARIES: Dict[int, Tuple[Mapping[str, float], str]] = {}
+
+
+def summarize_traits(trait_vector: Mapping[str, float], k: int = DOMINANT_K) -> str:
+    """Uncached: the k heaviest traits by absolute weight, "name:+w.ww, ..." ("none" if empty)."""
+    top = sorted(trait_vector.items(), key=lambda kv: abs(kv[1]), reverse=True)[:k]
+    return ", ".join([f"{name}:{w:+.2f}" for name, w in top]) if top else "none"
+
+
+@lru_cache(maxsize=4096)
+def _summary_of_items(items: Tuple[Tuple[str, float], ...]) -> str:
+    return summarize_traits(dict(items))
+
+
+def dominant_traits(trait_vector: Mapping[str, float]) -> str:
+    """Cached summarize_traits(trait_vector)."""
+    if isinstance(trait_vector, (TraitView, FrozenDict)):
+        hit = _SHARED_SUMMARIES.get(id(trait_vector))
+        if hit is not None and hit[0] is trait_vector:
+            return hit[1]
+        summary = summarize_traits(trait_vector)
+        if len(_SHARED_SUMMARIES) >= _SHARED_CACHE_MAX:
+            _SHARED_SUMMARIES.clear()
+        _SHARED_SUMMARIES[id(trait_vector)] = (trait_vector, summary)  # holds the ref: id stays valid
+        return summary
+    return _summary_of_items(tuple(trait_vector.items()))
+
+
+def compose(
+    *,
+    trait_vector: Mapping[str, float],
+    axis_position: float,
+    mood: Optional[int],
+    stimulus: str,
+    tone: float,
+    humor: float,
+    complexity: float,
+) -> str:
+    """The engine's placeholder response: one precompiled format call."""
+    render, detailed = template_for(tone, humor, complexity, axis_position)
+    if detailed:
+        return render(stimulus=stimulus.strip(), mood=mood, traits=dominant_traits(trait_vector))
+    return render(stimulus=stimulus.strip())
+
+
+def clear_caches() -> None:
+    """Drop cached trait summaries (templates are static)."""
+    _SHARED_SUMMARIES.clear()
+    _summary_of_items.cache_clear()
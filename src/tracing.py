@@ -0,0 +1,117 @@
+# Ame-Artificielle/src/tracing.py
+"""
+Trace levels and trace sinks for ArtificialSoulEngine.react().
+
+EngineConfig.trace_level:
+  "off"      no trace objects are built; results carry "trace": None and
+             state.last_trace is left alone
+  "summary"  axis before/after + mood (no sliders, no dynamics)
+  "full"     the complete trace (sliders, dynamics features), as before
+
+Independently of the level, an engine with a trace sink sends the full trace
+of one reaction in EngineConfig.trace_sample_every to the sink, e.g. a
+RingTraceSink kept in memory or a JsonlTraceSink on disk, so full traces can
+be inspected without building them for every request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, TextIO, Union
+
+TRACE_OFF = 0
+TRACE_SUMMARY = 1
+TRACE_FULL = 2
+
+TRACE_LEVELS: Dict[str, int] = {"off": TRACE_OFF, "summary": TRACE_SUMMARY, "full": TRACE_FULL}
+
+
+def trace_level(name: str) -> int:
+    """TRACE_* constant of a level name."""
+    try:
+        return TRACE_LEVELS[name]
+    except KeyError:
+        raise ValueError(f"unknown trace level {name!r} (expected one of {', '.join(TRACE_LEVELS)})") from None
+
+
+class TraceSink:
+    """Receives sampled trace records (plain dicts). Default: drops them."""
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "TraceSink":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class RingTraceSink(TraceSink):
+    """Keeps the last `capacity` records in memory."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self.emitted = 0
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        self._records.append(record)
+        self.emitted += 1
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Oldest first."""
+        return list(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+class JsonlTraceSink(TraceSink):
+    """
+    Appends records to a JSON-lines file, one write per `flush_every`
+    records (and on flush()/close()).
+    """
+
+    def __init__(self, path: Union[str, Path], *, flush_every: int = 256) -> None:
+        if flush_every < 1:
+            raise ValueError("flush_every must be >= 1")
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._buffer: List[str] = []
+        self._file: Optional[TextIO] = self.path.open("a", encoding="utf-8")
+        self.written = 0
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        self._buffer.append(json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer or self._file is None:
+            return
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._file.flush()
+        self.written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
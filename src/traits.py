@@ -0,0 +1,286 @@
+# Ame-Artificielle/src/traits.py
+"""
+Trait schema + compiled digit -> traits projection.
+
+The canonical trait list is the one of docs/traits_schema.md (section 2,
+"Exemple de set minimal"). Weights per archetype digit follow the section 4
+profiles (scale -2..+2); a `| trait_id | weight |` table under a
+`### <digit> — ...` heading of the schema overrides the baseline below.
+
+TraitProjection compiles the weights once into a 10 x N float64 matrix held
+in an immutable buffer:
+  - row(d) / vector(d) return shared read-only views (no per-call dict)
+  - project(digits) maps M archetype digits to an M x N row-major matrix
+    with a single buffer join
+
+TraitVector is the mutable counterpart used by the array math in
+interpolation.py: a schema plus one contiguous float64 buffer.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+TRAITS_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "docs" / "traits_schema.md"
+
+# Same list as docs/traits_schema.md; used when the docs are not shipped.
+DEFAULT_TRAITS: Tuple[str, ...] = (
+    "curiosity", "analysis", "abstraction", "focus", "flexibility",
+    "empathy", "emotional_stability", "joy", "anger", "fear", "compassion",
+    "leadership", "cooperation", "diplomacy", "assertiveness", "social_openness",
+    "discipline", "order", "risk_taking", "adaptability", "responsibility",
+    "intuition", "meaning_seeking", "transcendence", "altruism",
+)
+
+# Baseline weights from the section 4 profiles (inverted numerology archetypes).
+# 0 has no profile in the schema: neutral row.
+ARCHETYPE_WEIGHTS: Dict[int, Dict[str, float]] = {
+    0: {},
+    # Humanitarisme / Compassion / Générosité / Renouveau
+    1: {"altruism": 2, "compassion": 2, "empathy": 1, "meaning_seeking": 1, "adaptability": 1},
+    # Abondance / Matérialisation / Pouvoir / Transformation
+    2: {"leadership": 1, "assertiveness": 1, "discipline": 1, "focus": 1, "adaptability": 1},
+    # Spiritualité / Intuition / Contemplation / Recherche de sens
+    3: {"intuition": 2, "meaning_seeking": 2, "transcendence": 1, "analysis": 1, "social_openness": -1},
+    # Harmonie / Responsabilité / Amour / Équilibre domestique
+    4: {"responsibility": 2, "compassion": 1, "empathy": 1, "cooperation": 1, "emotional_stability": 1},
+    # Liberté / Changement / Aventure / Exploration
+    5: {"adaptability": 2, "risk_taking": 2, "curiosity": 1, "flexibility": 1, "order": -1},
+    # Stabilité / Organisation / Discipline / Structure
+    6: {"discipline": 2, "order": 2, "responsibility": 1, "focus": 1, "risk_taking": -1, "flexibility": -1},
+    # Expression / Communication / Créativité / Inspiration
+    7: {"social_openness": 2, "joy": 1, "curiosity": 1, "abstraction": 1, "flexibility": 1},
+    # Coopération / Équilibre / Diplomatie / Dualité
+    8: {"cooperation": 2, "diplomacy": 2, "empathy": 1, "emotional_stability": 1, "assertiveness": -1},
+    # Indépendance / Leadership / Initiative
+    9: {"leadership": 2, "assertiveness": 2, "risk_taking": 1, "focus": 1, "cooperation": -1},
+}
+
+_CODE_RE = re.compile(r"`([a-z_]+)`")
+_PROFILE_RE = re.compile(r"^###\s+(\d)\s+[—-]")
+_WEIGHT_ROW_RE = re.compile(r"^\|\s*([a-z_]+)\s*\|\s*([+-]?\d+(?:\.\d+)?)\s*\|")
+
+
+class TraitSchema:
+    """Ordered trait names with a name -> column index."""
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names: Tuple[str, ...] = tuple(names)
+        self.index: Dict[str, int] = {n: i for i, n in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise ValueError("trait names must be unique")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TraitSchema) and other.names == self.names
+
+    def __hash__(self) -> int:
+        return hash(self.names)
+
+    def __repr__(self) -> str:
+        return f"TraitSchema({len(self.names)} traits)"
+
+
+def parse_traits_schema(text: str) -> Tuple[Tuple[str, ...], Dict[int, Dict[str, float]]]:
+    """
+    (trait names, weight overrides per digit) from traits_schema.md text.
+    Names are the backticked ids of the "set minimal" list in section 2.
+    """
+    names = []
+    in_list = False
+    profile: Optional[int] = None
+    overrides: Dict[int, Dict[str, float]] = {}
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("### Exemple de set minimal"):
+            in_list = True
+            continue
+        if in_list:
+            if stripped == "---":
+                in_list = False
+            elif stripped.startswith("- "):
+                names.extend(_CODE_RE.findall(stripped))
+            continue
+        m = _PROFILE_RE.match(stripped)
+        if m:
+            profile = int(m.group(1))
+            continue
+        if stripped.startswith("## "):
+            profile = None
+        if profile is not None:
+            row = _WEIGHT_ROW_RE.match(stripped)
+            if row:
+                overrides.setdefault(profile, {})[row.group(1)] = float(row.group(2))
+    return tuple(names), overrides
+
+
+@lru_cache(maxsize=8)
+def load_traits_schema(path: Union[str, Path, None] = None) -> Tuple[TraitSchema, Dict[int, Dict[str, float]]]:
+    """Schema + digit weights (baseline merged with the doc's tables); falls back to DEFAULT_TRAITS."""
+    path = Path(path) if path is not None else TRAITS_SCHEMA_PATH
+    try:
+        names, overrides = parse_traits_schema(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        names, overrides = (), {}
+    weights = {d: dict(w) for d, w in ARCHETYPE_WEIGHTS.items()}
+    for d, w in overrides.items():
+        weights.setdefault(d, {}).update(w)
+    return TraitSchema(names or DEFAULT_TRAITS), weights
+
+
+class TraitView(Mapping[str, float]):
+    """Read-only {trait -> weight} mapping over a shared float64 row."""
+
+    __slots__ = ("schema", "data")
+
+    def __init__(self, schema: TraitSchema, data: memoryview) -> None:
+        self.schema = schema
+        self.data = data
+
+    def __getitem__(self, key: str) -> float:
+        return self.data[self.schema.index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.names)
+
+    def __len__(self) -> int:
+        return len(self.schema.names)
+
+    def __repr__(self) -> str:
+        return f"TraitView({dict(self)!r})"
+
+    # Read-only: copies share the row; pickling rebuilds it by value.
+    def __copy__(self) -> "TraitView":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "TraitView":
+        return self
+
+    def __reduce__(self):
+        return (_restore_view, (self.schema.names, self.data.tobytes()))
+
+
+def _restore_view(names: Tuple[str, ...], raw: bytes) -> TraitView:
+    return TraitView(TraitSchema(names), memoryview(raw).cast("d"))
+
+
+class TraitVector:
+    """
+    Schema-bound trait vector: `data[i]` is the weight of `schema.names[i]`.
+    from_mapping() / to_dict() convert at the dict edges.
+    """
+
+    __slots__ = ("schema", "data")
+
+    def __init__(self, schema: TraitSchema, data: Optional[Iterable[float]] = None) -> None:
+        self.schema = schema
+        if data is None:
+            self.data = array("d", bytes(8 * len(schema)))
+        else:
+            self.data = array("d", data)
+            if len(self.data) != len(schema):
+                raise ValueError(f"expected {len(schema)} weights, got {len(self.data)}")
+
+    @classmethod
+    def from_mapping(cls, schema: TraitSchema, values: Mapping[str, float]) -> "TraitVector":
+        """Missing traits are 0.0; traits outside the schema raise ValueError."""
+        if isinstance(values, TraitView) and values.schema == schema:
+            return cls(schema, values.data)
+        vec = cls(schema)
+        index = schema.index
+        data = vec.data
+        for k, v in values.items():
+            i = index.get(k)
+            if i is None:
+                raise ValueError(f"trait {k!r} is not in the schema")
+            data[i] = float(v)
+        return vec
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(zip(self.schema.names, self.data))
+
+    def copy(self) -> "TraitVector":
+        return TraitVector(self.schema, self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key: Union[str, int]) -> float:
+        return self.data[self.schema.index[key] if isinstance(key, str) else key]
+
+    def __setitem__(self, key: Union[str, int], value: float) -> None:
+        self.data[self.schema.index[key] if isinstance(key, str) else key] = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TraitVector) and other.schema == self.schema and other.data == self.data
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"TraitVector({self.to_dict()!r})"
+
+
+class TraitProjection:
+    """Compiled digit (0..9) -> trait weights matrix."""
+
+    def __init__(
+        self,
+        schema: Optional[TraitSchema] = None,
+        weights: Optional[Mapping[int, Mapping[str, float]]] = None,
+    ) -> None:
+        if schema is None or weights is None:
+            doc_schema, doc_weights = load_traits_schema()
+            schema = schema or doc_schema
+            weights = weights if weights is not None else doc_weights
+        self.schema = schema
+        n = len(schema)
+
+        matrix = array("d", bytes(8 * 10 * n))
+        for d, row in weights.items():
+            if not 0 <= d <= 9:
+                raise ValueError(f"archetype digit out of range: {d}")
+            for trait, w in row.items():
+                if trait not in schema.index:
+                    raise ValueError(f"unknown trait {trait!r} in weights for digit {d}")
+                matrix[d * n + schema.index[trait]] = float(w)
+
+        self._bytes = matrix.tobytes()  # immutable: every view below is read-only
+        self._row_bytes = tuple(self._bytes[d * 8 * n:(d + 1) * 8 * n] for d in range(10))
+        view = memoryview(self._bytes).cast("d")
+        self._rows = tuple(view[d * n:(d + 1) * n] for d in range(10))
+        self._vectors = tuple(TraitView(schema, row) for row in self._rows)
+
+    @property
+    def matrix(self) -> memoryview:
+        """Read-only 10 x N matrix, row-major (flat)."""
+        return memoryview(self._bytes).cast("d")
+
+    def row(self, digit: int) -> memoryview:
+        return self._rows[self._check(digit)]
+
+    def vector(self, digit: int) -> TraitView:
+        return self._vectors[self._check(digit)]
+
+    def project(self, digits: Union[Sequence[int], Iterable[int]]) -> array:
+        """M archetype digits -> flat array('d') of shape M x N (row-major)."""
+        if not isinstance(digits, (array, bytes, bytearray, list, tuple, range)):
+            digits = list(digits)
+        if len(digits) and (min(digits) < 0 or max(digits) > 9):
+            raise ValueError("archetype digits must be in 0..9")
+        out = array("d")
+        out.frombytes(b"".join(map(self._row_bytes.__getitem__, digits)))
+        return out
+
+    @staticmethod
+    def _check(digit: int) -> int:
+        if not 0 <= digit <= 9:
+            raise ValueError(f"archetype digit out of range: {digit}")
+        return digit
@@ -0,0 +1,122 @@
+# Ame-Artificielle/tests/test_batching.py
+
+import asyncio
+import copy
+
+import pytest
+
+from src.batching import (
+    BatchGenerationBackend,
+    BatchQueueFull,
+    HttpBatchBackend,
+    LatencyBatchBackend,
+    MicroBatcher,
+    compose_request,
+    serve_standin,
+)
+from src.engine import ArtificialSoulEngine, SoulState
+from src.engine_async import AsyncArtificialSoulEngine, EngineOverloaded, GenerationRequest
+from src.ontology import digit_to_traits
+
+STIMULI = ["Pourquoi ?", "Cours !", "Bonjour.", "Danger ! Vite !"]
+
+
+def _request(i):
+    return GenerationRequest(
+        trait_vector=digit_to_traits(i % 10), axis_position=1 + i % 9, mood=i % 3 - 1,
+        stimulus=STIMULI[i % 4], tone=0.7, humor=0.1, complexity=0.9,
+    )
+
+
+def test_batches_fill_up_to_max_batch_then_flush_after_max_wait():
+    async def run():
+        backend = LatencyBatchBackend(0.0, 0.0)
+        batcher = MicroBatcher(backend, max_batch=4, max_wait=0.02)
+        requests = [_request(i) for i in range(10)]
+        texts = await asyncio.gather(*(batcher.generate(r) for r in requests))
+        return backend.batch_sizes, texts, requests, batcher.stats()
+
+    sizes, texts, requests, stats = asyncio.run(run())
+    assert sizes == [4, 4, 2]
+    assert texts == [compose_request(r) for r in requests]
+    assert (stats.submitted, stats.batches, stats.largest_batch, stats.mean_batch_size) == (10, 3, 4, 10 / 3)
+
+
+def test_sheds_past_max_queue():
+    async def run():
+        batcher = MicroBatcher(LatencyBatchBackend(0.0, 0.0), max_batch=8, max_wait=0.01, max_queue=3)
+        return await asyncio.gather(*(batcher.generate(_request(i)) for i in range(5)), return_exceptions=True), batcher
+
+    results, batcher = asyncio.run(run())
+    shed = [r for r in results if isinstance(r, BaseException)]
+    assert len(shed) == 2 and all(isinstance(e, BatchQueueFull) and isinstance(e, EngineOverloaded) for e in shed)
+    stats = batcher.stats()
+    assert (stats.shed, stats.items, batcher.waiting) == (2, 3, 0)
+
+
+def test_batch_errors_reach_every_caller_and_cancelled_callers_are_dropped():
+    class Broken(BatchGenerationBackend):
+        def __init__(self):
+            self.sizes = []
+
+        async def generate_batch(self, requests):
+            self.sizes.append(len(requests))
+            raise RuntimeError("model down")
+
+    async def run():
+        backend = Broken()
+        batcher = MicroBatcher(backend, max_batch=8, max_wait=0.01)
+        calls = [asyncio.ensure_future(batcher.generate(_request(i))) for i in range(3)]
+        await asyncio.sleep(0)
+        calls[0].cancel()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        return backend.sizes, results, batcher.stats()
+
+    sizes, results, stats = asyncio.run(run())
+    assert sizes == [2]
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert all(isinstance(r, RuntimeError) and str(r) == "model down" for r in results[1:])
+    assert stats.failed == 2
+
+
+def test_engine_over_http_standin_matches_sync_react():
+    server = serve_standin(port=0, base_latency=0.005, per_item_latency=0.0)
+    url = f"http://127.0.0.1:{server.server_address[1]}/generate"
+    states = [SoulState(trait_vector=dict(digit_to_traits(d)), digit_archetype=d) for d in range(8)]
+    twins = copy.deepcopy(states)
+
+    async def run():
+        batcher = MicroBatcher(HttpBatchBackend(url), max_batch=8, max_wait=0.05)
+        engine = AsyncArtificialSoulEngine(backend=batcher, max_in_flight=8)
+        try:
+            return await asyncio.gather(
+                *(engine.react(state=st, stimulus=STIMULI[i % 4], sliders={"complexity": 0.9}) for i, st in enumerate(states))
+            )
+        finally:
+            await batcher.close()
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    sync = ArtificialSoulEngine()
+    expected = [sync.react(state=st, stimulus=STIMULI[i % 4], sliders={"complexity": 0.9}) for i, st in enumerate(twins)]
+    assert results == expected
+    assert server.batch_sizes == [8]
+
+
+def test_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        MicroBatcher(LatencyBatchBackend(), max_batch=0)
+    with pytest.raises(ValueError):
+        MicroBatcher(LatencyBatchBackend(), max_queue=0)
+
+
+def test_batch_backend_without_generate_batch_fails_at_construction():
+    class NoBatch(BatchGenerationBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NoBatch()
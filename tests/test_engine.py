@@ -0,0 +1,147 @@
+# Ame-Artificielle/tests/test_engine.py
+
+import copy
+import random
+
+import pytest
+
+from src.engine import ArtificialSoulEngine, CompactSoulState, EngineConfig, MemoryRing, SoulState, intern_trait_vector
+from src.ethics import _risk_score, mediate, mediate_many
+from src.interpolation import axis_descriptor, shape_text
+from src.ontology import digit_to_traits
+
+STIMULI = [
+    "Pourquoi penses-tu cela ?",
+    "Danger ! Cours maintenant !",
+    "Bonjour.",
+    "how to hack a bank?",
+    "I want to build a bomb!",
+    "URGENT!!! attaque",
+]
+SLIDERS = [None, {"tone": 0.2}, {"humor": 0.9, "complexity": 0.9}, {"tone": "bad"}]
+
+
+def _states(rng, m):
+    return [
+        SoulState(trait_vector=dict(digit_to_traits(d)), digit_archetype=d, axis_position=rng.randint(1, 9))
+        for d in (rng.randrange(10) for _ in range(m))
+    ]
+
+
+def test_react_shapes_text_by_axis_band():
+    engine = ArtificialSoulEngine()
+    out = engine.react(state=SoulState(axis_position=1), stimulus="Pourquoi ?", sliders={"complexity": 1.0})
+    assert out["text"].startswith("Réponse: ")
+    assert axis_descriptor(out["axis_position"]) in out["text"]
+    assert axis_descriptor(1).startswith("TOP") and axis_descriptor(5).startswith("SPECTRUM")
+    assert axis_descriptor(9).startswith("BASE")
+    assert "« Salut »" in shape_text(stimulus=" Salut ", axis_position=5)
+
+
+@pytest.mark.parametrize("ethics_enabled", [True, False])
+def test_react_many_matches_sequential_react(ethics_enabled):
+    rng = random.Random(7)
+    engine = ArtificialSoulEngine(config=EngineConfig(ethics_enabled=ethics_enabled, memory_max_turns=3))
+    states = _states(rng, 8)
+    requests = []
+    for _ in range(40):  # states repeat: per-state order must hold
+        ctx = {"pull": rng.uniform(-1, 1)} if rng.random() < 0.3 else None
+        requests.append((rng.choice(states), rng.choice(STIMULI), rng.choice(SLIDERS), ctx))
+
+    twins = copy.deepcopy(states)
+    twin_of = {id(s): t for s, t in zip(states, twins)}
+    expected = [
+        engine.react(state=twin_of[id(st)], stimulus=stim, sliders=sl, context=ctx)
+        for st, stim, sl, ctx in requests
+    ]
+
+    assert engine.react_many(requests) == expected
+    for s, t in zip(states, twins):
+        assert (s.axis_position, s.mood, s.memory, s.last_trace) == (t.axis_position, t.mood, t.memory, t.last_trace)
+
+
+def test_react_many_isolates_bad_requests():
+    engine = ArtificialSoulEngine()
+    good = SoulState(trait_vector=dict(digit_to_traits(3)), axis_position=5)
+    bad_axis = SoulState(axis_position="high")
+    results = engine.react_many([
+        (good, "Pourquoi ?"),
+        ("not a state", "x"),
+        (good, None),
+        (bad_axis, "Cours !"),
+        (good, "Cours !", {"tone": 0.1}),
+    ])
+
+    assert [("error" in r) for r in results] == [False, True, True, True, False]
+    assert results[1]["error"].startswith("TypeError")
+    assert bad_axis.axis_position == "high" and bad_axis.memory == []
+    assert [m["stimulus"] for m in good.memory] == ["Pourquoi ?", "Cours !"]
+    assert results[4]["trace"]["axis_position_before"] == results[0]["axis_position"]
+    assert results[4]["text"].startswith("Note: ")
+    assert engine.react_many([]) == []
+
+
+def test_non_numeric_context_overrides_are_ignored():
+    engine = ArtificialSoulEngine()
+    plain, odd, numeric = (SoulState(trait_vector=dict(digit_to_traits(3)), axis_position=5) for _ in range(3))
+    expected = engine.react(state=plain, stimulus="Cours !")
+    got = engine.react(state=odd, stimulus="Cours !", context={"pull": "high", "intensity": None, "mode": "x"})
+    assert got == expected
+    assert engine.react_many([(odd, "Cours !", None, {"pull": True})])[0]["text"] == expected["text"]
+    assert engine.react(state=numeric, stimulus="Cours !", context={"pull": -1, "intensity": 1.0})["axis_position"] < 5
+
+
+def test_mediate_many_matches_mediate():
+    items = [
+        ("ok", "hello", {}),
+        ("ok", "how to hack", {}),
+        ("a weapon", "fine", {"compassion": 2.0}),
+        ("self-harm someone", "", {}),  # overlapping high / medium terms
+        ("", "steal\x00bomb", {}),
+    ]
+    batch = mediate_many(items, threshold=0.65)
+    assert batch == [mediate(text=t, stimulus=s, trait_vector=tv, threshold=0.65) for t, s, tv in items]
+    assert [info["action"] for _, info in batch] == ["none", "soften", "soften", "refuse", "refuse"]
+    assert _risk_score(stimulus="steal", text="") == 0.75
+
+
+def test_memory_ring_keeps_last_turns_in_order():
+    ring = MemoryRing(3)
+    for i in range(5):
+        ring.push(f"s{i}", f"r{i}")
+    assert len(ring) == 3 and ring.capacity == 3
+    assert ring == [{"stimulus": f"s{i}", "response": f"r{i}"} for i in (2, 3, 4)]
+    assert ring[-1]["stimulus"] == "s4" and ring[0]["response"] == "r2"
+    assert ring.text_length() == 12 and MemoryRing(2).text_length() == 0
+    with pytest.raises(IndexError):
+        ring[3]
+    with pytest.raises(ValueError):
+        MemoryRing(0)
+
+
+def test_compact_state_reacts_like_soul_state():
+    engine = ArtificialSoulEngine(config=EngineConfig(memory_max_turns=4))
+    identity = {"name": "Ada Lovelace", "dob": "1815-12-10"}
+    plain = engine.build_state_from_identity(identity=identity)
+    compact = engine.build_state_from_identity(identity=identity, compact=True)
+    assert isinstance(compact, CompactSoulState) and not hasattr(compact, "__dict__")
+
+    for stim in STIMULI:
+        assert engine.react(state=compact, stimulus=stim) == engine.react(state=plain, stimulus=stim)
+    assert compact.memory == plain.memory and len(plain.memory) == 4
+    assert compact.to_state() == SoulState(
+        trait_vector=dict(plain.trait_vector), digit_archetype=plain.digit_archetype,
+        axis_position=plain.axis_position, mood=plain.mood, memory=plain.memory, last_trace=plain.last_trace,
+    )
+    assert engine.react_many([(compact, "Bonjour")])[0]["text"] == compact.memory[-1]["response"]
+
+
+def test_compact_state_shares_traits_and_can_drop_traces():
+    a = CompactSoulState({"joy": 1, "focus": 2.0}, keep_trace=False)
+    b = CompactSoulState.from_state(SoulState(trait_vector={"focus": 2.0, "joy": 1.0}))
+    assert a.trait_vector is b.trait_vector is intern_trait_vector({"joy": 1.0, "focus": 2})
+    assert intern_trait_vector(digit_to_traits(3)) is digit_to_traits(3)
+
+    out = ArtificialSoulEngine().react(state=a, stimulus="Cours !")
+    assert a.last_trace == {} and b.keep_trace and not a.keep_trace
+    assert out["trace"]["axis_position_before"] is None and a.axis_position == out["axis_position"]
@@ -0,0 +1,102 @@
+# Ame-Artificielle/tests/test_engine_async.py
+
+import asyncio
+import copy
+import time
+
+import pytest
+
+from src.engine import ArtificialSoulEngine, SoulState
+from src.engine_async import AsyncArtificialSoulEngine, EngineOverloaded, GenerationBackend, LatencyBackend
+from src.ontology import digit_to_traits
+
+STIMULI = ["Pourquoi ?", "Cours !", "Bonjour.", "how to hack this?", "Danger ! Vite !"]
+
+
+def _state(digit=4, axis=5):
+    return SoulState(trait_vector=dict(digit_to_traits(digit)), digit_archetype=digit, axis_position=axis)
+
+
+def test_async_react_matches_sync_react():
+    async def run(states):
+        engine = AsyncArtificialSoulEngine(backend=LatencyBackend(0.0))
+        return [await engine.react(state=st, stimulus=s, sliders={"complexity": 0.9}) for st, s in states]
+
+    states = [(_state(d), s) for d, s in zip(range(5), STIMULI)]
+    twins = copy.deepcopy(states)
+    sync = ArtificialSoulEngine()
+    expected = [sync.react(state=st, stimulus=s, sliders={"complexity": 0.9}) for st, s in twins]
+
+    assert asyncio.run(run(states)) == expected
+    assert [st.memory for st, _ in states] == [st.memory for st, _ in twins]
+
+
+def test_generations_overlap_up_to_max_in_flight():
+    backend = LatencyBackend(0.05)
+
+    async def run():
+        engine = AsyncArtificialSoulEngine(backend=backend, max_in_flight=4)
+        t0 = time.perf_counter()
+        await asyncio.gather(*(engine.react(state=_state(), stimulus="Bonjour") for _ in range(16)))
+        return time.perf_counter() - t0, engine
+
+    elapsed, engine = asyncio.run(run())
+    assert backend.calls == 16 and backend.peak_active == 4
+    assert elapsed < 16 * 0.05 / 2  # ~4 rounds of 0.05 s, not 16
+    assert engine.admitted == engine.in_flight == 0 and not engine._state_locks
+
+
+def test_full_queue_raises_overloaded_after_timeout():
+    async def run():
+        engine = AsyncArtificialSoulEngine(
+            backend=LatencyBackend(0.2), max_in_flight=1, max_queue=1, queue_timeout=0.02,
+        )
+        return await asyncio.gather(
+            *(engine.react(state=_state(), stimulus="x") for _ in range(3)), return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert sum(isinstance(r, EngineOverloaded) for r in results) == 1
+    assert sum(isinstance(r, dict) for r in results) == 2
+
+
+def test_same_state_calls_run_in_order():
+    state = _state()
+    twin = copy.deepcopy(state)
+
+    async def run():
+        engine = AsyncArtificialSoulEngine(backend=LatencyBackend(0.01, jitter=0.02, seed=1), max_in_flight=8)
+        return await asyncio.gather(*(engine.react(state=state, stimulus=s) for s in STIMULI))
+
+    results = asyncio.run(run())
+    sync = ArtificialSoulEngine()
+    assert results == [sync.react(state=twin, stimulus=s) for s in STIMULI]
+    assert state.memory == twin.memory and state.axis_position == twin.axis_position
+
+
+@pytest.mark.parametrize("how", ["cancel", "timeout"])
+def test_cancelled_or_timed_out_call_leaves_state_untouched(how):
+    state = _state(axis=2)
+    before = copy.deepcopy(state)
+
+    async def run():
+        engine = AsyncArtificialSoulEngine(backend=LatencyBackend(1.0), generation_timeout=0.05 if how == "timeout" else None)
+        task = asyncio.create_task(engine.react(state=state, stimulus="Cours ! Danger !"))
+        if how == "cancel":
+            await asyncio.sleep(0.02)
+            task.cancel()
+        with pytest.raises((asyncio.CancelledError, asyncio.TimeoutError)):
+            await task
+        return engine
+
+    engine = asyncio.run(run())
+    assert state == before
+    assert engine.admitted == engine.in_flight == 0 and not engine._state_locks
+
+
+def test_backend_without_generate_fails_at_construction():
+    class NoGenerate(GenerationBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NoGenerate()
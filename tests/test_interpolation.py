@@ -0,0 +1,116 @@
+# Ame-Artificielle/tests/test_interpolation.py
+
+import random
+
+import pytest
+
+from src.interpolation import (
+    add_scaled,
+    add_scaled_array,
+    axis_table_cache_clear,
+    blend_vectors,
+    compile_axis_table,
+    blend_vectors_array,
+    interpolate_axis,
+    interpolate_axis_array,
+    lerp_array,
+    normalize_l1,
+    normalize_l1_array,
+)
+from src.traits import DEFAULT_TRAITS, TraitSchema, TraitVector
+
+SCHEMA = TraitSchema(DEFAULT_TRAITS)
+
+
+def _random_dict(rng, keep=0.7):
+    return {k: rng.uniform(-2, 2) for k in DEFAULT_TRAITS if rng.random() < keep}
+
+
+def _approx(vec, d):
+    expected = {k: 0.0 for k in DEFAULT_TRAITS}
+    expected.update(d)
+    assert vec.to_dict() == pytest.approx(expected)
+
+
+def test_array_path_matches_dict_path():
+    rng = random.Random(5)
+    for _ in range(50):
+        a, b, c = _random_dict(rng), _random_dict(rng), _random_dict(rng)
+        va, vb, vc = (TraitVector.from_mapping(SCHEMA, x) for x in (a, b, c))
+        t = rng.uniform(-0.5, 1.5)
+        _approx(blend_vectors_array(va, vb, t), blend_vectors(a, b, t))
+        _approx(add_scaled_array(va, vb, 0.3), add_scaled(a, b, 0.3))
+        _approx(normalize_l1_array(va, 2.0), normalize_l1(a, 2.0))
+        for axis in range(1, 10):
+            _approx(
+                interpolate_axis_array(axis_digit=axis, intellect=va, instinct=vb, mid_overlays={4: vc, 6: vc},
+                                       normalize=True),
+                interpolate_axis(axis_digit=axis, intellect=a, instinct=b, mid_overlays={4: c, 6: c}, normalize=True),
+            )
+
+
+def test_out_buffers_are_reused_and_may_alias_inputs():
+    a = TraitVector.from_mapping(SCHEMA, {"joy": 1.0, "fear": -1.0})
+    b = TraitVector.from_mapping(SCHEMA, {"joy": 3.0})
+    out = TraitVector(SCHEMA)
+    assert lerp_array(a, b, 0.5, out=out) is out and out["joy"] == 2.0 and out["fear"] == -0.5
+    assert add_scaled_array(a, b, 1.0, out=a) is a and a["joy"] == 4.0
+    zero = TraitVector(SCHEMA)
+    assert normalize_l1_array(zero, out=out) is out and out == zero
+
+
+def test_schema_edges():
+    with pytest.raises(ValueError):
+        TraitVector.from_mapping(SCHEMA, {"not_a_trait": 1.0})
+    other = TraitVector(TraitSchema(["joy"]))
+    with pytest.raises(ValueError):
+        lerp_array(TraitVector(SCHEMA), other, 0.5)
+    vec = TraitVector.from_mapping(SCHEMA, {"joy": 1.5})
+    assert vec.to_dict()["joy"] == 1.5 and vec[DEFAULT_TRAITS.index("joy")] == 1.5
+    assert vec.copy() == vec and vec.copy() is not vec
+
+
+def test_axis_table_matches_interpolate_axis():
+    rng = random.Random(9)
+    a, b, c = _random_dict(rng), _random_dict(rng), _random_dict(rng)
+    kwargs = dict(intellect=a, instinct=b, mid_overlays={3: c, 5: c}, mid_strength=0.4, normalize=True)
+    table = compile_axis_table(**kwargs)
+    for d in range(1, 10):
+        assert dict(table.row(d)) == interpolate_axis(axis_digit=d, **kwargs)
+        assert table.at(float(d)) == interpolate_axis(axis_digit=d, **kwargs)
+    mid = table.at(6.4)
+    for k in set(table.row(6)) | set(table.row(7)):
+        assert mid[k] == pytest.approx(0.6 * table.row(6).get(k, 0.0) + 0.4 * table.row(7).get(k, 0.0))
+    with pytest.raises(ValueError):
+        table.at(9.5)
+    with pytest.raises(ValueError):
+        table.row(0)
+
+    # "calm" only exists in row 5: every position still reports it
+    sparse = compile_axis_table(intellect={"joy": 1.0}, instinct={"fear": 1.0}, mid_overlays={5: {"calm": 1.0}})
+    assert sparse.at(1.0) == {"joy": 1.0, "fear": 0.0, "calm": 0.0}
+    assert sparse.at(1.0).keys() == sparse.at(1.5).keys() == sparse.at(5.0).keys() == sparse.at(9.0).keys()
+
+
+def test_axis_table_is_memoized_by_content():
+    axis_table_cache_clear()
+    a, b = {"joy": 1.0}, {"fear": 1.0}
+    table = compile_axis_table(intellect=a, instinct=b)
+    assert compile_axis_table(intellect=dict(a), instinct=dict(b)) is table
+    a["joy"] = 2.0
+    rebuilt = compile_axis_table(intellect=a, instinct=b)
+    assert rebuilt is not table and rebuilt.row(1)["joy"] == 2.0
+
+
+def test_axis_table_array_templates():
+    rng = random.Random(11)
+    a, b, c = _random_dict(rng), _random_dict(rng), _random_dict(rng)
+    va, vb, vc = (TraitVector.from_mapping(SCHEMA, x) for x in (a, b, c))
+    table = compile_axis_table(intellect=va, instinct=vb, mid_overlays={4: vc}, normalize=True)
+    out = TraitVector(SCHEMA)
+    for d in range(1, 10):
+        expected = interpolate_axis_array(axis_digit=d, intellect=va, instinct=vb, mid_overlays={4: vc}, normalize=True)
+        assert table.at_array(float(d), out=out) is out and out == expected
+        with pytest.raises(TypeError):
+            table.row(d).data[0] = 0.0
+    assert table.at_array(4.25, out=out).to_dict() == pytest.approx(table.at(4.25))
@@ -0,0 +1,103 @@
+# Ame-Artificielle/tests/test_metrics.py
+
+import threading
+import urllib.request
+
+import pytest
+
+from src.engine import ArtificialSoulEngine, EngineConfig
+from src.metrics import (
+    LatencyHistogram,
+    StageMetrics,
+    bucket_bounds,
+    bucket_index,
+    serve_prometheus,
+    to_prometheus,
+    write_prometheus,
+)
+
+ADA = {"name": "Ada Lovelace", "dob": "1815-12-10"}
+
+
+def test_buckets_cover_values_with_bounded_error():
+    for ns in (0, 1, 15, 16, 17, 31, 32, 1_000, 123_456, 10**9, 2**44):
+        low, high = bucket_bounds(bucket_index(ns))
+        assert low <= ns <= high
+        assert high - low <= max(1, ns // 16)
+    assert [bucket_index(n) for n in (15, 16, 32, 33, 34)] == [15, 16, 32, 32, 33]
+
+
+def test_histogram_percentiles():
+    h = LatencyHistogram()
+    for ns in range(1, 10_001):
+        h.record(ns * 1_000)
+    assert h.count == 10_000 and h.max == 10_000_000
+    for q, expected in ((0.5, 5e6), (0.95, 9.5e6), (0.99, 9.9e6)):
+        assert h.percentile(q) == pytest.approx(expected, rel=0.04)
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+def test_threads_record_into_their_own_histograms():
+    metrics = StageMetrics()
+
+    def work(n):
+        for _ in range(1_000):
+            metrics.record("stage", n)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in (100, 200, 300, 400)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = metrics.snapshot()["stage"]
+    assert stats.count == 4_000 and stats.max_ms == 400 / 1e6
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_engine_stage_metrics():
+    engine = ArtificialSoulEngine(config=EngineConfig(metrics_enabled=True, profile_cache_size=16))
+    for _ in range(3):
+        state = engine.build_state_from_identity(identity=ADA)
+    for stimulus in ("Bonjour", "Danger ! Cours !", "Pourquoi ?"):
+        engine.react(state=state, stimulus=stimulus)
+
+    stats = engine.metrics()
+    counts = {stage: s.count for stage, s in stats.items()}
+    assert counts == {
+        "build_state": 3, "numerology": 1, "ontology": 1, "profile": 3, "state": 3,
+        "react": 3, "interpolation": 3, "composition": 3, "ethics": 3, "commit": 3,
+    }
+    react = stats["react"]
+    assert 0 < react.p50_ms <= react.p95_ms <= react.p99_ms <= react.max_ms
+    parts = sum(stats[s].total_ms for s in ("interpolation", "composition", "ethics", "commit"))
+    assert parts <= react.total_ms
+
+
+def test_metrics_disabled_by_default():
+    engine = ArtificialSoulEngine()
+    engine.react(state=engine.build_state_from_identity(identity=ADA), stimulus="Bonjour")
+    assert engine.stage_metrics is None and engine.metrics() == {}
+
+
+def test_prometheus_export(tmp_path):
+    metrics = StageMetrics()
+    for ns in (1_000, 2_000, 3_000):
+        metrics.record("react", ns)
+    text = to_prometheus(metrics)
+    assert "# TYPE ame_stage_latency_seconds summary" in text
+    assert 'ame_stage_latency_seconds_count{stage="react"} 3' in text
+    assert 'ame_stage_latency_seconds{stage="react",quantile="0.99"}' in text
+
+    path = write_prometheus(metrics, tmp_path / "ame.prom")
+    assert path.read_text(encoding="utf-8") == text
+
+    server = serve_prometheus(metrics, port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            assert resp.read().decode("utf-8") == text
+    finally:
+        server.shutdown()
+        server.server_close()
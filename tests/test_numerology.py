@@ -1,20 +1,37 @@
 # Ame-Artificielle/tests/test_numerology.py
 
+import os
+import random
+import re
+import unicodedata
+from datetime import date, timedelta
+from itertools import product
+
 import pytest
 
 from src.numerology import (
+    NO_INVERSION,
+    CalendarTable,
     NumerologyConfig,
     birth_day_number,
     build_signature,
+    build_signature_batch,
     expression_number,
+    find_name_variants,
+    get_calendar_table,
     invert_digit,
     life_path_number,
     name_total,
     name_total_consonants,
     name_total_vowels,
     normalize_name,
+    normalize_name_cache_clear,
+    normalize_name_cache_info,
+    personality_number,
     pythagorean_letter_value,
     reduce_number,
+    reduce_numbers,
+    soul_urge_number,
 )
 
 
@@ -133,3 +150,160 @@ def test_build_signature_contains_expected_keys():
     # sanity: inverted present when pythagorean is 1..9
     assert "inverted" in sig["life_path"]
     assert "inverted" in sig["expression"]
+
+
+def test_build_signature_batch_matches_scalar():
+    cfg = NumerologyConfig(keep_master_numbers=(11, 22, 33), apply_inversion=True)
+    names = ["ABC", "Jean-François Tremblay", "Élise-Marie", "Psst", "Lynn Wyatt", "Ezekiel", "Aoi"]
+    dobs = ["1990-07-14", "1999/12/29", (2004, 2, 29), "1975-11-22", "2001-01-01", "1989-09-29", "1800-01-01"]
+
+    cols = build_signature_batch(names, dobs, cfg=cfg)
+
+    for i, (name, dob) in enumerate(zip(names, dobs)):
+        sig = build_signature(name=name, dob=dob, cfg=cfg)
+        for key, expected in sig.items():
+            assert cols[key]["pythagorean"][i] == expected["pythagorean"]
+            assert cols[key]["inverted"][i] == expected.get("inverted", NO_INVERSION)
+            if "total" in expected:
+                assert cols[key]["total"][i] == expected["total"]
+
+
+def test_build_signature_batch_partial_inputs_and_length_check():
+    cols = build_signature_batch(names=["ABC"])
+    assert set(cols) == {"expression", "soul_urge", "personality"}
+
+    cols = build_signature_batch(dobs=["1990-07-14"])
+    assert set(cols) == {"life_path", "birth_day"}
+    assert cols["birth_day"]["total"][0] == 14
+
+    with pytest.raises(ValueError):
+        build_signature_batch(["ABC"], ["1990-07-14", "1990-07-15"])
+
+
+@pytest.mark.parametrize("masters", [(11, 22, 33), ()])
+def test_calendar_table_matches_scalar(masters):
+    cfg = NumerologyConfig(keep_master_numbers=masters, apply_inversion=True)
+    table = CalendarTable.build(cfg, first_year=1989, last_year=2001)
+
+    day = date(1989, 1, 1)
+    while day.year <= 2001:
+        assert table.life_path(day, cfg) == life_path_number(day, cfg=cfg)
+        assert table.birth_day(day, cfg) == birth_day_number(day, cfg=cfg)
+        day += timedelta(days=1)
+
+    assert not table.covers(date(2002, 1, 1))
+    # out-of-range dates fall back to the scalar computation
+    assert life_path_number("2150-03-04", cfg=cfg, calendar=table) == life_path_number("2150-03-04", cfg=cfg)
+
+    with pytest.raises(ValueError):
+        table.life_path("1990-07-14", NumerologyConfig(keep_master_numbers=(11,)))
+
+
+def test_calendar_table_cache_file_roundtrip(tmp_path):
+    cfg = NumerologyConfig()
+    table = get_calendar_table(cfg, cache_dir=tmp_path)
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1
+
+    mapped = CalendarTable.load(files[0])
+    assert mapped.keep_master_numbers == (11, 22, 33)
+    for dob in ("1800-01-01", "1990-07-14", "1999-09-29", "2200-12-31"):
+        assert mapped.life_path(dob, cfg) == table.life_path(dob, cfg) == life_path_number(dob, cfg=cfg)
+
+    files[0].write_bytes(b"garbage")
+    with pytest.raises(ValueError):
+        CalendarTable.load(files[0])
+
+
+def _reference_reduce(n, masters):
+    # Original string-based digit-summing loop.
+    x = abs(n)
+    while True:
+        if x in masters or x < 10:
+            return x
+        x = sum(int(ch) for ch in str(x))
+
+
+# Set ASE_EXHAUSTIVE=1 to check every n up to 10**7 (takes a while).
+_EXHAUSTIVE_LIMIT = 10**7 if os.environ.get("ASE_EXHAUSTIVE") else 10**5
+
+
+@pytest.mark.parametrize("masters", [(11, 22, 33), (), (11, 22, 33, 44, 1036), (9, 5)])
+def test_reduce_number_matches_reference_exhaustively(masters):
+    mset = set(masters)
+    ns = range(1, _EXHAUSTIVE_LIMIT + 1)
+    expected = [_reference_reduce(n, mset) for n in ns]
+    assert [reduce_number(n, keep_master_numbers=masters) for n in ns] == expected
+    assert list(reduce_numbers(ns, keep_master_numbers=list(masters))) == expected
+
+    rng = random.Random(1)
+    for n in (rng.randrange(1, 10**30) for _ in range(2000)):
+        assert reduce_number(n, keep_master_numbers=masters) == _reference_reduce(n, mset)
+        assert reduce_number(-n, keep_master_numbers=masters) == _reference_reduce(n, mset)
+
+
+def test_reduce_numbers_zero_handling():
+    assert list(reduce_numbers([0, 29, 38], allow_zero=True)) == [0, 11, 11]
+    with pytest.raises(ValueError):
+        reduce_numbers([5, 0])
+
+
+def _reference_normalize(name):
+    nfkd = unicodedata.normalize("NFKD", name)
+    s = "".join(ch for ch in nfkd if not unicodedata.combining(ch)).upper()
+    return re.sub(r"[^A-Z]", "", s)
+
+
+def test_normalize_name_fast_paths_match_reference():
+    corpus = [
+        "Jean-François Tremblay", "Zoë O'Brien", "Straße", "ﬁona", "Ørjan Æsir", "Łukasz",
+        "İlkay", "Nguyễn Thị Minh Khai", "李小龙", "José\tMaría 3rd", "mary-ann", "", "  ",
+    ]
+    for name in corpus:
+        assert normalize_name(name) == _reference_normalize(name), name
+
+
+def test_normalize_name_is_memoized():
+    normalize_name_cache_clear()
+    for _ in range(3):
+        normalize_name("Élise-Marie")
+    info = normalize_name_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+@pytest.mark.parametrize("masters", [(11, 22, 33), ()])
+def test_find_name_variants_matches_brute_force(masters):
+    cfg = NumerologyConfig(keep_master_numbers=masters, apply_inversion=False)
+    slots = [
+        ["Jean", "Jehan", "Johnny", "J."],
+        ["", "François", "Francois", "Luc", "Marie"],
+        ["", "Paul", "Zoë"],
+        ["Tremblay", "Tremblet", "Côté"],
+    ]
+
+    def numbers(tokens):
+        name = " ".join(t for t in tokens if t)
+        return (
+            expression_number(name, cfg=cfg)["pythagorean"],
+            soul_urge_number(name, cfg=cfg)["pythagorean"],
+            personality_number(name, cfg=cfg)["pythagorean"],
+        )
+
+    combos = {tokens: numbers(tokens) for tokens in product(*slots)}
+    targets = set(combos.values())
+    for expr, soul, pers in sorted(targets)[:12]:
+        expected = {t for t, n in combos.items() if n == (expr, soul, pers)}
+        found = list(find_name_variants(slots, expression=expr, soul_urge=soul, personality=pers, cfg=cfg))
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+
+    only_expr = {t for t, n in combos.items() if n[0] == 11}
+    assert set(find_name_variants(slots, expression=11, cfg=cfg)) == only_expr
+
+
+def test_find_name_variants_is_lazy_and_handles_no_match():
+    slots = [["A", "B", "C", "D", "E", "F", "G", "H", "I"]] * 40  # 9**40 combinations
+    gen = find_name_variants(slots, expression=7, cfg=NumerologyConfig(keep_master_numbers=()))
+    first = [next(gen) for _ in range(5)]
+    assert all(len(t) == 40 for t in first)
+    assert list(find_name_variants([["B"]], expression=3)) == []
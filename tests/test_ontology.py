@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 
+from src.ontology import OntologyError, PiOntology
+
 
 def load_pi_ontology(path: Path) -> dict:
     with path.open("r", encoding="utf-8") as f:
@@ -88,3 +90,70 @@ def test_no_nan_or_infinite_numbers_in_ontology(ontology: dict) -> None:
                 check(x)
 
     check(ontology)
+
+
+# ---------- PiOntology ----------
+
+@pytest.fixture()
+def pi_onto(tmp_path: Path) -> PiOntology:
+    entries = [
+        {"index": 0, "digit": 3, "analysis": {"Tradition pythagoricienne": "créativité", "Chinoise": "croissance"}},
+        {"index": 1, "digit": 1, "analysis": {"Tradition pythagoricienne": "unité"}},
+        {"index": 9, "digit": 3, "analysis": {"Tradition pythagoricienne": "expression", "Hindoue": "Jupiter"}},
+        {"index": 6, "digit": 7, "analysis": {"Note": "sagesse"}},
+    ]
+    path = tmp_path / "pi_ontology.json"
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+    return PiOntology(path)
+
+
+def test_merged_views_are_cached_and_read_only(pi_onto: PiOntology) -> None:
+    first = pi_onto.get_analysis(3)
+    assert first == {"Tradition pythagoricienne": "expression", "Chinoise": "croissance", "Hindoue": "Jupiter"}
+    assert pi_onto.get_analysis(3) is first
+    assert pi_onto.get_analysis(7, inverted=True) is first  # inv(7) == 3
+
+    concat = pi_onto.get_analysis(3, merge_policy="concat")
+    assert concat["Tradition pythagoricienne"] == "créativité / expression"
+
+    with pytest.raises(TypeError):
+        first["Chinoise"] = "corrupted"  # type: ignore[index]
+
+    stats = pi_onto.view_cache_stats()
+    assert stats.hits == 2 and stats.misses == 2 and stats.size == 2
+
+
+def test_patch_digit_invalidates_only_that_digit(pi_onto: PiOntology) -> None:
+    three = pi_onto.get_analysis(3)
+    one = pi_onto.get_analysis(1)
+    assert pi_onto.get_tradition_text(3, " HINDOUE ") == "Jupiter"
+    summary = pi_onto.summarize_digit(3)
+
+    pi_onto.patch_digit(3, {"hindoue": "Brihaspati"})
+
+    assert pi_onto.get_analysis(1) is one
+    assert pi_onto.get_analysis(3) is not three
+    assert pi_onto.get_analysis(3)["hindoue"] == "Brihaspati"
+    # case-insensitive lookup keeps "first matching key wins"
+    assert pi_onto.get_tradition_text(3, "hindoue") == "Jupiter"
+    assert pi_onto.summarize_digit(3) != summary
+    assert pi_onto.view_cache_stats().invalidations == 1
+
+    pi_onto.patch_digit(8, {"Note": "dualité"}, inverted=True)  # patches digit 2
+    assert pi_onto.get_tradition_text(2, "note") == "dualité"
+
+
+def test_entries_resolve_positional_context(tmp_path: Path, pi_onto: PiOntology) -> None:
+    from src.pi_digits import PiDigitStore, write_digit_store
+
+    write_digit_store(tmp_path / "pi.bin", ["3.14159265358979"])
+    with pytest.raises(OntologyError):
+        pi_onto.get_context(0)
+
+    with PiDigitStore(tmp_path / "pi.bin") as store:
+        pi_onto.attach_digit_store(store)
+        ctx = pi_onto.get_context(4, radius=2)
+        assert (ctx.before, ctx.digit, ctx.after) == ("41", 5, "92")
+        for entry, ctx in pi_onto.get_entries_with_context(3):
+            assert ctx is None or ctx.digit == entry.digit
+        pi_onto.attach_digit_store(None)
@@ -0,0 +1,92 @@
+# Ame-Artificielle/tests/test_ontology_index.py
+
+import json
+
+import pytest
+
+from src.ontology import PiOntology
+from src.ontology_index import PATCH_INDEX, OntologyIndex, tokenize
+
+
+@pytest.fixture()
+def onto(tmp_path):
+    entries = [
+        {"index": 0, "digit": 3, "analysis": {
+            "Numérologie chaldéenne": "gouverné par Jupiter, le 3 incarne créativité et communication.",
+            "Numérologie chinoise": "croissance et dynamisme ; l’équilibre du ciel et de la terre.",
+        }},
+        {"index": 1, "digit": 1, "analysis": {
+            "Tradition pythagoricienne": "l’unité divine, origine de toute chose.",
+            "Numérologie hindoue": "associé au Soleil (Surya), leadership.",
+        }},
+        {"index": 4, "digit": 5, "analysis": {
+            "Numérologie chinoise": "harmonie des cinq éléments, Équilibre et changement.",
+        }},
+        {"index": 9, "digit": 3, "analysis": {
+            "Numérologie hindoue": "associé à Jupiter (Guru), sagesse.",
+        }},
+        {"index": 15, "digit": 3, "analysis": {
+            "Numérologie hindoue": "associé à Jupiter (Guru), sagesse.",
+        }},
+    ]
+    path = tmp_path / "pi_ontology.json"
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+    return PiOntology(path)
+
+
+def test_tokenize_is_accent_insensitive():
+    assert tokenize("L’Équilibre, cœur!") == ["l", "equilibre", "coeur"]
+
+
+def test_terms_prefix_and_phrase_queries(onto):
+    index = OntologyIndex(onto)
+
+    hits = index.search("equilibre")
+    assert {(h.digit, h.indexes) for h in hits} == {(3, (0,)), (5, (4,))}
+
+    hits = index.search("équilibre OR Jupiter")
+    assert {h.digit for h in hits} == {3, 5}
+    assert hits[0].digit == 3  # matches both clauses
+
+    assert [h.indexes for h in index.search("harmon*")] == [(4,)]
+    assert [h.indexes for h in index.search('"unite divine"')] == [(1,)]
+    assert index.search('"divine unite"') == []
+    assert [h.indexes for h in index.search("l’unité")] == [(1,)]
+
+
+def test_filters_by_digit_inversion_and_tradition(onto):
+    index = OntologyIndex(onto)
+
+    hits = index.search("jupiter", traditions=["numérologie HINDOUE"])
+    assert [(h.digit, h.tradition) for h in hits] == [(3, "Numérologie hindoue")]
+
+    assert {h.digit for h in index.search("equilibre", digits=[5])} == {5}
+    hits = index.search("equilibre jupiter", digits=[7], inverted=True)  # inv(7) == 3
+    assert {h.digit for h in hits} == {3}
+    assert all(h.inverted_digit == 7 for h in hits)
+
+
+def test_index_follows_patch_digit(onto):
+    index = OntologyIndex(onto)
+    size = len(index)
+
+    onto.patch_digit(2, {"Note": "dualité, équilibre, diplomatie"})
+    assert len(index) == size + 1
+    hits = index.search("diplomatie")
+    assert [(h.digit, h.indexes) for h in hits] == [(2, (PATCH_INDEX,))]
+
+    onto.patch_digit(2, {"Note": "coopération"})  # replaces the patch text
+    assert index.search("diplomatie") == []
+    assert [h.digit for h in index.search("cooperation")] == [2]
+    assert len(index) == size + 1
+
+
+def test_repeated_texts_share_one_document(onto):
+    index = OntologyIndex(onto)
+    hits = index.search("guru")
+    assert [(h.digit, h.indexes) for h in hits] == [(3, (9, 15))]
+
+    onto.patch_digit(3, {"Numérologie hindoue": "associé à Jupiter (Guru), sagesse."})
+    assert index.search("guru")[0].indexes == (9, 15, PATCH_INDEX)
+    onto.patch_digit(3, {"Numérologie hindoue": "Brihaspati"})
+    assert index.search("guru")[0].indexes == (9, 15)
@@ -0,0 +1,102 @@
+# Ame-Artificielle/tests/test_ontology_lazy.py
+
+import json
+
+import pytest
+
+import src.ontology_lazy as ontology_lazy
+from src.ontology import OntologyError, PiOntology
+from src.ontology_lazy import LazyPiOntology
+
+FIRST = [
+    {"index": 0, "digit": 3, "analysis": {"Tradition pythagoricienne": "créativité", "Chinoise": "croissance"}},
+    {"index": "1", "digit": "1", "analysis": {"Tradition pythagoricienne": "unité \"divine\""}},
+    {"index": 2, "digit": 4},
+    "not an entry",
+]
+SECOND = [
+    {"index": 6, "digit": 2, "analysis": {"Note": "aucune information"}},
+    {"index": 9, "digit": 3, "analysis": {"Tradition pythagoricienne": "expression", "Kabbale": None}},
+]
+
+
+@pytest.fixture()
+def source(tmp_path):
+    path = tmp_path / "pi_ontology.json"
+    # concatenated arrays (`][`), as in the shipped file
+    path.write_text(json.dumps(FIRST, ensure_ascii=False) + "\n" + json.dumps(SECOND, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk", [7, 1 << 20])
+def test_lazy_matches_eager(source, monkeypatch, chunk):
+    # tiny windows split entries and multi-byte characters across reads
+    monkeypatch.setattr(ontology_lazy, "READ_CHUNK", chunk)
+    eager = PiOntology(source)
+    lazy = LazyPiOntology(source, cache_size=2)
+    assert len(lazy) == 4
+    assert lazy.digits_present == eager.digits_present
+    for d in range(10):
+        assert lazy.get_entries(d) == eager.get_entries(d)
+        assert lazy.get_analysis(d, merged=False) == eager.get_analysis(d, merged=False)
+        assert dict(lazy.get_analysis(d, merge_policy="concat")) == dict(eager.get_analysis(d, merge_policy="concat"))
+        assert lazy.is_digit_missing_or_incomplete(d) == eager.is_digit_missing_or_incomplete(d)
+    assert list(lazy.iter_entries()) == eager._entries
+
+    lazy.patch_digit(2, {"Note": "dualité"})
+    assert lazy.get_tradition_text(2, "note") == "dualité"
+    lazy.close()
+
+
+def test_entry_cache_is_bounded(source):
+    lazy = LazyPiOntology(source, cache_size=1)
+    assert lazy.entry_cache_info().currsize == 0
+    lazy.get_entries(3)
+    lazy.get_entries(3)
+    info = lazy.entry_cache_info()
+    assert info.currsize == 1 and info.misses == 4
+
+
+def test_stray_text_and_errors(tmp_path):
+    path = tmp_path / "fenced.json"
+    path.write_text("```json\n" + json.dumps(SECOND) + "\n```\n", encoding="utf-8")
+    assert LazyPiOntology(path).digits_present == [2, 3]
+
+    path.write_text(json.dumps(SECOND)[:-20], encoding="utf-8")
+    with pytest.raises(OntologyError):
+        LazyPiOntology(path)
+
+    path.write_text(json.dumps({"digit": 1, "analysis": {}}), encoding="utf-8")
+    with pytest.raises(OntologyError):
+        LazyPiOntology(path)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "```json\n{first}\n{second}\n```\n",
+        "```\n{second}\n```",
+        "\n  {first}{second}  \n",
+        "Voici le fichier :\n{second}",
+        "{first}\nnote\n{second}",
+        "```json\n{second}\n",
+        "",
+        "[{a}, {b}]",
+        "[{a} {b}]",
+        "[{a},,{b}]",
+        "[{a},{b},]",
+        "[,{a}]",
+    ],
+)
+def test_eager_and_lazy_accept_the_same_files(tmp_path, text):
+    path = tmp_path / "pi_ontology.json"
+    path.write_text(text.format(first=json.dumps(FIRST), second=json.dumps(SECOND), a=json.dumps(SECOND[0]), b=json.dumps(SECOND[1])), encoding="utf-8")
+
+    def load(cls):
+        try:
+            onto = cls(path)
+        except OntologyError:
+            return "rejected"
+        return [onto.get_entries(d) for d in range(10)]
+
+    assert load(LazyPiOntology) == load(PiOntology)
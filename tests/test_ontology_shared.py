@@ -0,0 +1,100 @@
+# Ame-Artificielle/tests/test_ontology_shared.py
+
+import json
+import multiprocessing as mp
+
+import pytest
+
+from src.ontology import OntologyError, PiOntology
+from src.ontology_shared import SharedOntologySegment, SharedPiOntology
+
+
+@pytest.fixture()
+def onto(tmp_path):
+    entries = [
+        {"index": 0, "digit": 3, "analysis": {"Tradition pythagoricienne": "créativité", "Chinoise": "croissance"}},
+        {"index": 1, "digit": 1, "analysis": {"Tradition pythagoricienne": "unité"}},
+        {"index": 6, "digit": 2, "analysis": {"Note": "aucune information"}},
+        {"index": 9, "digit": 3, "analysis": {"Tradition pythagoricienne": "expression"}},
+    ]
+    path = tmp_path / "pi_ontology.json"
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+    o = PiOntology(path)
+    o.patch_digit(8, {"Note": "dualité"}, inverted=True)
+    return o
+
+
+def _api_snapshot(o):
+    out = {"digits": o.digits_present, "patched": o.patched_digits}
+    for d in range(10):
+        out[d] = (
+            dict(o.get_analysis(d)),
+            dict(o.get_analysis(d, merge_policy="concat")),
+            o.get_analysis(d, merged=False),
+            o.get_entries(d),
+            o.get_tradition_text(d, "tradition PYTHAGORICIENNE"),
+            o.summarize_digit(d, max_items=2),
+            o.is_digit_missing_or_incomplete(d),
+            dict(o.get_patch(d)),
+        )
+    return out
+
+
+def _child(name, queue):
+    shared = SharedPiOntology(name)
+    try:
+        queue.put(_api_snapshot(shared))
+    finally:
+        shared.close()
+
+
+def test_attached_view_matches_owner(onto):
+    with SharedOntologySegment(onto) as segment:
+        shared = SharedPiOntology(segment.name)
+        try:
+            assert _api_snapshot(shared) == _api_snapshot(onto)
+            assert shared.get_analysis(3) is shared.get_analysis(7, inverted=True)
+            with pytest.raises(OntologyError):
+                shared.patch_digit(2, {"Note": "x"})
+            with pytest.raises(TypeError):
+                shared.get_analysis(3)["Chinoise"] = "x"
+        finally:
+            shared.close()
+
+
+def test_attach_from_another_process(onto):
+    with SharedOntologySegment(onto) as segment:
+        queue = mp.get_context("spawn").Queue()
+        proc = mp.get_context("spawn").Process(target=_child, args=(segment.name, queue))
+        proc.start()
+        result = queue.get(timeout=30)
+        proc.join(timeout=30)
+        assert proc.exitcode == 0
+        assert result == _api_snapshot(onto)
+        # segment still usable after the worker exits
+        shared = SharedPiOntology(segment.name)
+        assert shared.digits_present == [1, 2, 3]
+        shared.close()
+
+
+def test_attached_view_has_every_pi_ontology_attribute(onto):
+    with SharedOntologySegment(onto) as segment:
+        shared = SharedPiOntology(segment.name)
+        try:
+            assert set(vars(onto)) <= set(vars(shared))
+            assert shared.view_cache_stats().size == 0
+        finally:
+            shared.close()
+
+
+def test_entries_are_decoded_once_per_digit(onto):
+    with SharedOntologySegment(onto) as segment:
+        shared = SharedPiOntology(segment.name)
+        try:
+            assert shared._by_digit == {} and shared.get_entries(5) == []
+            first = shared.get_entries(3)
+            assert list(shared._by_digit) == [3]
+            again = shared.get_entries(3)
+            assert again == first and all(a is b for a, b in zip(again, first))
+        finally:
+            shared.close()
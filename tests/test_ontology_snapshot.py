@@ -0,0 +1,69 @@
+# Ame-Artificielle/tests/test_ontology_snapshot.py
+
+import json
+
+import pytest
+
+from src.ontology import OntologyError, PiOntology
+from src.ontology_snapshot import compile_snapshot, load_snapshot, source_hash
+
+
+def _write_source(path, entries):
+    # Two concatenated arrays, like the real file, to exercise the lenient repair.
+    half = len(entries) // 2
+    path.write_text(json.dumps(entries[:half]) + "\n" + json.dumps(entries[half:]), encoding="utf-8")
+
+
+ENTRIES = [
+    {"index": 0, "digit": 3, "analysis": {"Tradition pythagoricienne": "créativité", "Note": "x"}},
+    {"index": 1, "digit": "1", "analysis": {"Tradition pythagoricienne": "unité"}},
+    {"index": 2, "digit": 4, "analysis": {"Numérologie chinoise": "stabilité", "Vide": None}},
+    {"index": 3, "digit": 1, "analysis": {"Tradition pythagoricienne": "commencement"}},
+    {"digit": 7},  # skipped: no analysis
+]
+
+
+def test_snapshot_roundtrip_matches_json_path(tmp_path):
+    src = tmp_path / "onto.json"
+    _write_source(src, ENTRIES)
+
+    plain = PiOntology(src)
+    snap = PiOntology(src, snapshot=True)
+    assert (tmp_path / "onto.json.snap").exists()
+
+    assert snap._entries == plain._entries
+    assert snap._by_digit == plain._by_digit
+    assert snap.digits_present == plain.digits_present == [1, 3, 4]
+    assert snap.get_analysis(1) == plain.get_analysis(1)
+
+
+def test_snapshot_is_rebuilt_when_source_changes(tmp_path):
+    src = tmp_path / "onto.json"
+    snap_path = tmp_path / "cache.snap"
+    _write_source(src, ENTRIES)
+    PiOntology(src, snapshot=snap_path)
+
+    changed = ENTRIES + [{"index": 9, "digit": 2, "analysis": {"Note": "ajout"}}]
+    _write_source(src, changed)
+    onto = PiOntology(src, snapshot=snap_path)
+    assert 2 in onto.digits_present
+
+    with pytest.raises(OntologyError):
+        load_snapshot(snap_path, expected_hash=b"\0" * 32)
+    entries, _ = load_snapshot(snap_path, expected_hash=source_hash(src))
+    assert len(entries) == 5
+
+
+def test_corrupt_snapshot_is_rejected_and_recompiled(tmp_path):
+    src = tmp_path / "onto.json"
+    _write_source(src, ENTRIES)
+    snap_path = compile_snapshot(src)
+
+    data = bytearray(snap_path.read_bytes())
+    data[-1] ^= 0xFF
+    snap_path.write_bytes(bytes(data))
+    with pytest.raises(OntologyError):
+        load_snapshot(snap_path)
+
+    assert PiOntology(src, snapshot=True).digits_present == [1, 3, 4]
+    load_snapshot(snap_path)  # valid again
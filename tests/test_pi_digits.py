@@ -0,0 +1,87 @@
+# Ame-Artificielle/tests/test_pi_digits.py
+
+import pytest
+
+from src.pi_digits import PiDigitStore, compute_pi_digits, import_digit_text, write_digit_store
+
+PI_100 = (
+    "31415926535897932384626433832795028841971693993751"
+    "05820974944592307816406286208998628034825342117067"
+)
+
+
+@pytest.fixture(scope="module")
+def digits():
+    return compute_pi_digits(20001)  # odd length: last byte is half padding
+
+
+@pytest.fixture()
+def store(tmp_path, digits):
+    src = tmp_path / "pi.txt"
+    src.write_text("3." + digits[1:], encoding="ascii")
+    assert import_digit_text(src, tmp_path / "pi.bin") == len(digits)
+    with PiDigitStore(tmp_path / "pi.bin") as s:
+        yield s
+
+
+def test_compute_pi_digits():
+    assert compute_pi_digits(100) == PI_100
+    assert compute_pi_digits(1) == "3"
+
+
+def test_random_access(store, digits):
+    assert len(store) == len(digits)
+    assert store[:] == digits
+    assert [store[i] for i in (0, 1, 2, 761, 762, -1)] == [int(digits[i]) for i in (0, 1, 2, 761, 762, -1)]
+    assert store[7:19] == digits[7:19] and store[8:20] == digits[8:20]
+    assert store[3:40:7] == digits[3:40:7]
+    with pytest.raises(IndexError):
+        store.digit_at(len(digits))
+    ctx = store.context(762, 3)  # Feynman point
+    assert (ctx.before, ctx.digit, ctx.after) == ("134", 9, "999")
+
+
+@pytest.mark.parametrize("k", [None, 1, 4])
+def test_find_matches_brute_force(store, digits, k):
+    if k is not None:
+        store.build_index(k)
+        assert store.has_index
+    for seq in ["3", "0", "14", "999999", "2718", "14159", "58209749", digits[-3:], digits[-6:]]:
+        expected = [i for i in range(len(digits)) if digits.startswith(seq, i)]
+        assert store.find(seq) == expected, seq
+    assert store.find("14", limit=2) == store.find("14")[:2]
+    with pytest.raises(ValueError):
+        store.find("3.14")
+
+
+def test_stale_index_is_ignored(tmp_path, store):
+    store.build_index(3)
+    write_digit_store(tmp_path / "pi.bin", ["31415"])
+    with PiDigitStore(tmp_path / "pi.bin") as small:
+        assert not small.has_index
+        assert small.find("1") == [1, 3]
+
+
+def test_index_of_other_digits_with_the_same_length_is_ignored(tmp_path, store, digits):
+    store.build_index(3)
+    changed = digits[:100] + str((int(digits[100]) + 1) % 10) + digits[101:]
+    write_digit_store(tmp_path / "pi.bin", [changed])
+    with PiDigitStore(tmp_path / "pi.bin") as other:
+        assert len(other) == len(store) and other.checksum != store.checksum
+        assert not other.has_index
+        other.build_index(3)
+        assert other.has_index and other.find(changed[98:103]) == other._scan(changed[98:103], None)
+
+
+def test_version_1_store_still_opens(tmp_path):
+    path = tmp_path / "pi.bin"
+    write_digit_store(path, [PI_100])
+    with PiDigitStore(path) as current:
+        checksum = current.checksum
+    raw = bytearray(path.read_bytes())
+    raw[8:16] = bytes([1, 0, 0, 0, 0, 0, 0, 0])  # v1 header: version 1, padding where the CRC now is
+    path.write_bytes(raw)
+    with PiDigitStore(path) as old:
+        assert old.checksum == checksum and old[:] == PI_100
+        old.build_index(2)
+        assert old.has_index and old.find("26") == [i for i in range(100) if PI_100.startswith("26", i)]
@@ -0,0 +1,77 @@
+# Ame-Artificielle/tests/test_pipeline.py
+
+import csv
+import json
+
+import pytest
+
+from src.numerology import NumerologyConfig, build_signature, invert_digit, reduce_signature
+from src.pipeline import iter_chunks, read_identities, run_file, run_pipeline
+
+
+ROWS = [
+    {"id": "a", "name": "Jean-François Tremblay", "dob": "1990-07-14"},
+    {"id": "b", "name": "Élise-Marie", "dob": "1990-13-45"},  # bad date
+    {"id": "c", "name": "ABC"},
+    {"id": "d", "dob": "1999/12/29"},
+    {"id": "e", "name": "", "dob": ""},  # nothing usable
+]
+
+
+def test_iter_chunks_numbers_rows():
+    chunks = list(iter_chunks(iter("abcde"), 2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert chunks[-1] == [(4, "e")]
+    with pytest.raises(ValueError):
+        list(iter_chunks([], 0))
+
+
+def test_run_pipeline_in_process_matches_scalar_and_isolates_bad_rows():
+    cfg = NumerologyConfig()
+    out = []
+    stats = run_pipeline(ROWS, out.extend, cfg=cfg, chunk_size=2, workers=0)
+
+    assert stats.rows == 5 and stats.errors == 2 and stats.chunks == 3
+    assert [r["row"] for r in out] == [0, 1, 2, 3, 4]
+
+    sig = build_signature(name=ROWS[0]["name"], dob=ROWS[0]["dob"], cfg=cfg)
+    core = reduce_signature(sig)["core_digit"]
+    assert out[0]["archetype"] == invert_digit(core)
+    assert out[0]["expression"] == sig["expression"]["pythagorean"]
+
+    assert out[1]["error"].startswith("ValueError")
+    assert "life_path" not in out[2] and "expression" not in out[3]
+    assert "error" in out[4]
+
+
+def test_non_str_name_is_an_error_row():
+    out = []
+    rows = [{"id": "x", "name": 123, "dob": "1990-01-01"}, ROWS[0]]
+    stats = run_pipeline(rows, out.extend, cfg=NumerologyConfig(), workers=0)
+    assert stats.errors == 1
+    assert out[0]["id"] == "x" and out[0]["error"].startswith("TypeError")
+    assert "archetype" in out[1]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_run_file_with_process_pool(tmp_path, ordered):
+    src = tmp_path / "ids.jsonl"
+    src.write_text("\n".join(json.dumps(r) for r in ROWS * 20) + "\nnot json\n", encoding="utf-8")
+    dst = tmp_path / "out.csv"
+
+    stats = run_file(src, dst, workers=2, chunk_size=7, max_in_flight=2, ordered=ordered)
+
+    with dst.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert stats.rows == len(rows) == 101
+    assert stats.errors == 41
+    if ordered:
+        assert [int(r["row"]) for r in rows] == list(range(101))
+    else:
+        assert sorted(int(r["row"]) for r in rows) == list(range(101))
+
+
+def test_read_identities_csv(tmp_path):
+    src = tmp_path / "ids.csv"
+    src.write_text("id,name,dob\n1,ABC,1990-07-14\n", encoding="utf-8")
+    assert list(read_identities(src)) == [{"id": "1", "name": "ABC", "dob": "1990-07-14"}]
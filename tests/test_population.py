@@ -0,0 +1,64 @@
+# Ame-Artificielle/tests/test_population.py
+
+import random
+from array import array
+
+import pytest
+
+from src.engine import SoulState
+from src.interpolation import stimulus_features, update_dynamics
+from src.ontology import digit_to_traits
+from src.population import SoulPopulation, update_dynamics_batch
+
+STIMULI = [
+    "Pourquoi penses-tu cela ?",
+    "Danger ! Cours maintenant !",
+    "Bonjour.",
+    "Comment comprendre la peur ?",
+    "URGENT!!! attaque",
+]
+
+
+def _states(rng, m):
+    states = []
+    for _ in range(m):
+        digit = rng.randrange(10)
+        traits = dict(digit_to_traits(digit))
+        traits["emotional_stability"] = rng.choice([-2.0, -0.5, 0.0, 1.0, 2.0])
+        states.append(SoulState(trait_vector=traits, digit_archetype=digit, axis_position=rng.randint(1, 9)))
+    return states
+
+
+def test_batch_matches_scalar_path_exactly():
+    rng = random.Random(42)
+    states = _states(rng, 300)
+    pop = SoulPopulation.from_states(states)
+
+    for _ in range(5):
+        stimuli = [rng.choice(STIMULI) for _ in states]
+        features = [stimulus_features(s) for s in stimuli]
+        # a few exact half-way cases for the rounding rule
+        features[:3] = [(0.125, 1.0), (-0.125, 1.0), (1.0, 0.0)]
+        update_dynamics_batch(pop, array("d", (f[0] for f in features)), array("d", (f[1] for f in features)))
+        for st, stimulus, (pull, intensity) in zip(states, stimuli, features):
+            axis, mood, _ = update_dynamics(axis_position=st.axis_position, trait_vector=st.trait_vector,
+                                            stimulus=stimulus, context={"pull": pull, "intensity": intensity})
+            st.axis_position, st.mood = axis, mood
+
+        assert [(s.axis_position, s.mood) for s in pop.to_states()] == [(s.axis_position, s.mood) for s in states]
+
+
+def test_round_trip_and_construction():
+    rng = random.Random(1)
+    states = _states(rng, 20)
+    states[0].mood = 6
+    back = SoulPopulation.from_states(states).to_states()
+    for a, b in zip(states, back):
+        assert (a.digit_archetype, a.axis_position, a.mood) == (b.digit_archetype, b.axis_position, b.mood)
+        assert a.trait_vector == b.trait_vector
+
+    pop = SoulPopulation.from_digits([9, 0, 3], axis=4)
+    assert pop.state(0).trait_vector == dict(digit_to_traits(9))
+    assert list(pop.axis) == [4, 4, 4] and pop.state(1).mood is None
+    with pytest.raises(ValueError):
+        update_dynamics_batch(pop, [0.0], [1.0])
@@ -0,0 +1,60 @@
+# Ame-Artificielle/tests/test_profile_cache.py
+
+import copy
+
+import pytest
+
+from src.engine import ArtificialSoulEngine, EngineConfig
+from src.profile_cache import PROFILE_CACHE_SIZE, ProfileCache, identity_key
+
+ADA = {"name": "Élise-Marie Tremblay", "dob": "1990-07-14"}
+
+
+def test_identity_key_is_canonical():
+    key = identity_key(ADA, inversion_enabled=True)
+    assert identity_key({"name_full": "ELISE MARIE tremblay", "birthdate": "1990/07/14"}, inversion_enabled=True) == key
+    assert identity_key(ADA, inversion_enabled=False) != key
+    assert identity_key({"name": "", "dob": "1990-07-14"}, inversion_enabled=True) != identity_key(
+        {"dob": "1990-07-14"}, inversion_enabled=True
+    )
+    with pytest.raises(ValueError):
+        identity_key({"dob": "1990-13-45"}, inversion_enabled=True)
+
+
+def test_cached_states_share_the_profile_and_match_uncached():
+    engine = ArtificialSoulEngine(config=EngineConfig(profile_cache_size=PROFILE_CACHE_SIZE))
+    plain = ArtificialSoulEngine()
+    a = engine.build_state_from_identity(identity=ADA)
+    b = engine.build_state_from_identity(identity={"name": "elise marie TREMBLAY", "dob": "1990/07/14"})
+
+    assert a.trait_vector is b.trait_vector
+    assert a.last_trace["signature"] is b.last_trace["signature"]
+    assert a == plain.build_state_from_identity(identity=ADA) and plain.profiles is None
+    stats = engine.profiles.stats()
+    assert (stats.hits, stats.misses, stats.size, stats.hit_rate) == (1, 1, 1, 0.5)
+
+    with pytest.raises(TypeError):
+        a.last_trace["signature"]["life_path"]["total"] = 0
+    clone = copy.deepcopy(a)
+    assert clone == a and clone.last_trace["signature"] is a.last_trace["signature"]
+
+
+def test_lru_bound_and_persistence(tmp_path):
+    path = tmp_path / "profiles.json"
+    cache = ProfileCache(2, path=path)
+    engine = ArtificialSoulEngine(profile_cache=cache)
+    for name in ("Ana", "Bob", "Cyd", "Bob"):
+        engine.build_state_from_identity(identity={"name": name})
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+    cache.save()
+
+    warm = ProfileCache(8, path=path)
+    assert len(warm) == 2
+    state = ArtificialSoulEngine(profile_cache=warm).build_state_from_identity(identity={"name": "bob"})
+    assert warm.stats().hits == 1
+    assert state == ArtificialSoulEngine().build_state_from_identity(identity={"name": "bob"})
+
+    warm.clear()
+    stats = warm.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (0, 0, 0, 0)
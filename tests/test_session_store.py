@@ -0,0 +1,81 @@
+# Ame-Artificielle/tests/test_session_store.py
+
+import pytest
+
+from src.engine import ArtificialSoulEngine, CompactSoulState, EngineConfig, SoulState
+from src.ontology import digit_to_traits
+from src.session_store import SessionStore, decode_state, encode_state
+
+
+def _engine():
+    return ArtificialSoulEngine(config=EngineConfig(memory_max_turns=4))
+
+
+def _session(engine, i, *, compact=True, turns=3):
+    state = engine.build_state_from_identity(identity={"name": f"Client {i}", "dob": "1990-07-14"}, compact=compact)
+    for t in range(turns):
+        engine.react(state=state, stimulus=f"Pourquoi {i}.{t} ?")
+    return state
+
+
+def test_encode_decode_round_trips_both_state_kinds():
+    engine = _engine()
+    plain = _session(engine, 1, compact=False)
+    plain.trait_vector = {"joy": 1.5, "focus": -2.0}
+    back = decode_state(encode_state(plain))
+    assert isinstance(back, SoulState) and back == plain
+
+    compact = _session(engine, 2)
+    back = decode_state(encode_state(compact))
+    assert isinstance(back, CompactSoulState) and back == compact
+    assert back.trait_vector is digit_to_traits(compact.digit_archetype)
+
+    quiet = CompactSoulState(digit_to_traits(3), 3, 7, 4, [{"stimulus": "é", "response": "ü"}], keep_trace=False)
+    assert decode_state(encode_state(quiet)) == quiet
+    assert len(encode_state(quiet)) < 40
+
+    fresh = CompactSoulState(digit_to_traits(3), 3, 5)  # keep_trace, nothing traced yet
+    back = decode_state(encode_state(fresh))
+    assert back == fresh and back.keep_trace
+    engine.react(state=back, stimulus="Bonjour")
+    assert back.last_trace["axis_position"] == back.axis_position
+
+
+def test_lru_spills_and_reloads_transparently(tmp_path):
+    engine = _engine()
+    states = {f"s{i}": _session(engine, i) for i in range(6)}
+    with SessionStore(tmp_path / "s.sqlite", max_sessions=3, flush_every=2) as store:
+        for sid, st in states.items():
+            store.put(sid, st)
+        assert store.stats().hot == 3 and store.stats().spills == 3
+
+        assert store.get("s5") is states["s5"]
+        reloaded = store.get("s0")  # spilled: pending or already on disk
+        assert reloaded == states["s0"] and reloaded is not states["s0"]
+        assert store.get("nope") is None and "nope" not in store
+        assert store.touch("s1") and not store.touch("nope") and store.touch("s5")
+
+        engine.react(state=reloaded, stimulus="Cours !")
+        store.flush()
+        stats = store.stats()
+        assert (stats.gets, stats.hits, stats.reloads, stats.misses) == (6, 2, 2, 2)  # touch() counts as a get
+        assert stats.hit_rate == pytest.approx(2 / 6) and stats.pending == 0 and stats.reload_p99_ms > 0
+
+    with SessionStore(tmp_path / "s.sqlite", max_sessions=10) as store:
+        assert store.get("s0") == reloaded  # close() persisted the hot set too
+        assert all(store.get(sid) is not None for sid in states)
+
+
+def test_byte_budget_and_delete(tmp_path):
+    engine = _engine()
+    with SessionStore(tmp_path / "s.sqlite", max_sessions=None, max_bytes=3_000) as store:
+        for i in range(5):
+            store.put(f"s{i}", _session(engine, i))
+        stats = store.stats()
+        assert stats.hot_bytes <= 3_000 and stats.hot < 5 and stats.spills == 5 - stats.hot
+
+        store.delete("s0")  # spilled
+        store.delete("s4")  # hot
+        assert "s0" not in store and "s4" not in store and "s1" in store
+        store.flush()
+        assert store.get("s0") is None and store.get("s4") is None
@@ -0,0 +1,56 @@
+# Ame-Artificielle/tests/test_templates.py
+
+from src.interpolation import axis_descriptor, shape_text
+from src.ontology import digit_to_traits
+from src.templates import compose, dominant_traits, slider_bucket, summarize_traits, template_for
+
+
+def _reference(*, trait_vector, axis_position, mood, stimulus, tone, humor, complexity):
+    """The composer before templates were compiled."""
+    top = sorted(trait_vector.items(), key=lambda kv: abs(kv[1]), reverse=True)[:5]
+    traits_str = ", ".join([f"{k}:{v:+.2f}" for k, v in top]) if top else "none"
+    prefix = "Réponse" if tone >= 0.5 else "Note"
+    if humor >= 0.66:
+        prefix += " (léger)"
+    detail = ""
+    if complexity >= 0.66:
+        detail = (
+            f"\n\nContexte interne: axis={axis_position} ({axis_descriptor(axis_position)}),"
+            f" mood={mood}, traits=[{traits_str}]"
+        )
+    return f"{prefix}: {shape_text(stimulus=stimulus, axis_position=axis_position)}{detail}"
+
+
+def test_compose_matches_reference_for_every_bucket_and_axis():
+    traits = digit_to_traits(7)
+    for tone in (0.2, 0.5):
+        for humor in (0.1, 0.66):
+            for complexity in (0.3, 0.66):
+                for axis in (*range(1, 10), 0, 12, 4.5):
+                    for mood, stimulus in ((None, "  Bonjour {x} "), (-1, "a}b{")):
+                        kw = dict(
+                            trait_vector=traits, axis_position=axis, mood=mood, stimulus=stimulus,
+                            tone=tone, humor=humor, complexity=complexity,
+                        )
+                        assert compose(**kw) == _reference(**kw)
+    assert compose(trait_vector={}, axis_position=5, mood=0, stimulus="x", tone=1, humor=0, complexity=1).endswith(
+        "traits=[none]"
+    )
+
+
+def test_templates_are_precompiled_per_bucket():
+    assert slider_bucket(0.5, 0.66, 0.66) == 7 and slider_bucket(0.49, 0.65, 0.65) == 0
+    assert template_for(0.9, 0.0, 0.0, 3) is template_for(0.6, 0.1, 0.2, 3)
+    assert template_for(0.9, 0.0, 0.0, 3) is not template_for(0.9, 0.0, 0.0, 4)
+    assert "axis=5.0" in template_for(0, 0, 1, 5.0)[0](stimulus="", mood=None, traits="")
+
+
+def test_dominant_traits_cache_follows_trait_changes():
+    shared = digit_to_traits(3)
+    assert dominant_traits(shared) is dominant_traits(shared)
+    assert dominant_traits(shared) == summarize_traits(shared)
+
+    traits = {"a": 0.1, "b": -0.9, "c": 0.5}
+    assert dominant_traits(traits) == "b:-0.90, c:+0.50, a:+0.10"
+    traits["a"] = 2.0
+    assert dominant_traits(traits) == "a:+2.00, b:-0.90, c:+0.50"
@@ -0,0 +1,89 @@
+# Ame-Artificielle/tests/test_tracing.py
+
+import json
+
+import pytest
+
+from src.engine import ArtificialSoulEngine, CompactSoulState, EngineConfig, SoulState
+from src.ontology import digit_to_traits
+from src.tracing import JsonlTraceSink, RingTraceSink, TraceSink
+
+STIMULI = ["Pourquoi ?", "Cours !", "Bonjour.", "Danger ! Vite !"]
+
+
+def _state():
+    return SoulState(trait_vector=dict(digit_to_traits(6)), digit_archetype=6)
+
+
+def _run(level, sink=None, every=1000):
+    engine = ArtificialSoulEngine(config=EngineConfig(trace_level=level, trace_sample_every=every), trace_sink=sink)
+    state = _state()
+    return engine, state, [engine.react(state=state, stimulus=s) for s in STIMULI]
+
+
+def test_levels_change_only_the_trace():
+    _, full_state, full = _run("full")
+    _, sum_state, summary = _run("summary")
+    _, off_state, off = _run("off")
+
+    for f, s, o in zip(full, summary, off):
+        assert f["text"] == s["text"] == o["text"] and f["axis_position"] == o["axis_position"]
+        assert s["trace"] == {k: f["trace"][k] for k in ("axis_position_before", "axis_position_after", "mood")}
+        assert o["trace"] is None
+    assert full[1]["trace"]["axis_position_before"] == full[0]["axis_position"]
+    assert full[-1]["trace"]["dynamics"]["pull"] > 0
+
+    assert full_state.memory == off_state.memory and off_state.last_trace == {}
+    assert sum_state.last_trace["react_trace"] == summary[-1]["trace"]
+
+    with pytest.raises(ValueError):
+        ArtificialSoulEngine(config=EngineConfig(trace_level="verbose"))
+
+
+def test_sampled_full_traces_reach_the_sink_at_any_level():
+    sink = RingTraceSink(capacity=2)
+    _, _, off = _run("off", sink, every=2)
+    _, _, full = _run("full")
+    assert sink.emitted == 2 and len(sink) == 2
+    first, second = sink.records()
+    expected = dict(full[1]["trace"], axis_position_before=None)  # "off" keeps no last_trace
+    assert {k: first[k] for k in expected} == expected
+    assert second["stimulus"] == STIMULI[3] and second["ethics"] == off[3]["ethics"]
+
+
+def test_jsonl_sink_batches_writes(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    with JsonlTraceSink(path, flush_every=3) as sink:
+        _run("summary", sink, every=1)
+        assert sink.written == 3 and len(path.read_text().splitlines()) == 3
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["stimulus"] for r in lines] == STIMULI
+    assert TraceSink().emit({}) is None
+
+
+def test_untraced_compact_state_keeps_no_trace():
+    engine = ArtificialSoulEngine()
+    state = CompactSoulState(digit_to_traits(2), 2, keep_trace=False)
+    out = engine.react(state=state, stimulus="Cours !")
+    assert out["trace"]["axis_position_after"] == state.axis_position and state.last_trace == {}
+
+
+@pytest.mark.parametrize("level", ["full", "off"])
+def test_react_many_samples_like_sequential_react(level):
+    def run(batch):
+        sink = RingTraceSink()
+        engine = ArtificialSoulEngine(config=EngineConfig(trace_level=level, trace_sample_every=2), trace_sink=sink)
+        a, b, c = (SoulState(trait_vector=dict(digit_to_traits(d)), digit_archetype=d) for d in (1, 4, 7))
+        # A1, B1, A2, C1 (+ a failing request, which is not counted): A2 runs in a later wave than C1
+        requests = [(a, STIMULI[0]), (b, STIMULI[1]), (a, STIMULI[2]), ("not a state", "?"), (c, STIMULI[3]), (b, STIMULI[0])]
+        if batch:
+            engine.react_many(requests)
+        else:
+            for state, stimulus in requests:
+                if isinstance(state, SoulState):
+                    engine.react(state=state, stimulus=stimulus)
+        return sink.records()
+
+    records = run(batch=True)
+    assert [r["stimulus"] for r in records] == [STIMULI[1], STIMULI[3]]
+    assert records == run(batch=False)
@@ -0,0 +1,64 @@
+# Ame-Artificielle/tests/test_traits.py
+
+import copy
+import pickle
+from array import array
+
+import pytest
+
+from src import ontology
+from src.engine import ArtificialSoulEngine
+from src.traits import DEFAULT_TRAITS, TraitProjection, TraitSchema, load_traits_schema, parse_traits_schema
+
+
+def test_schema_comes_from_the_doc():
+    schema, weights = load_traits_schema()
+    assert schema.names == DEFAULT_TRAITS
+    assert set(weights) == set(range(10))
+
+
+def test_doc_weight_tables_override_baseline(tmp_path):
+    doc = tmp_path / "traits_schema.md"
+    doc.write_text(
+        "## 2) Liste\n\n### Exemple de set minimal\n- `joy`, `fear`\n\n---\n\n"
+        "## 4) Profils\n\n### 7 — Expression\n| trait_id | weight |\n|---|---:|\n| joy | +2 |\n| fear | -0.5 |\n",
+        encoding="utf-8",
+    )
+    names, overrides = parse_traits_schema(doc.read_text(encoding="utf-8"))
+    assert names == ("joy", "fear")
+    assert overrides == {7: {"joy": 2.0, "fear": -0.5}}
+
+    proj = TraitProjection(TraitSchema(names), overrides)
+    assert dict(proj.vector(7)) == {"joy": 2.0, "fear": -0.5}
+    assert dict(proj.vector(0)) == {"joy": 0.0, "fear": 0.0}
+    with pytest.raises(ValueError):
+        TraitProjection(TraitSchema(names), {1: {"curiosity": 1.0}})
+
+
+def test_vectors_are_shared_and_read_only():
+    v = ontology.digit_to_traits(9)
+    assert v is ontology.digit_to_traits(9)
+    assert v["leadership"] == 2.0 and v.get("unknown") is None
+    with pytest.raises(TypeError):
+        v.data[0] = 1.0
+    with pytest.raises(ValueError):
+        ontology.digit_to_traits(10)
+    assert copy.deepcopy(v) is v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+
+def test_batch_projection_matches_rows():
+    digits = array("b", [9, 0, 3, 3, 8])
+    out = ontology.digits_to_traits(digits)
+    n = len(ontology.default_projection().schema)
+    assert len(out) == len(digits) * n
+    for i, d in enumerate(digits):
+        assert out[i * n:(i + 1) * n].tolist() == ontology.default_projection().row(d).tolist()
+    assert len(ontology.digits_to_traits(iter([]))) == 0
+    with pytest.raises(ValueError):
+        ontology.digits_to_traits([1, -1])
+
+
+def test_engine_builds_state_with_projected_traits():
+    state = ArtificialSoulEngine().build_state_from_identity(identity={"name": "Ada Lovelace", "dob": "1815-12-10"})
+    assert state.trait_vector is ontology.digit_to_traits(state.digit_archetype)